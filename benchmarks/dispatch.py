@@ -0,0 +1,116 @@
+"""Per-request cost of dispatching into a controller method.
+
+Compares the former dispatch, which resolved the controller through the
+container and looked the bound method up on every request, with the
+endpoints generated by `RegisterRoutesPostProcessor`. Endpoints are
+awaited directly so only the dispatch itself is measured, and the best of
+several rounds is reported to keep scheduler noise out of the ratio.
+
+Context-scoped controllers must be resolved per request, so their
+dispatch does the same work as the former one. The ratio for them
+should stay around 1.00x.
+
+Run with `python -m benchmarks.dispatch`.
+"""
+
+import asyncio
+from time import perf_counter_ns
+from typing import Any, Awaitable, Callable
+
+from fastapi import FastAPI
+from fastapi.routing import APIRoute
+from spakky.application.application import SpakkyApplication
+from spakky.application.application_context import ApplicationContext
+from spakky.pod.annotations.pod import Pod
+from spakky.pod.interfaces.container import IContainer
+
+from spakky_fastapi.main import initialize
+from spakky_fastapi.routes import get
+from spakky_fastapi.stereotypes.api_controller import ApiController
+
+ITERATIONS: int = 200_000
+ROUNDS: int = 5
+
+
+@ApiController("/singleton")
+class SingletonController:
+    @get("")
+    async def hello(self) -> str:
+        return "Hello World!"
+
+
+@ApiController("/context", scope=Pod.Scope.CONTEXT)
+class ContextController:
+    @get("")
+    async def hello(self) -> str:
+        return "Hello World!"
+
+
+@Pod(name="api")
+def get_api() -> FastAPI:
+    return FastAPI()
+
+
+def legacy_endpoint(
+    container: IContainer,
+    controller_type: type[object],
+    method_name: str,
+) -> Callable[..., Awaitable[Any]]:
+    async def endpoint(*args: Any, **kwargs: Any) -> Any:
+        controller_instance = container.get(controller_type)
+        method_to_call = getattr(controller_instance, method_name)
+        return await method_to_call(*args, **kwargs)
+
+    return endpoint
+
+
+async def measure(endpoint: Callable[..., Awaitable[Any]]) -> float:
+    for _ in range(ITERATIONS // 10):
+        await endpoint()
+    best: float = float("inf")
+    for _ in range(ROUNDS):
+        started: int = perf_counter_ns()
+        for _ in range(ITERATIONS // ROUNDS):
+            await endpoint()
+        best = min(best, (perf_counter_ns() - started) / (ITERATIONS // ROUNDS))
+    return best
+
+
+async def run(application: SpakkyApplication) -> None:
+    api: FastAPI = application.container.get(FastAPI)
+    endpoints: dict[str, Callable[..., Awaitable[Any]]] = {
+        route.path: route.endpoint
+        for route in api.routes
+        if isinstance(route, APIRoute)
+    }
+    for path, controller_type in (
+        ("/singleton", SingletonController),
+        ("/context", ContextController),
+    ):
+        legacy = await measure(
+            legacy_endpoint(application.container, controller_type, "hello")
+        )
+        current = await measure(endpoints[path])
+        print(
+            f"{path:>12}: legacy {legacy:8.1f} ns/call, "
+            f"current {current:8.1f} ns/call ({legacy / current:.2f}x)"
+        )
+
+
+def main() -> None:
+    application = (
+        SpakkyApplication(ApplicationContext())
+        .add(SingletonController)
+        .add(ContextController)
+        .add(get_api)
+    )
+    initialize(application)
+    application.start()
+    try:
+        asyncio.run(run(application))
+    finally:
+        application.stop()
+
+
+if __name__ == "__main__":
+    main()
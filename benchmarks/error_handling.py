@@ -0,0 +1,109 @@
+"""Per-request overhead of `ErrorHandlingMiddleware`.
+
+Compares the pure ASGI implementation against the former
+`BaseHTTPMiddleware` based one by driving a bare FastAPI application
+with raw ASGI calls, so that no client or transport cost is measured.
+
+Run with `python -m benchmarks.error_handling`.
+"""
+
+import asyncio
+from time import perf_counter_ns
+from traceback import print_exc
+from typing import Awaitable, Callable
+
+from fastapi import FastAPI, Request
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.responses import Response
+from starlette.types import ASGIApp, Message
+
+from spakky_fastapi.error import AbstractSpakkyFastAPIError, InternalServerError
+from spakky_fastapi.middlewares.error_handling import ErrorHandlingMiddleware
+
+ITERATIONS: int = 20_000
+WARMUP: int = 1_000
+
+
+class LegacyErrorHandlingMiddleware(BaseHTTPMiddleware):
+    def __init__(self, app: ASGIApp, debug: bool = False) -> None:
+        super().__init__(app)
+        self.debug = debug
+
+    async def dispatch(
+        self,
+        request: Request,
+        call_next: Callable[[Request], Awaitable[Response]],
+    ) -> Response:
+        try:
+            return await call_next(request)
+        except AbstractSpakkyFastAPIError as e:
+            return e.to_response()
+        except Exception:
+            if self.debug:
+                print_exc()
+            return InternalServerError().to_response(self.debug)
+
+
+def create_app(middleware: type | None) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/")
+    async def index() -> dict[str, str]:
+        return {"message": "Hello World!"}
+
+    if middleware is not None:
+        app.add_middleware(middleware)
+    return app
+
+
+async def measure(app: FastAPI, iterations: int) -> float:
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/",
+        "raw_path": b"/",
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"localhost")],
+        "client": ("127.0.0.1", 12345),
+        "server": ("localhost", 80),
+    }
+
+    async def receive() -> Message:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: Message) -> None:
+        pass
+
+    started: int = perf_counter_ns()
+    for _ in range(iterations):
+        await app(dict(scope), receive, send)
+    return (perf_counter_ns() - started) / iterations / 1000
+
+
+async def run() -> None:
+    candidates: dict[str, type | None] = {
+        "no middleware": None,
+        "BaseHTTPMiddleware": LegacyErrorHandlingMiddleware,
+        "pure ASGI": ErrorHandlingMiddleware,
+    }
+    results: dict[str, float] = {}
+    for label, middleware in candidates.items():
+        app = create_app(middleware)
+        await measure(app, WARMUP)
+        results[label] = await measure(app, ITERATIONS)
+
+    baseline: float = results["no middleware"]
+    for label, elapsed in results.items():
+        print(f"{label:>20}: {elapsed:8.2f} us/request (+{elapsed - baseline:.2f} us)")
+
+
+def main() -> None:
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
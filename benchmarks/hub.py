@@ -0,0 +1,66 @@
+"""Fan-out cost of `WebSocketHub.broadcast`.
+
+Subscribes N in-memory sockets to one topic and measures how long a
+broadcast takes to enqueue, and how long the per-connection senders take
+to drain it, on a single event loop.
+
+Run with `python -m benchmarks.hub`.
+"""
+
+import asyncio
+from time import perf_counter_ns
+
+from starlette.types import Message
+
+from spakky_fastapi.hub import HubConnection, WebSocketHub
+
+CONNECTIONS: int = 50_000
+BROADCASTS: int = 20
+
+
+class NullSocket:
+    received: int
+
+    def __init__(self) -> None:
+        self.received = 0
+
+    async def send(self, message: Message) -> None:
+        self.received += 1
+
+
+async def run() -> None:
+    hub = WebSocketHub()
+    sockets: list[NullSocket] = [NullSocket() for _ in range(CONNECTIONS)]
+    connections: list[HubConnection] = []
+    for socket in sockets:
+        connection = await hub.connect(socket).__aenter__()  # type: ignore
+        connection.subscribe("topic")
+        connections.append(connection)
+    await asyncio.sleep(0)
+
+    payload: dict[str, object] = {"event": "tick", "values": list(range(50))}
+    enqueue: int = 0
+    drain: int = 0
+    for i in range(1, BROADCASTS + 1):
+        started: int = perf_counter_ns()
+        hub.broadcast("topic", payload)
+        enqueued: int = perf_counter_ns()
+        while sockets[-1].received < i:
+            await asyncio.sleep(0)
+        enqueue += enqueued - started
+        drain += perf_counter_ns() - enqueued
+    assert all(socket.received == BROADCASTS for socket in sockets)
+    print(
+        f"{CONNECTIONS} sockets: enqueue {enqueue / BROADCASTS / 1e6:7.2f} ms, "
+        f"drain {drain / BROADCASTS / 1e6:7.2f} ms per broadcast"
+    )
+    for connection in connections:
+        await connection.__aexit__(None, None, None)
+
+
+def main() -> None:
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
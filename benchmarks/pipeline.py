@@ -0,0 +1,352 @@
+"""Throughput and latency of the whole request pipeline.
+
+Serves the controllers in `tests.apps` the same way the `app` test fixture
+does, then measures requests/sec, p50 and p99 for each `DummyController`
+route type, both through raw ASGI calls and through httpx's ASGI transport,
+with and without the built-in middlewares. Startup time is measured for
+applications with N generated controllers.
+
+Results can be written as JSON and compared against a saved baseline, in
+which case the run fails when any gated metric regresses by more than the
+threshold. p99 is reported but not gated, since the tail of an in-process
+run is dominated by GC pauses.
+
+Run with `python -m benchmarks.pipeline [--output FILE] [--baseline FILE]`.
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from dataclasses import dataclass
+from time import perf_counter_ns
+from typing import Any, Awaitable, Callable
+
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from pydantic import BaseModel
+from spakky.application.application import SpakkyApplication
+from spakky.application.application_context import ApplicationContext
+from spakky.pod.annotations.pod import Pod
+from spakky.security.key import Key
+from starlette.types import Message
+
+from spakky_fastapi.main import initialize
+from spakky_fastapi.routes import get, post
+from spakky_fastapi.settings import SpakkyFastAPISettings
+from spakky_fastapi.stereotypes.api_controller import ApiController
+from tests import apps
+
+ITERATIONS: int = 2_000
+WARMUP: int = 100
+CONTROLLERS: tuple[int, ...] = (10, 100)
+THRESHOLD: float = 0.2
+# Metrics where a higher value is better; everything else gated is lower-better.
+HIGHER_IS_BETTER: frozenset[str] = frozenset({"requests_per_second"})
+GATED_METRICS: frozenset[str] = frozenset({"requests_per_second", "p50_ms", "seconds"})
+DUMMY: bytes = b'{"name": "John", "age": 30}'
+
+
+@dataclass(frozen=True)
+class Case:
+    method: str
+    path: str
+    query: str = ""
+    body: bytes = b""
+    # Errors escape to the server when the error handling middleware is absent.
+    requires_middlewares: bool = False
+
+
+CASES: tuple[Case, ...] = (
+    Case("GET", "/dummy"),
+    Case("GET", "/dummy/file/dummy.txt"),
+    Case("POST", "/dummy", body=DUMMY),
+    Case("PUT", "/dummy", body=DUMMY),
+    Case("PATCH", "/dummy", body=DUMMY),
+    Case("DELETE", "/dummy/00000000-0000-4000-8000-000000000000"),
+    Case("HEAD", "/dummy"),
+    Case("OPTIONS", "/dummy"),
+    Case("GET", "/dummy/login", query="username=john"),
+    Case(
+        "GET", "/dummy/verify-email", query="email=invalid", requires_middlewares=True
+    ),
+    Case("GET", "/dummy/error", requires_middlewares=True),
+)
+
+
+def create_application(middlewares: bool) -> SpakkyApplication:
+    @Pod(name="key")
+    def get_key() -> Key:
+        return Key(size=32)
+
+    @Pod(name="settings")
+    def get_settings() -> SpakkyFastAPISettings:
+        return SpakkyFastAPISettings()
+
+    @Pod(name="api")
+    def get_api() -> FastAPI:
+        return FastAPI()
+
+    application = (
+        SpakkyApplication(ApplicationContext())
+        .scan(apps)
+        .add(get_key)
+        .add(get_settings)
+        .add(get_api)
+    )
+    initialize(application)
+    application.start()
+    if not middlewares:
+        # The middleware stack is built on the first call, so dropping the
+        # registered middlewares beforehand serves the bare router.
+        application.container.get(FastAPI).user_middleware.clear()
+    return application
+
+
+def summarize(latencies: list[int], elapsed: int) -> dict[str, float]:
+    latencies.sort()
+
+    def percentile(q: float) -> float:
+        return latencies[min(len(latencies) - 1, int(len(latencies) * q))] / 1e6
+
+    return {
+        "requests_per_second": len(latencies) / (elapsed / 1e9),
+        "p50_ms": percentile(0.50),
+        "p99_ms": percentile(0.99),
+    }
+
+
+async def measure(
+    request: Callable[[], Awaitable[Any]],
+    iterations: int,
+) -> dict[str, float]:
+    for _ in range(WARMUP):
+        await request()
+    latencies: list[int] = []
+    started: int = perf_counter_ns()
+    for _ in range(iterations):
+        request_started: int = perf_counter_ns()
+        await request()
+        latencies.append(perf_counter_ns() - request_started)
+    return summarize(latencies, perf_counter_ns() - started)
+
+
+def raw_http(app: FastAPI, case: Case) -> Callable[[], Awaitable[None]]:
+    scope: dict[str, Any] = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": case.method,
+        "scheme": "http",
+        "path": case.path,
+        "raw_path": case.path.encode(),
+        "root_path": "",
+        "query_string": case.query.encode(),
+        "headers": [
+            (b"host", b"localhost"),
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(case.body)).encode()),
+        ],
+        "client": ("127.0.0.1", 12345),
+        "server": ("localhost", 80),
+    }
+
+    async def send(message: Message) -> None:
+        pass
+
+    async def request() -> None:
+        received: bool = False
+
+        async def receive() -> Message:
+            nonlocal received
+            if not received:
+                received = True
+                return {"type": "http.request", "body": case.body, "more_body": False}
+            # Streaming responses listen for a disconnect until they finish.
+            await asyncio.Event().wait()
+            return {"type": "http.disconnect"}
+
+        await app(dict(scope), receive, send)
+
+    return request
+
+
+def raw_websocket(app: FastAPI) -> Callable[[], Awaitable[None]]:
+    scope: dict[str, Any] = {
+        "type": "websocket",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "scheme": "ws",
+        "path": "/dummy/ws",
+        "raw_path": b"/dummy/ws",
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"localhost")],
+        "client": ("127.0.0.1", 12345),
+        "server": ("localhost", 80),
+        "subprotocols": [],
+    }
+
+    async def send(message: Message) -> None:
+        pass
+
+    async def request() -> None:
+        messages: list[Message] = [
+            {"type": "websocket.connect"},
+            {"type": "websocket.receive", "text": "Hello World!"},
+        ]
+
+        async def receive() -> Message:
+            if messages:
+                return messages.pop(0)
+            await asyncio.Event().wait()
+            return {"type": "websocket.disconnect"}
+
+        await app(dict(scope), receive, send)
+
+    return request
+
+
+def httpx_http(client: AsyncClient, case: Case) -> Callable[[], Awaitable[Any]]:
+    async def request() -> Any:
+        return await client.request(
+            case.method,
+            case.path,
+            params=case.query,
+            content=case.body or None,
+            headers={"content-type": "application/json"},
+        )
+
+    return request
+
+
+async def run_pipeline(iterations: int) -> dict[str, dict[str, float]]:
+    results: dict[str, dict[str, float]] = {}
+    for middlewares in (True, False):
+        variant: str = "middlewares" if middlewares else "bare"
+        application = create_application(middlewares)
+        app: FastAPI = application.container.get(FastAPI)
+        try:
+            async with AsyncClient(
+                transport=ASGITransport(app=app, raise_app_exceptions=False),
+                base_url="http://localhost",
+            ) as client:
+                for case in CASES:
+                    if case.requires_middlewares and not middlewares:
+                        continue
+                    for transport, request in (
+                        ("raw", raw_http(app, case)),
+                        ("httpx", httpx_http(client, case)),
+                    ):
+                        name = f"{transport}/{variant}/{case.method} {case.path}"
+                        results[name] = await measure(request, iterations)
+                        report(name, results[name])
+            name = f"raw/{variant}/WEBSOCKET /dummy/ws"
+            results[name] = await measure(raw_websocket(app), iterations)
+            report(name, results[name])
+        finally:
+            application.stop()
+    return results
+
+
+class Item(BaseModel):
+    id: int
+    name: str
+
+
+def create_controller(index: int) -> type[object]:
+    async def get_item(self: object, id: int) -> Item:
+        return Item(id=id, name=f"item-{index}")
+
+    async def post_item(self: object, item: Item) -> Item:
+        return item
+
+    return ApiController(f"/generated-{index}")(
+        type(
+            f"GeneratedController{index}",
+            (),
+            {
+                "get_item": get("/{id}")(get_item),
+                "post_item": post("")(post_item),
+            },
+        )
+    )
+
+
+def run_startup(controllers: int) -> dict[str, float]:
+    @Pod(name="api")
+    def get_api() -> FastAPI:
+        return FastAPI()
+
+    application = SpakkyApplication(ApplicationContext()).add(get_api)
+    for index in range(controllers):
+        application.add(create_controller(index))
+    initialize(application)
+    started: int = perf_counter_ns()
+    application.start()
+    elapsed: int = perf_counter_ns() - started
+    application.stop()
+    return {"seconds": elapsed / 1e9}
+
+
+def report(name: str, metrics: dict[str, float]) -> None:
+    print(f"{name:<52}", *(f"{k} {v:10.3f}" for k, v in metrics.items()), sep="  ")
+
+
+def compare(
+    results: dict[str, dict[str, float]],
+    baseline: dict[str, dict[str, float]],
+    threshold: float,
+) -> list[str]:
+    regressions: list[str] = []
+    for name, metrics in results.items():
+        for metric, value in metrics.items():
+            expected: float | None = baseline.get(name, {}).get(metric)
+            if metric not in GATED_METRICS or not expected:
+                continue
+            change: float = (value - expected) / expected
+            if metric in HIGHER_IS_BETTER:
+                change = -change
+            if change > threshold:
+                regressions.append(
+                    f"{name} {metric}: {expected:.3f} -> {value:.3f} "
+                    f"({change:+.1%} worse)"
+                )
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=ITERATIONS)
+    parser.add_argument("--controllers", type=int, nargs="*", default=CONTROLLERS)
+    parser.add_argument("--output", help="write results as JSON to this file")
+    parser.add_argument("--baseline", help="compare against results in this file")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=THRESHOLD,
+        help="fail when a gated metric is worse than the baseline by this ratio",
+    )
+    arguments = parser.parse_args()
+
+    results = asyncio.run(run_pipeline(arguments.iterations))
+    for controllers in arguments.controllers:
+        name = f"startup/{controllers} controllers"
+        results[name] = run_startup(controllers)
+        report(name, results[name])
+
+    if arguments.output is not None:
+        with open(arguments.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+    if arguments.baseline is not None:
+        with open(arguments.baseline, "r", encoding="utf-8") as f:
+            baseline: dict[str, dict[str, float]] = json.load(f)
+        regressions = compare(results, baseline, arguments.threshold)
+        if regressions:
+            print("Regressions against baseline:", *regressions, sep="\n  ")
+            sys.exit(1)
+        print("No regressions against baseline.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+"""Response serialization cost for large nested `BaseModel` payloads.
+
+Serves the same controllers once with the stock `JSONResponse` default and
+once with `SpakkyFastAPISettings.default_response_class` set to
+`ORJSONResponse`, which renders pydantic return values straight to bytes.
+Each is measured for a model and a list endpoint, with and without
+`trusted_return`.
+
+Run with `python -m benchmarks.serialization`.
+"""
+
+import asyncio
+from time import perf_counter_ns
+
+from fastapi import FastAPI, Response
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
+from spakky.application.application import SpakkyApplication
+from spakky.application.application_context import ApplicationContext
+from spakky.pod.annotations.pod import Pod
+from starlette.types import Message
+
+from spakky_fastapi.main import initialize
+from spakky_fastapi.routes import get
+from spakky_fastapi.settings import SpakkyFastAPISettings
+from spakky_fastapi.stereotypes.api_controller import ApiController
+
+ITERATIONS: int = 300
+ORDERS: int = 200
+LINES_PER_ORDER: int = 10
+
+
+class Line(BaseModel):
+    sku: str
+    quantity: int
+    price: float
+    attributes: dict[str, str]
+
+
+class Order(BaseModel):
+    id: int
+    customer: str
+    lines: list[Line]
+    notes: list[str]
+
+
+class Orders(BaseModel):
+    orders: list[Order]
+
+
+PAYLOAD: Orders = Orders(
+    orders=[
+        Order(
+            id=i,
+            customer=f"customer-{i}",
+            lines=[
+                Line(
+                    sku=f"sku-{i}-{j}",
+                    quantity=j,
+                    price=j * 1.5,
+                    attributes={"color": "red", "size": "XL"},
+                )
+                for j in range(LINES_PER_ORDER)
+            ],
+            notes=["fragile", "gift"],
+        )
+        for i in range(ORDERS)
+    ]
+)
+
+
+@ApiController("/orders")
+class OrderController:
+    @get("")
+    async def get_orders(self) -> Orders:
+        return PAYLOAD
+
+    @get("/list")
+    async def get_order_list(self) -> list[Order]:
+        return PAYLOAD.orders
+
+
+@ApiController("/trusted-orders", trusted_return=True)
+class TrustedOrderController:
+    @get("")
+    async def get_orders(self) -> Orders:
+        return PAYLOAD
+
+    @get("/list")
+    async def get_order_list(self) -> list[Order]:
+        return PAYLOAD.orders
+
+
+def create_application(default_response_class: type[Response] | None) -> FastAPI:
+    @Pod(name="api")
+    def get_api() -> FastAPI:
+        return FastAPI()
+
+    @Pod(name="settings")
+    def get_settings() -> SpakkyFastAPISettings:
+        return SpakkyFastAPISettings(default_response_class=default_response_class)
+
+    application = (
+        SpakkyApplication(ApplicationContext())
+        .add(OrderController)
+        .add(TrustedOrderController)
+        .add(get_api)
+        .add(get_settings)
+    )
+    initialize(application)
+    application.start()
+    return application.container.get(FastAPI)
+
+
+async def measure(app: FastAPI, path: str) -> tuple[float, int]:
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"localhost")],
+        "client": ("127.0.0.1", 12345),
+        "server": ("localhost", 80),
+    }
+    size: int = 0
+
+    async def receive() -> Message:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: Message) -> None:
+        nonlocal size
+        if message["type"] == "http.response.body":
+            size = len(message.get("body", b""))
+
+    await app(dict(scope), receive, send)
+    started: int = perf_counter_ns()
+    for _ in range(ITERATIONS):
+        await app(dict(scope), receive, send)
+    return (perf_counter_ns() - started) / ITERATIONS / 1_000_000, size
+
+
+async def run() -> None:
+    for label, response_class in (
+        ("JSONResponse", None),
+        ("ORJSONResponse", ORJSONResponse),
+    ):
+        app = create_application(response_class)
+        for path in (
+            "/orders",
+            "/orders/list",
+            "/trusted-orders",
+            "/trusted-orders/list",
+        ):
+            elapsed, size = await measure(app, path)
+            print(f"{label:>16} {path:<22}: {elapsed:7.3f} ms/request ({size} bytes)")
+
+
+def main() -> None:
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
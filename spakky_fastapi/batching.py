@@ -0,0 +1,132 @@
+from asyncio import Future, Task, TimerHandle, create_task, get_running_loop, shield
+from collections.abc import Mapping, Sequence
+from contextvars import Context
+from inspect import Parameter, Signature, signature
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Hashable,
+    get_args,
+    get_origin,
+    get_type_hints,
+)
+
+from fastapi.exceptions import FastAPIError
+
+from spakky_fastapi.error import NotFound
+
+MISSING: object = object()
+
+
+class Batcher:
+    __load: Callable[[list[Any]], Awaitable[Any]]
+    __max_size: int
+    __max_wait: float
+    __pending: dict[Hashable, Future[Any]]
+    __flusher: TimerHandle | None
+    __running: set[Task[None]]
+
+    def __init__(
+        self,
+        load: Callable[[list[Any]], Awaitable[Any]],
+        max_size: int = 100,
+        max_wait: float = 0.005,
+    ) -> None:
+        self.__load = load
+        self.__max_size = max_size
+        self.__max_wait = max_wait
+        self.__pending = {}
+        self.__flusher = None
+        self.__running = set()
+
+    async def load(self, key: Hashable) -> Any:
+        future: Future[Any] | None = self.__pending.get(key)
+        if future is None:
+            # Concurrent requests for the same key share one slot in the batch.
+            future = get_running_loop().create_future()
+            self.__pending[key] = future
+            if len(self.__pending) >= self.__max_size:
+                self.dispatch()
+            elif self.__flusher is None:
+                self.__flusher = get_running_loop().call_later(
+                    self.__max_wait, self.dispatch
+                )
+        # Shielded so one disconnecting client does not cancel the result for
+        # every other request waiting on the same key.
+        return await shield(future)
+
+    def dispatch(self) -> None:
+        if self.__flusher is not None:
+            self.__flusher.cancel()
+            self.__flusher = None
+        if not self.__pending:
+            return
+        batch, self.__pending = self.__pending, {}
+        # The batch serves many requests, so it runs in an empty context rather
+        # than inheriting the variables, such as the deadline, of whichever
+        # request happened to trigger it.
+        task: Task[None] = Context().run(create_task, self.__run(batch))
+        self.__running.add(task)
+        task.add_done_callback(self.__running.discard)
+
+    async def __run(self, batch: dict[Hashable, Future[Any]]) -> None:
+        keys: list[Hashable] = list(batch)
+        try:
+            results: Any = await self.__load(keys)
+            if isinstance(results, Mapping):
+                values: list[Any] = [results.get(key, MISSING) for key in keys]
+            else:
+                values = list(results)
+                if len(values) != len(keys):
+                    raise FastAPIError(
+                        f"Batch returned {len(values)} results for {len(keys)} keys"
+                    )
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(e)
+            return
+        except BaseException:
+            for future in batch.values():
+                future.cancel()
+            raise
+        for future, value in zip(batch.values(), values):
+            if future.done():
+                continue
+            if value is MISSING:
+                future.set_exception(NotFound())
+            else:
+                future.set_result(value)
+
+
+def get_batched_signature(method: Callable[..., Any]) -> Signature:
+    # The controller method takes every key at once; each request carries one,
+    # so the endpoint advertises the element types to FastAPI instead.
+    method_signature: Signature = signature(method)
+    parameters: list[Parameter] = list(method_signature.parameters.values())
+    if len(parameters) != 1:
+        raise FastAPIError(
+            f"{method.__qualname__} must take exactly one parameter holding the keys"
+        )
+    hints: dict[str, Any] = get_type_hints(method)
+    key_type: Any = get_element_type(hints.get(parameters[0].name, Any), Sequence)
+    return_type: Any = hints.get("return", Any)
+    origin: Any = get_origin(return_type)
+    if isinstance(origin, type) and issubclass(origin, Mapping):
+        value_type: Any = get_args(return_type)[1]
+    else:
+        value_type = get_element_type(return_type, Sequence)
+    return method_signature.replace(
+        parameters=[parameters[0].replace(annotation=key_type)],
+        return_annotation=value_type,
+    )
+
+
+def get_element_type(annotation: Any, container: type[Any]) -> Any:
+    origin: Any = get_origin(annotation)
+    if isinstance(origin, type) and issubclass(origin, container):
+        arguments: tuple[Any, ...] = get_args(annotation)
+        if arguments:
+            return arguments[0]
+    return Any
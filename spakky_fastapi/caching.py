@@ -0,0 +1,146 @@
+from collections import OrderedDict
+from dataclasses import dataclass
+from time import monotonic
+from typing import Callable, Hashable, Sequence
+
+from fastapi import Request, Response
+from fastapi.routing import APIRoute
+from spakky.pod.annotations.pod import Pod
+
+from spakky_fastapi.routing import RouteHandler, get_request_key, has_body
+
+CACHEABLE_METHODS: frozenset[str] = frozenset({"GET", "HEAD"})
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    path: str
+    status_code: int
+    raw_headers: list[tuple[bytes, bytes]]
+    body: bytes
+    expires_at: float
+
+    def to_response(self) -> Response:
+        response = Response(content=self.body, status_code=self.status_code)
+        response.raw_headers = list(self.raw_headers)
+        return response
+
+
+class ResponseCache:
+    __ttl: float
+    __max_entries: int
+    __headers: tuple[str, ...]
+    __key: Callable[[Request], Hashable] | None
+    __entries: OrderedDict[Hashable, CachedResponse]
+    __generation: int
+
+    def __init__(
+        self,
+        ttl: float,
+        max_entries: int = 1024,
+        headers: Sequence[str] = (),
+        key: Callable[[Request], Hashable] | None = None,
+    ) -> None:
+        self.__ttl = ttl
+        self.__max_entries = max_entries
+        self.__headers = tuple(header.lower() for header in headers)
+        self.__key = key
+        self.__entries = OrderedDict()
+        self.__generation = 0
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    @property
+    def generation(self) -> int:
+        return self.__generation
+
+    def get(self, key: Hashable) -> CachedResponse | None:
+        entry: CachedResponse | None = self.__entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at <= monotonic():
+            del self.__entries[key]
+            return None
+        self.__entries.move_to_end(key)
+        return entry
+
+    def set(
+        self,
+        key: Hashable,
+        path: str,
+        response: Response,
+        generation: int | None = None,
+    ) -> None:
+        if generation is not None and generation != self.__generation:
+            # Rendered before an invalidation, so it may hold what was invalidated.
+            return
+        self.__entries[key] = CachedResponse(
+            path=path,
+            status_code=response.status_code,
+            raw_headers=list(response.raw_headers),
+            body=bytes(response.body),
+            expires_at=monotonic() + self.__ttl,
+        )
+        self.__entries.move_to_end(key)
+        while len(self.__entries) > self.__max_entries:
+            self.__entries.popitem(last=False)
+
+    def invalidate(self, path: str | None = None) -> None:
+        # Any invalidation drops every write still in flight, which costs at most
+        # one extra miss for unrelated paths.
+        self.__generation += 1
+        if path is None:
+            self.__entries.clear()
+            return
+        for key in [k for k, v in self.__entries.items() if v.path == path]:
+            del self.__entries[key]
+
+    def get_key(self, request: Request) -> Hashable:
+        if self.__key is not None:
+            return self.__key(request)
+        return get_request_key(request, self.__headers)
+
+    def wrap_handler(self, route: APIRoute, handler: RouteHandler) -> RouteHandler:
+        async def app(request: Request) -> Response:
+            if request.method not in CACHEABLE_METHODS:
+                return await handler(request)
+            key: Hashable = self.get_key(request)
+            entry: CachedResponse | None = self.get(key)
+            if entry is not None:
+                return entry.to_response()
+            generation: int = self.__generation
+            response: Response = await handler(request)
+            if is_cacheable(response):
+                self.set(key, request.url.path, response, generation)
+            return response
+
+        return app
+
+
+def is_cacheable(response: Response) -> bool:
+    if response.status_code != 200:
+        return False
+    if not has_body(response):
+        return False
+    return "set-cookie" not in response.headers
+
+
+@Pod()
+class ResponseCacheRegistry:
+    __caches: dict[str, list[ResponseCache]]
+
+    def __init__(self) -> None:
+        self.__caches = {}
+
+    def register(self, name: str, cache: ResponseCache) -> None:
+        self.__caches.setdefault(name, []).append(cache)
+
+    def invalidate(self, name: str, path: str | None = None) -> None:
+        for cache in self.__caches.get(name, []):
+            cache.invalidate(path)
+
+    def clear(self) -> None:
+        for caches in self.__caches.values():
+            for cache in caches:
+                cache.invalidate()
@@ -0,0 +1,91 @@
+from asyncio import CancelledError, Task, create_task, shield
+from copy import copy
+from typing import Hashable, Sequence
+
+from fastapi import Request, Response
+from fastapi.routing import APIRoute
+
+from spakky_fastapi.routing import RouteHandler, get_request_key, has_body
+
+COALESCABLE_METHODS: frozenset[str] = frozenset({"GET", "HEAD"})
+
+
+class InFlightRequest:
+    __task: Task[Response]
+    __waiters: int
+
+    def __init__(self, task: Task[Response]) -> None:
+        self.__task = task
+        self.__waiters = 0
+
+    @property
+    def task(self) -> Task[Response]:
+        return self.__task
+
+    async def wait(self) -> Response:
+        self.__waiters += 1
+        try:
+            # Shielded so a disconnecting client only stops waiting; the shared
+            # invocation keeps running for everyone else still attached to it.
+            return await shield(self.__task)
+        except CancelledError:
+            if self.__waiters == 1 and not self.__task.done():
+                self.__task.cancel()
+            raise
+        except Exception as e:
+            # Re-raising the shared instance in every waiter would keep growing
+            # its traceback, so each gets its own copy chained to the original.
+            raise copy_error(e) from e
+        finally:
+            self.__waiters -= 1
+
+
+class SingleFlight:
+    __headers: tuple[str, ...]
+    __in_flight: dict[Hashable, InFlightRequest]
+
+    def __init__(self, headers: Sequence[str] = ()) -> None:
+        self.__headers = tuple(header.lower() for header in headers)
+        self.__in_flight = {}
+
+    def __len__(self) -> int:
+        return len(self.__in_flight)
+
+    def wrap_handler(self, route: APIRoute, handler: RouteHandler) -> RouteHandler:
+        async def app(request: Request) -> Response:
+            if request.method not in COALESCABLE_METHODS:
+                return await handler(request)
+            key: Hashable = get_request_key(request, self.__headers)
+            in_flight: InFlightRequest | None = self.__in_flight.get(key)
+            if in_flight is not None:
+                response: Response = await in_flight.wait()
+                if not has_body(response):
+                    # A streaming body can only be sent once, by the leader, so
+                    # followers of a streaming route each run the handler again;
+                    # coalescing only ever saves work for buffered responses.
+                    return await handler(request)
+                return copy_response(response)
+
+            in_flight = InFlightRequest(create_task(handler(request)))
+            self.__in_flight[key] = in_flight
+            in_flight.task.add_done_callback(lambda _: self.__forget(key, in_flight))
+            return await in_flight.wait()
+
+        return app
+
+    def __forget(self, key: Hashable, in_flight: InFlightRequest) -> None:
+        if self.__in_flight.get(key) is in_flight:
+            del self.__in_flight[key]
+
+
+def copy_response(response: Response) -> Response:
+    copied = Response(content=bytes(response.body), status_code=response.status_code)
+    copied.raw_headers = list(response.raw_headers)
+    return copied
+
+
+def copy_error(error: Exception) -> Exception:
+    try:
+        return copy(error)
+    except Exception:  # pylint: disable=broad-exception-caught
+        return error
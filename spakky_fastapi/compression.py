@@ -0,0 +1,113 @@
+import zlib
+from typing import Callable, Protocol, Sequence
+
+from fastapi import Request, Response
+from fastapi.routing import APIRoute
+
+from spakky_fastapi.routing import RouteHandler
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover
+    brotli = None
+try:
+    import zstandard
+except ImportError:  # pragma: no cover
+    zstandard = None
+
+SKIP_COMPRESSION: str = "spakky.skip_compression"
+
+
+class ICompressor(Protocol):
+    def compress(self, data: bytes) -> bytes: ...
+
+    def flush(self) -> bytes: ...
+
+    def finish(self) -> bytes: ...
+
+
+class GzipCompressor:
+    __compressor: "zlib._Compress"
+
+    def __init__(self, level: int | None = None) -> None:
+        self.__compressor = zlib.compressobj(
+            6 if level is None else level, zlib.DEFLATED, 16 + zlib.MAX_WBITS
+        )
+
+    def compress(self, data: bytes) -> bytes:
+        return self.__compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self.__compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self.__compressor.flush(zlib.Z_FINISH)
+
+
+class BrotliCompressor:
+    __compressor: "brotli.Compressor"
+
+    def __init__(self, level: int | None = None) -> None:
+        self.__compressor = brotli.Compressor(quality=4 if level is None else level)
+
+    def compress(self, data: bytes) -> bytes:
+        return self.__compressor.process(data)
+
+    def flush(self) -> bytes:
+        return self.__compressor.flush()
+
+    def finish(self) -> bytes:
+        return self.__compressor.finish()
+
+
+class ZstdCompressor:
+    __compressor: "zstandard.ZstdCompressionObj"
+
+    def __init__(self, level: int | None = None) -> None:
+        self.__compressor = zstandard.ZstdCompressor(
+            level=3 if level is None else level
+        ).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        return self.__compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self.__compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def finish(self) -> bytes:
+        return self.__compressor.flush()
+
+
+COMPRESSORS: dict[str, Callable[[int | None], ICompressor]] = {"gzip": GzipCompressor}
+if brotli is not None:
+    COMPRESSORS["br"] = BrotliCompressor
+if zstandard is not None:
+    COMPRESSORS["zstd"] = ZstdCompressor
+
+
+def select_encoding(accept_encoding: str, encodings: Sequence[str]) -> str | None:
+    accepted: dict[str, float] = {}
+    for token in accept_encoding.lower().split(","):
+        coding, _, parameters = token.strip().partition(";")
+        quality: float = 1.0
+        parameter = parameters.strip()
+        if parameter.startswith("q="):
+            try:
+                quality = float(parameter[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[coding.strip()] = quality
+    wildcard: float = accepted.get("*", 0.0)
+    # The server's preference order wins among everything the client accepts.
+    for encoding in encodings:
+        if accepted.get(encoding, wildcard) > 0:
+            return encoding
+    return None
+
+
+def skip_compression(route: APIRoute, handler: RouteHandler) -> RouteHandler:
+    async def app(request: Request) -> Response:
+        request.scope[SKIP_COMPRESSION] = True
+        return await handler(request)
+
+    return app
@@ -0,0 +1,116 @@
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from hashlib import blake2b
+from typing import Awaitable, Callable
+
+from fastapi import Request, Response, status
+from fastapi.routing import APIRoute
+
+from spakky_fastapi.routing import RouteHandler, has_body
+
+CONDITIONAL_METHODS: frozenset[str] = frozenset({"GET", "HEAD"})
+NOT_MODIFIED_HEADERS: tuple[str, ...] = (
+    "cache-control",
+    "content-location",
+    "date",
+    "etag",
+    "expires",
+    "last-modified",
+    "vary",
+)
+
+VersionFunction = Callable[[Request], Awaitable[str | datetime | None]]
+
+
+class ConditionalGet:
+    __weak: bool
+    __version: VersionFunction | None
+
+    def __init__(
+        self, weak: bool = False, version: VersionFunction | None = None
+    ) -> None:
+        self.__weak = weak
+        self.__version = version
+
+    def wrap_handler(self, route: APIRoute, handler: RouteHandler) -> RouteHandler:
+        async def app(request: Request) -> Response:
+            if request.method not in CONDITIONAL_METHODS:
+                return await handler(request)
+            if self.__version is not None:
+                version = await self.__version(request)
+                if version is not None:
+                    return await self.__respond_with_version(request, handler, version)
+            response: Response = await handler(request)
+            if response.status_code != status.HTTP_200_OK or not has_body(response):
+                return response
+            response.headers["etag"] = self.__format_etag(
+                blake2b(response.body, digest_size=16).hexdigest()
+            )
+            if is_not_modified(request, response.headers):
+                return not_modified(response.headers)
+            return response
+
+        return app
+
+    async def __respond_with_version(
+        self,
+        request: Request,
+        handler: RouteHandler,
+        version: str | datetime,
+    ) -> Response:
+        headers: dict[str, str] = {}
+        if isinstance(version, datetime):
+            if version.tzinfo is None:
+                version = version.replace(tzinfo=timezone.utc)
+            version = version.astimezone(timezone.utc).replace(microsecond=0)
+            headers["last-modified"] = format_datetime(version, usegmt=True)
+            headers["etag"] = self.__format_etag(f"{int(version.timestamp()):x}")
+        else:
+            headers["etag"] = self.__format_etag(version)
+        # The version is known before the controller runs, so unchanged resources
+        # are answered without invoking the handler or serializing anything.
+        if is_not_modified(request, headers):
+            return not_modified(headers)
+        response: Response = await handler(request)
+        if response.status_code == status.HTTP_200_OK:
+            response.headers.update(headers)
+        return response
+
+    def __format_etag(self, tag: str) -> str:
+        return f'W/"{tag}"' if self.__weak else f'"{tag}"'
+
+
+def is_not_modified(request: Request, headers: dict[str, str] | Response) -> bool:
+    if_none_match: str | None = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        etag: str | None = headers.get("etag")
+        if etag is None:
+            return False
+        if if_none_match.strip() == "*":
+            return True
+        # If-None-Match always uses weak comparison.
+        candidates = {
+            tag.strip().removeprefix("W/") for tag in if_none_match.split(",")
+        }
+        return etag.removeprefix("W/") in candidates
+    if_modified_since: str | None = request.headers.get("if-modified-since")
+    last_modified: str | None = headers.get("last-modified")
+    if if_modified_since is None or last_modified is None:
+        return False
+    try:
+        return parsedate_to_datetime(last_modified) <= parsedate_to_datetime(
+            if_modified_since
+        )
+    except (TypeError, ValueError):
+        return False
+
+
+def not_modified(headers: dict[str, str] | Response) -> Response:
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers={
+            name: value
+            for name in NOT_MODIFIED_HEADERS
+            if (value := headers.get(name)) is not None
+        },
+    )
@@ -0,0 +1,274 @@
+from asyncio import Queue, Task, create_task, sleep
+from functools import wraps
+from sys import getsizeof
+from time import monotonic
+from typing import Any, Awaitable, Callable
+
+from fastapi import WebSocket, WebSocketDisconnect, status
+from spakky.pod.annotations.pod import Pod
+from starlette.types import Message
+from starlette.websockets import WebSocketState
+
+from spakky_fastapi.framing import get_websocket_parameters
+from spakky_fastapi.metrics import escape_label
+
+INBOX_SIZE: int = 32
+
+
+class WebSocketRouteStats:
+    __slots__ = (
+        "path",
+        "accepted",
+        "closed",
+        "reaped",
+        "received_bytes",
+        "sent_bytes",
+        "connections",
+    )
+
+    path: str
+    accepted: int
+    closed: int
+    reaped: int
+    received_bytes: int
+    sent_bytes: int
+    connections: set["MonitoredWebSocket"]
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.accepted = 0
+        self.closed = 0
+        self.reaped = 0
+        self.received_bytes = 0
+        self.sent_bytes = 0
+        self.connections = set()
+
+    @property
+    def active(self) -> int:
+        return len(self.connections)
+
+    @property
+    def memory_bytes(self) -> int:
+        return sum(x.memory_bytes for x in self.connections)
+
+
+@Pod()
+class WebSocketRegistry:
+    __routes: dict[str, WebSocketRouteStats]
+
+    def __init__(self) -> None:
+        self.__routes = {}
+
+    def get(self, path: str) -> WebSocketRouteStats:
+        stats: WebSocketRouteStats | None = self.__routes.get(path)
+        if stats is None:
+            stats = self.__routes[path] = WebSocketRouteStats(path)
+        return stats
+
+    def snapshot(self) -> list[WebSocketRouteStats]:
+        return sorted(self.__routes.values(), key=lambda x: x.path)
+
+    def render(self) -> str:
+        lines: list[str] = []
+        for metric, kind, help_text, read in (
+            (
+                "active",
+                "gauge",
+                "Open WebSocket connections.",
+                lambda x: x.active,
+            ),
+            (
+                "memory_bytes",
+                "gauge",
+                "Estimated memory held by open WebSocket connections.",
+                lambda x: x.memory_bytes,
+            ),
+            (
+                "accepted_total",
+                "counter",
+                "Accepted WebSocket connections.",
+                lambda x: x.accepted,
+            ),
+            (
+                "closed_total",
+                "counter",
+                "Closed WebSocket connections.",
+                lambda x: x.closed,
+            ),
+            (
+                "reaped_total",
+                "counter",
+                "WebSocket connections closed for being idle.",
+                lambda x: x.reaped,
+            ),
+            (
+                "received_bytes_total",
+                "counter",
+                "Payload bytes received over WebSocket connections.",
+                lambda x: x.received_bytes,
+            ),
+            (
+                "sent_bytes_total",
+                "counter",
+                "Payload bytes sent over WebSocket connections.",
+                lambda x: x.sent_bytes,
+            ),
+        ):
+            name: str = f"spakky_websocket_connections_{metric}"
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            for stats in self.snapshot():
+                lines.append(
+                    f'{name}{{route="{escape_label(stats.path)}"}} {read(stats)}'
+                )
+        return "\n".join(lines) + "\n"
+
+
+class MonitoredWebSocket(WebSocket):
+    __socket: WebSocket
+    __stats: WebSocketRouteStats
+    __inbox: Queue[Message] | None
+    __reader: Task[None] | None
+    __last_received: float
+    __reaped: bool
+
+    def __init__(
+        self,
+        socket: WebSocket,
+        stats: WebSocketRouteStats,
+        read_ahead: bool = False,
+    ) -> None:
+        super().__init__(socket.scope, self.__receive, self.__send)
+        self.__socket = socket
+        self.__stats = stats
+        self.__inbox = Queue(maxsize=INBOX_SIZE) if read_ahead else None
+        self.__reader = None
+        self.__last_received = monotonic()
+        self.__reaped = False
+
+    @property
+    def idle_seconds(self) -> float:
+        return monotonic() - self.__last_received
+
+    @property
+    def memory_bytes(self) -> int:
+        # Only what this process keeps for the connection; buffers owned by the
+        # server and the kernel are out of reach of an ASGI application.
+        return (
+            getsizeof(self)
+            + getsizeof(self.scope)
+            + sum(len(k) + len(v) for k, v in self.scope.get("headers", ()))
+        )
+
+    @property
+    def reaped(self) -> bool:
+        return self.__reaped
+
+    def start(self) -> None:
+        # Frames are read as they arrive rather than when the endpoint asks, so
+        # a client that sends counts as alive even while the endpoint only
+        # pushes. Once the inbox is full, reading stops until the endpoint
+        # catches up.
+        if self.__inbox is not None and self.__reader is None:
+            self.__reader = create_task(self.__read(self.__inbox))
+
+    def stop(self) -> None:
+        if self.__reader is not None:
+            self.__reader.cancel()
+            self.__reader = None
+
+    async def reap(self) -> None:
+        self.__reaped = True
+        self.__stats.reaped += 1
+        await self.close(status.WS_1001_GOING_AWAY)
+
+    async def send(self, message: Message) -> None:
+        # The endpoint did not close the socket, so to it the peer is gone.
+        if self.__reaped and self.application_state == WebSocketState.DISCONNECTED:
+            raise WebSocketDisconnect(status.WS_1001_GOING_AWAY)
+        await super().send(message)
+
+    async def __read(self, inbox: Queue[Message]) -> None:
+        while True:
+            message: Message = await self.__read_one()
+            await inbox.put(message)
+            if message["type"] == "websocket.disconnect":
+                return
+
+    async def __read_one(self) -> Message:
+        message: Message = await self.__socket.receive()
+        self.__last_received = monotonic()
+        self.__stats.received_bytes += get_payload_size(message)
+        return message
+
+    async def __receive(self) -> Message:
+        if self.__inbox is None:
+            return await self.__read_one()
+        self.start()
+        return await self.__inbox.get()
+
+    async def __send(self, message: Message) -> None:
+        if message["type"] == "websocket.accept":
+            self.__stats.accepted += 1
+            self.__stats.connections.add(self)
+        self.__stats.sent_bytes += get_payload_size(message)
+        await self.__socket.send(message)
+
+
+def get_payload_size(message: Message) -> int:
+    if message.get("bytes") is not None:
+        return len(message["bytes"])
+    if message.get("text") is not None:
+        return len(message["text"])
+    return 0
+
+
+def monitor(
+    endpoint: Callable[..., Awaitable[Any]],
+    method: Callable[..., Any],
+    stats: WebSocketRouteStats,
+    idle_timeout: float | None = None,
+) -> Callable[..., Awaitable[Any]]:
+    socket_parameters: list[str] = get_websocket_parameters(method)
+
+    async def watch(socket: MonitoredWebSocket, idle_timeout: float) -> None:
+        while True:
+            remaining: float = idle_timeout - socket.idle_seconds
+            if remaining > 0:
+                await sleep(remaining)
+                continue
+            if socket.application_state != WebSocketState.CONNECTED:
+                await sleep(idle_timeout)
+                continue
+            # Only frames from the client count: pongs to the server's pings
+            # never reach the application. Routes that only push should leave
+            # `idle_timeout` unset and rely on the server's ping interval and
+            # timeout, see `SpakkyFastAPISettings.server_options`.
+            await socket.reap()
+            return
+
+    @wraps(method)
+    async def monitored_endpoint(*args: Any, **kwargs: Any) -> Any:
+        sockets: list[MonitoredWebSocket] = []
+        watchers: list[Task[None]] = []
+        for name in socket_parameters:
+            socket = MonitoredWebSocket(
+                kwargs[name], stats, read_ahead=idle_timeout is not None
+            )
+            kwargs[name] = socket
+            sockets.append(socket)
+            if idle_timeout is not None:
+                socket.start()
+                watchers.append(create_task(watch(socket, idle_timeout)))
+        try:
+            return await endpoint(*args, **kwargs)
+        finally:
+            for watcher in watchers:
+                watcher.cancel()
+            for socket in sockets:
+                socket.stop()
+                if socket in stats.connections:
+                    stats.connections.discard(socket)
+                    stats.closed += 1
+
+    return monitored_endpoint
@@ -0,0 +1,52 @@
+from asyncio import TimeoutError as AsyncTimeoutError
+from asyncio import wait_for
+from contextvars import ContextVar
+from functools import wraps
+from time import monotonic
+from typing import Any, Awaitable, Callable
+
+from fastapi.exceptions import FastAPIError
+
+from spakky_fastapi.error import GatewayTimeout
+
+DEADLINE: ContextVar[float | None] = ContextVar("spakky_fastapi_deadline", default=None)
+
+
+def get_deadline() -> float | None:
+    return DEADLINE.get()
+
+
+def get_remaining_time() -> float | None:
+    deadline: float | None = DEADLINE.get()
+    if deadline is None:
+        return None
+    return max(0.0, deadline - monotonic())
+
+
+def with_deadline(
+    call: Callable[..., Awaitable[Any]],
+    timeout: float,
+) -> Callable[..., Awaitable[Any]]:
+    if timeout <= 0:
+        raise FastAPIError(f"timeout must be positive, got {timeout}")
+
+    @wraps(call)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        deadline: float = monotonic() + timeout
+        outer: float | None = DEADLINE.get()
+        if outer is not None and outer < deadline:
+            # A caller with less time left than this route allows wins.
+            deadline = outer
+        token = DEADLINE.set(deadline)
+        try:
+            # The handler runs as its own task with a copy of the context, so
+            # it sees the deadline and is cancelled once the deadline passes.
+            return await wait_for(call(*args, **kwargs), deadline - monotonic())
+        except AsyncTimeoutError as e:
+            if monotonic() < deadline:
+                raise
+            raise GatewayTimeout() from e
+        finally:
+            DEADLINE.reset(token)
+
+    return wrapper
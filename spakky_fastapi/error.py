@@ -51,6 +51,21 @@ class Conflict(AbstractSpakkyFastAPIError):
     status_code: ClassVar[int] = status.HTTP_409_CONFLICT
 
 
+class TooManyRequests(AbstractSpakkyFastAPIError):
+    message: str = "Too Many Requests"
+    status_code: ClassVar[int] = status.HTTP_429_TOO_MANY_REQUESTS
+
+
 class InternalServerError(AbstractSpakkyFastAPIError):
     message: str = "Internal Server Error"
     status_code: ClassVar[int] = status.HTTP_500_INTERNAL_SERVER_ERROR
+
+
+class ServiceUnavailable(AbstractSpakkyFastAPIError):
+    message: str = "Service Unavailable"
+    status_code: ClassVar[int] = status.HTTP_503_SERVICE_UNAVAILABLE
+
+
+class GatewayTimeout(AbstractSpakkyFastAPIError):
+    message: str = "Gateway Timeout"
+    status_code: ClassVar[int] = status.HTTP_504_GATEWAY_TIMEOUT
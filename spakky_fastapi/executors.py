@@ -0,0 +1,180 @@
+from asyncio import Future, get_running_loop, run, wrap_future
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures import Future as ConcurrentFuture
+from contextvars import copy_context
+from functools import partial
+from inspect import iscoroutine
+from os import cpu_count
+from pickle import loads
+from threading import Event, Lock
+from typing import Any, Callable
+
+from spakky.pod.annotations.pod import Pod
+from spakky.service.interfaces.service import IService
+
+from spakky_fastapi.error import ServiceUnavailable
+from spakky_fastapi.routes.route import ExecutionMode
+
+
+def call_in_worker(function: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    result: Any = function(*args, **kwargs)
+    if iscoroutine(result):
+        # Async methods get a private loop in the worker, so CPU-heavy ones
+        # still leave the serving loop alone.
+        return run(result)
+    return result
+
+
+# Filled in each worker process, so a pickled method is rebuilt once per worker
+# instead of on every call.
+UNPICKLED_FUNCTIONS: dict[bytes, Callable[..., Any]] = {}
+
+
+def call_pickled(payload: bytes, *args: Any, **kwargs: Any) -> Any:
+    function: Callable[..., Any] | None = UNPICKLED_FUNCTIONS.get(payload)
+    if function is None:
+        function = UNPICKLED_FUNCTIONS[payload] = loads(payload)
+    return function(*args, **kwargs)
+
+
+class ExecutorPool:
+    __mode: ExecutionMode
+    __max_workers: int
+    __max_pending: int | None
+    __executor: Executor | None
+    __pending: int
+    __lock: Lock
+
+    def __init__(
+        self,
+        mode: ExecutionMode,
+        max_workers: int | None = None,
+        max_pending: int | None = None,
+    ) -> None:
+        self.__mode = mode
+        self.__max_workers = max_workers or get_default_workers(mode)
+        self.__max_pending = max_pending
+        self.__executor = None
+        self.__pending = 0
+        self.__lock = Lock()
+
+    @property
+    def mode(self) -> ExecutionMode:
+        return self.__mode
+
+    @property
+    def max_workers(self) -> int:
+        return self.__max_workers
+
+    @property
+    def active(self) -> int:
+        return min(self.__pending, self.__max_workers)
+
+    @property
+    def queued(self) -> int:
+        return max(0, self.__pending - self.__max_workers)
+
+    async def run(self, function: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        if self.__max_pending is not None and self.queued >= self.__max_pending:
+            raise ServiceUnavailable()
+        call: Callable[[], Any] = partial(call_in_worker, function, *args, **kwargs)
+        if self.__mode == ExecutionMode.THREAD:
+            # Threads share memory, so context variables such as the request
+            # deadline can follow the call.
+            call = partial(copy_context().run, call)
+        with self.__lock:
+            self.__pending += 1
+        try:
+            submitted: ConcurrentFuture[Any] = self.__get_executor().submit(call)
+        except BaseException:
+            self.__release()
+            raise
+        # Cancelling the awaiting request, e.g. when its deadline passes, cannot
+        # stop a call a worker already runs, so the call stays pending until it
+        # really finishes rather than until nobody waits for it.
+        submitted.add_done_callback(self.__release)
+        future: Future[Any] = wrap_future(submitted, loop=get_running_loop())
+        return await future
+
+    def shutdown(self) -> None:
+        if self.__executor is not None:
+            self.__executor.shutdown(wait=False, cancel_futures=True)
+            self.__executor = None
+
+    def __release(self, _: object = None) -> None:
+        # Done callbacks run on the worker thread that finished the call.
+        with self.__lock:
+            self.__pending -= 1
+
+    def __get_executor(self) -> Executor:
+        if self.__executor is None:
+            if self.__mode == ExecutionMode.PROCESS:
+                self.__executor = ProcessPoolExecutor(self.__max_workers)
+            else:
+                self.__executor = ThreadPoolExecutor(
+                    self.__max_workers, thread_name_prefix="spakky-executor"
+                )
+        return self.__executor
+
+
+def get_default_workers(mode: ExecutionMode) -> int:
+    cpus: int = cpu_count() or 1
+    if mode == ExecutionMode.PROCESS:
+        return cpus
+    # The same default as `ThreadPoolExecutor`, which assumes blocking I/O.
+    return min(32, cpus + 4)
+
+
+@Pod()
+class ExecutorRegistry(IService):
+    __pools: dict[ExecutionMode, ExecutorPool]
+    __stop_event: Event | None
+
+    def __init__(self) -> None:
+        self.__pools = {}
+        self.__stop_event = None
+
+    def set_stop_event(self, stop_event: Event) -> None:
+        self.__stop_event = stop_event
+
+    def start(self) -> None:
+        # Pools start their workers on first use, so idle modes cost nothing.
+        pass
+
+    def stop(self) -> None:
+        self.shutdown()
+
+    def configure(
+        self,
+        mode: ExecutionMode,
+        max_workers: int | None = None,
+        max_pending: int | None = None,
+    ) -> None:
+        previous: ExecutorPool | None = self.__pools.get(mode)
+        if previous is not None:
+            previous.shutdown()
+        self.__pools[mode] = ExecutorPool(mode, max_workers, max_pending)
+
+    def get(self, mode: ExecutionMode) -> ExecutorPool:
+        pool: ExecutorPool | None = self.__pools.get(mode)
+        if pool is None:
+            pool = self.__pools[mode] = ExecutorPool(mode)
+        return pool
+
+    def render(self) -> str:
+        lines: list[str] = []
+        for metric, help_text, read in (
+            ("workers", "Workers in the executor pool.", lambda x: x.max_workers),
+            ("active", "Calls running in the executor pool.", lambda x: x.active),
+            ("queued", "Calls waiting for an executor worker.", lambda x: x.queued),
+        ):
+            name: str = f"spakky_executor_{metric}"
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} gauge")
+            for mode, pool in sorted(self.__pools.items()):
+                lines.append(f'{name}{{pool="{mode.value}"}} {read(pool)}')
+        return "\n".join(lines) + "\n"
+
+    def shutdown(self) -> None:
+        for pool in self.__pools.values():
+            pool.shutdown()
@@ -0,0 +1,221 @@
+from asyncio import Task, create_task, sleep
+from contextlib import suppress
+from functools import lru_cache, wraps
+from inspect import signature
+from typing import Any, AsyncIterator, Awaitable, Callable, Protocol, TypeVar
+
+import orjson
+from fastapi import WebSocket, WebSocketDisconnect
+from fastapi.exceptions import FastAPIError
+from pydantic import BaseModel, TypeAdapter
+from starlette.types import Message
+from starlette.websockets import WebSocketState
+
+from spakky_fastapi.routes.websocket import WebSocketCodec
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover
+    msgpack = None
+
+T = TypeVar("T")
+
+
+def to_builtins(obj: Any) -> Any:
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    raise TypeError(f"Type is not serializable: {type(obj).__name__}")
+
+
+@lru_cache(maxsize=256)
+def get_cached_adapter(type_: Any) -> TypeAdapter[Any]:
+    return TypeAdapter(type_)
+
+
+def get_adapter(type_: Any) -> TypeAdapter[Any]:
+    # Building an adapter compiles a validator, so it is done once per type
+    # rather than once per message.
+    try:
+        return get_cached_adapter(type_)
+    except TypeError:  # Unhashable annotations such as `Annotated[..., {...}]`
+        return TypeAdapter(type_)
+
+
+class ICodec(Protocol):
+    def encode(self, obj: Any) -> Message: ...
+
+    def decode(self, message: Message) -> Any: ...
+
+
+class JSONCodec:
+    def encode(self, obj: Any) -> Message:
+        return {
+            "type": "websocket.send",
+            "bytes": orjson.dumps(obj, default=to_builtins),
+        }
+
+    def decode(self, message: Message) -> Any:
+        data: bytes | str | None = message.get("bytes")
+        if data is None:
+            data = message["text"]
+        return orjson.loads(data)
+
+
+class MsgPackCodec:
+    def encode(self, obj: Any) -> Message:
+        return {
+            "type": "websocket.send",
+            "bytes": msgpack.packb(obj, default=to_builtins, datetime=True),
+        }
+
+    def decode(self, message: Message) -> Any:
+        return msgpack.unpackb(message["bytes"], timestamp=3)
+
+
+CODECS: dict[WebSocketCodec, Callable[[], ICodec]] = {WebSocketCodec.JSON: JSONCodec}
+if msgpack is not None:
+    CODECS[WebSocketCodec.MSGPACK] = MsgPackCodec
+
+
+class CodecWebSocket(WebSocket):
+    __codec: ICodec
+    __batch_window: float | None
+    __batch: list[Any]
+    __flusher: Task[None] | None
+    __flush_error: Exception | None
+
+    def __init__(
+        self,
+        socket: WebSocket,
+        codec: ICodec,
+        batch_window: float | None = None,
+    ) -> None:
+        super().__init__(socket.scope, socket.receive, socket.send)
+        self.__codec = codec
+        self.__batch_window = batch_window
+        self.__batch = []
+        self.__flusher = None
+        self.__flush_error = None
+
+    @property
+    def codec(self) -> ICodec:
+        return self.__codec
+
+    async def send_message(self, obj: Any) -> None:
+        self.__raise_flush_error()
+        if self.__batch_window is None:
+            await self.send(self.__codec.encode(obj))
+            return
+        # Messages sent within the window go out together as one array frame,
+        # so a burst costs one encode and one frame instead of one per message.
+        self.__batch.append(obj)
+        if self.__flusher is None:
+            self.__flusher = create_task(self.__flush_later(self.__batch_window))
+            self.__flusher.add_done_callback(self.__observe_flusher)
+
+    async def receive_message(self, type_: type[T] | None = None) -> T:
+        message: Message = await self.receive()
+        if message["type"] == "websocket.disconnect":
+            raise WebSocketDisconnect(message["code"], message.get("reason"))
+        obj: Any = self.__codec.decode(message)
+        if type_ is None:
+            return obj
+        return get_adapter(type_).validate_python(obj)
+
+    async def iter_messages(self, type_: type[T] | None = None) -> AsyncIterator[T]:
+        adapter: TypeAdapter[Any] | None = None if type_ is None else get_adapter(type_)
+        async for message in self.__iter_raw():
+            obj: Any = self.__codec.decode(message)
+            yield obj if adapter is None else adapter.validate_python(obj)
+
+    async def flush(self) -> None:
+        self.__raise_flush_error()
+        if self.__flusher is not None:
+            self.__flusher.cancel()
+            self.__flusher = None
+        if not self.__batch:
+            return
+        batch, self.__batch = self.__batch, []
+        if (
+            self.client_state == WebSocketState.CONNECTED
+            and self.application_state == WebSocketState.CONNECTED
+        ):
+            await self.send(self.__codec.encode(batch))
+
+    async def close(self, code: int = 1000, reason: str | None = None) -> None:
+        await self.flush()
+        await super().close(code, reason)
+
+    async def __flush_later(self, window: float) -> None:
+        await sleep(window)
+        self.__flusher = None
+        await self.flush()
+
+    def __observe_flusher(self, flusher: Task[None]) -> None:
+        # A background flush has nobody awaiting it, so its failure is kept and
+        # raised from the next send instead of being logged as never retrieved.
+        if flusher.cancelled():
+            return
+        error: BaseException | None = flusher.exception()
+        if isinstance(error, Exception):
+            self.__flush_error = error
+
+    def __raise_flush_error(self) -> None:
+        if self.__flush_error is not None:
+            error, self.__flush_error = self.__flush_error, None
+            raise error
+
+    async def __iter_raw(self) -> AsyncIterator[Message]:
+        while True:
+            message: Message = await self.receive()
+            if message["type"] == "websocket.disconnect":
+                return
+            yield message
+
+
+def get_websocket_parameters(method: Callable[..., Any]) -> list[str]:
+    return [
+        name
+        for name, parameter in signature(method).parameters.items()
+        if isinstance(parameter.annotation, type)
+        and issubclass(parameter.annotation, WebSocket)
+    ]
+
+
+def with_codec(
+    endpoint: Callable[..., Awaitable[Any]],
+    method: Callable[..., Any],
+    codec: WebSocketCodec,
+    batch_window: float | None = None,
+) -> Callable[..., Awaitable[Any]]:
+    create_codec: Callable[[], ICodec] | None = CODECS.get(codec)
+    if create_codec is None:
+        raise FastAPIError(
+            f"{method.__qualname__} needs the {codec.value} package installed "
+            f"to use the {codec.name} codec"
+        )
+    # Codecs are stateless, so all sockets of a route share one instance and the
+    # hub can serialize a broadcast once for all of them.
+    shared_codec: ICodec = create_codec()
+    socket_parameters: list[str] = get_websocket_parameters(method)
+
+    @wraps(method)
+    async def codec_endpoint(*args: Any, **kwargs: Any) -> Any:
+        sockets: list[CodecWebSocket] = []
+        for name in socket_parameters:
+            socket = CodecWebSocket(kwargs[name], shared_codec, batch_window)
+            kwargs[name] = socket
+            sockets.append(socket)
+        try:
+            result: Any = await endpoint(*args, **kwargs)
+        except BaseException:
+            # A failed flush must not replace the error that ended the endpoint.
+            for socket in sockets:
+                with suppress(Exception):
+                    await socket.flush()
+            raise
+        for socket in sockets:
+            await socket.flush()
+        return result
+
+    return codec_endpoint
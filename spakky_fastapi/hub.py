@@ -0,0 +1,229 @@
+from asyncio import Future, Task, create_task, get_running_loop
+from collections import deque
+from contextlib import suppress
+from enum import Enum
+from typing import Any
+
+from fastapi import WebSocket, status
+from pydantic import TypeAdapter
+from spakky.pod.annotations.pod import Pod
+from starlette.types import Message
+
+from spakky_fastapi.framing import CodecWebSocket, ICodec
+
+DEFAULT_MAX_QUEUE_SIZE: int = 256
+ANY_ADAPTER: TypeAdapter[Any] = TypeAdapter(Any)
+UNSET: object = object()
+
+
+class SlowConsumerPolicy(str, Enum):
+    DROP_OLDEST = "drop_oldest"
+    DISCONNECT = "disconnect"
+
+    def __repr__(self) -> str:
+        return self.value
+
+
+class HubConnection:
+    __slots__ = (
+        "__hub",
+        "__socket",
+        "__codec",
+        "__max_queue_size",
+        "__policy",
+        "__queue",
+        "__waiter",
+        "__sender",
+        "__close_code",
+        "__topics",
+    )
+
+    __hub: "WebSocketHub"
+    __socket: WebSocket
+    __codec: ICodec | None
+    __max_queue_size: int
+    __policy: SlowConsumerPolicy
+    __queue: deque[Message]
+    __waiter: Future[None] | None
+    __sender: Task[None] | None
+    __close_code: int | None
+    __topics: set[str]
+
+    def __init__(
+        self,
+        hub: "WebSocketHub",
+        socket: WebSocket,
+        max_queue_size: int,
+        policy: SlowConsumerPolicy,
+    ) -> None:
+        self.__hub = hub
+        self.__socket = socket
+        self.__codec = socket.codec if isinstance(socket, CodecWebSocket) else None
+        self.__max_queue_size = max_queue_size
+        self.__policy = policy
+        self.__queue = deque()
+        self.__waiter = None
+        self.__sender = None
+        self.__close_code = None
+        self.__topics = set()
+
+    async def __aenter__(self) -> "HubConnection":
+        self.__sender = create_task(self.__send_queued())
+        return self
+
+    async def __aexit__(self, *_: object) -> None:
+        self.__hub.disconnect(self)
+        if self.__sender is not None:
+            self.__sender.cancel()
+
+    @property
+    def socket(self) -> WebSocket:
+        return self.__socket
+
+    @property
+    def codec(self) -> ICodec | None:
+        return self.__codec
+
+    @property
+    def topics(self) -> set[str]:
+        return self.__topics
+
+    @property
+    def queued(self) -> int:
+        return len(self.__queue)
+
+    @property
+    def closed(self) -> bool:
+        return self.__close_code is not None
+
+    def subscribe(self, topic: str) -> None:
+        self.__hub.subscribe(self, topic)
+
+    def unsubscribe(self, topic: str) -> None:
+        self.__hub.unsubscribe(self, topic)
+
+    def send(self, data: Any) -> bool:
+        return self.enqueue(encode_message(data, self.__codec))
+
+    def enqueue(self, message: Message) -> bool:
+        if self.__close_code is not None:
+            return False
+        if len(self.__queue) >= self.__max_queue_size:
+            if self.__policy == SlowConsumerPolicy.DISCONNECT:
+                self.close(status.WS_1008_POLICY_VIOLATION)
+                return False
+            self.__queue.popleft()
+        self.__queue.append(message)
+        self.__wake()
+        return True
+
+    def close(self, code: int = status.WS_1000_NORMAL_CLOSURE) -> None:
+        if self.__close_code is not None:
+            return
+        self.__close_code = code
+        self.__queue.clear()
+        self.__wake()
+
+    def __wake(self) -> None:
+        # Only an idle sender holds a waiter, so a busy one costs nothing here.
+        waiter: Future[None] | None = self.__waiter
+        if waiter is not None:
+            self.__waiter = None
+            if not waiter.done():
+                waiter.set_result(None)
+
+    async def __send_queued(self) -> None:
+        # Each connection drains its own queue, so a slow reader only ever
+        # delays itself while broadcasts keep enqueueing without awaiting.
+        try:
+            while self.__close_code is None:
+                if not self.__queue:
+                    self.__waiter = get_running_loop().create_future()
+                    await self.__waiter
+                    continue
+                await self.__socket.send(self.__queue.popleft())
+            await self.__socket.close(self.__close_code)
+        except Exception:  # pylint: disable=broad-exception-caught
+            # The send failed, so the connection is unusable; close it so the
+            # endpoint's receive loop ends instead of waiting on a dead peer.
+            self.__close_code = status.WS_1006_ABNORMAL_CLOSURE
+            self.__queue.clear()
+            with suppress(Exception):
+                await self.__socket.close(status.WS_1011_INTERNAL_ERROR)
+        finally:
+            self.__hub.disconnect(self)
+
+
+@Pod()
+class WebSocketHub:
+    __topics: dict[str, set[HubConnection]]
+
+    def __init__(self) -> None:
+        self.__topics = {}
+
+    def connect(
+        self,
+        socket: WebSocket,
+        max_queue_size: int = DEFAULT_MAX_QUEUE_SIZE,
+        policy: SlowConsumerPolicy = SlowConsumerPolicy.DROP_OLDEST,
+    ) -> HubConnection:
+        return HubConnection(self, socket, max_queue_size, policy)
+
+    def subscribe(self, connection: HubConnection, topic: str) -> None:
+        if connection.closed:
+            return
+        self.__topics.setdefault(topic, set()).add(connection)
+        connection.topics.add(topic)
+
+    def unsubscribe(self, connection: HubConnection, topic: str) -> None:
+        connection.topics.discard(topic)
+        subscribers: set[HubConnection] | None = self.__topics.get(topic)
+        if subscribers is None:
+            return
+        subscribers.discard(connection)
+        if not subscribers:
+            del self.__topics[topic]
+
+    def disconnect(self, connection: HubConnection) -> None:
+        for topic in list(connection.topics):
+            self.unsubscribe(connection, topic)
+
+    def subscribers(self, topic: str) -> int:
+        return len(self.__topics.get(topic, ()))
+
+    def broadcast(self, topic: str, data: Any) -> int:
+        subscribers: set[HubConnection] | None = self.__topics.get(topic)
+        if not subscribers:
+            return 0
+        # Serialized once per codec instance; every queue holds a reference to
+        # the same message instead of its own copy. Routes share one codec, so
+        # the identity check against the previous codec almost always hits.
+        messages: dict[int, Message] = {}
+        last_codec: ICodec | object | None = UNSET
+        last_message: Message = {}
+        delivered: int = 0
+        dropped: list[HubConnection] = []
+        for connection in subscribers:
+            codec: ICodec | None = connection.codec
+            if codec is not last_codec:
+                message: Message | None = messages.get(id(codec))
+                if message is None:
+                    message = messages[id(codec)] = encode_message(data, codec)
+                last_codec, last_message = codec, message
+            if connection.enqueue(last_message):
+                delivered += 1
+            else:
+                dropped.append(connection)
+        for connection in dropped:
+            self.disconnect(connection)
+        return delivered
+
+
+def encode_message(data: Any, codec: ICodec | None = None) -> Message:
+    if codec is not None:
+        return codec.encode(data)
+    if isinstance(data, bytes):
+        return {"type": "websocket.send", "bytes": data}
+    if isinstance(data, str):
+        return {"type": "websocket.send", "text": data}
+    return {"type": "websocket.send", "text": ANY_ADAPTER.dump_json(data).decode()}
@@ -0,0 +1,45 @@
+from asyncio import AbstractEventLoop, get_running_loop
+
+from spakky.pod.annotations.pod import Pod
+
+DEFAULT_INTERVAL: float = 0.05
+
+
+@Pod()
+class EventLoopLagMonitor:
+    __interval: float
+    __loop: AbstractEventLoop | None
+    __lag: float
+
+    def __init__(self) -> None:
+        self.__interval = DEFAULT_INTERVAL
+        self.__loop = None
+        self.__lag = 0.0
+
+    @property
+    def lag(self) -> float:
+        return self.__lag
+
+    def set_interval(self, interval: float) -> None:
+        self.__interval = interval
+
+    def ensure_started(self) -> None:
+        loop: AbstractEventLoop = get_running_loop()
+        if loop is self.__loop:
+            return
+        # A timer handle instead of a task, so a loop that is closed while the
+        # monitor is scheduled drops it silently instead of warning about it.
+        self.__loop = loop
+        self.__lag = 0.0
+        loop.call_later(
+            self.__interval, self.__tick, loop, loop.time() + self.__interval
+        )
+
+    def __tick(self, loop: AbstractEventLoop, expected: float) -> None:
+        if loop is not self.__loop:
+            return
+        now: float = loop.time()
+        # How late the timer fired is how long every other ready callback had
+        # to wait behind whatever was hogging the loop.
+        self.__lag = max(0.0, now - expected)
+        loop.call_later(self.__interval, self.__tick, loop, now + self.__interval)
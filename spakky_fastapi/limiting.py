@@ -0,0 +1,151 @@
+from collections import OrderedDict
+from dataclasses import dataclass
+from math import ceil
+from time import monotonic
+from typing import Callable, Hashable
+
+from fastapi import Request, Response
+from fastapi.routing import APIRoute
+
+from spakky_fastapi.error import ServiceUnavailable, TooManyRequests
+from spakky_fastapi.routing import RouteHandler
+from spakky_fastapi.settings import WARM_UP_SCOPE_KEY
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    rate: float
+    burst: int | None = None
+    header: str | None = None
+    key: Callable[[Request], Hashable] | None = None
+    max_keys: int = 10_000
+
+    def __post_init__(self) -> None:
+        if self.rate <= 0:
+            raise ValueError(f"rate must be positive, got {self.rate}")
+        if self.burst is not None and self.burst < 1:
+            raise ValueError(f"burst must be at least 1, got {self.burst}")
+
+    @property
+    def capacity(self) -> float:
+        return float(self.burst if self.burst is not None else max(1, ceil(self.rate)))
+
+
+class TokenBucket:
+    __slots__ = ("tokens", "updated_at")
+
+    tokens: float
+    updated_at: float
+
+    def __init__(self, tokens: float, updated_at: float) -> None:
+        self.tokens = tokens
+        self.updated_at = updated_at
+
+
+class RateLimiter:
+    __rate: float
+    __capacity: float
+    __header: str | None
+    __key: Callable[[Request], Hashable] | None
+    __max_keys: int
+    __buckets: OrderedDict[Hashable, TokenBucket]
+
+    def __init__(self, limit: RateLimit) -> None:
+        self.__rate = limit.rate
+        self.__capacity = limit.capacity
+        self.__header = limit.header
+        self.__key = limit.key
+        self.__max_keys = limit.max_keys
+        self.__buckets = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self.__buckets)
+
+    def acquire(self, key: Hashable) -> float:
+        now: float = monotonic()
+        bucket: TokenBucket | None = self.__buckets.get(key)
+        if bucket is None:
+            bucket = self.__buckets[key] = TokenBucket(self.__capacity, now)
+            # Evicting the least recently seen client only forgets how much of
+            # its burst it had spent, so memory stays bounded for any traffic.
+            if len(self.__buckets) > self.__max_keys:
+                self.__buckets.popitem(last=False)
+        else:
+            self.__buckets.move_to_end(key)
+            bucket.tokens = min(
+                self.__capacity,
+                bucket.tokens + (now - bucket.updated_at) * self.__rate,
+            )
+            bucket.updated_at = now
+        if bucket.tokens >= 1.0:
+            bucket.tokens -= 1.0
+            return 0.0
+        return (1.0 - bucket.tokens) / self.__rate
+
+    def get_key(self, request: Request) -> Hashable:
+        if self.__key is not None:
+            return self.__key(request)
+        if self.__header is not None:
+            return request.headers.get(self.__header)
+        return request.client.host if request.client is not None else None
+
+    def wrap_handler(self, route: APIRoute, handler: RouteHandler) -> RouteHandler:
+        async def app(request: Request) -> Response:
+            if WARM_UP_SCOPE_KEY in request.scope:
+                return await handler(request)
+            wait: float = self.acquire(self.get_key(request))
+            if wait:
+                return reject(TooManyRequests(), wait)
+            return await handler(request)
+
+        return app
+
+
+class ConcurrencyLimiter:
+    __limit: int
+    __active: int
+
+    def __init__(self, limit: int) -> None:
+        if limit < 1:
+            raise ValueError(f"max_concurrency must be at least 1, got {limit}")
+        self.__limit = limit
+        self.__active = 0
+
+    @property
+    def active(self) -> int:
+        return self.__active
+
+    def wrap_handler(self, route: APIRoute, handler: RouteHandler) -> RouteHandler:
+        async def app(request: Request) -> Response:
+            if self.__active >= self.__limit:
+                # Rejecting outright instead of queueing keeps a saturated route
+                # from holding connections that other routes could be serving.
+                return reject(ServiceUnavailable(), 1.0)
+            self.__active += 1
+            try:
+                response: Response = await handler(request)
+            except BaseException:
+                self.__active -= 1
+                raise
+            call_on_close: Callable[[Callable[[], None]], None] | None = getattr(
+                response, "call_on_close", None
+            )
+            if call_on_close is None:
+                self.__active -= 1
+            else:
+                # Rendered streams are produced after the handler returns, so the
+                # slot is held until the body is done. A plain StreamingResponse
+                # returned by a controller releases it on return.
+                call_on_close(self.__release)
+            return response
+
+        return app
+
+    def __release(self) -> None:
+        self.__active -= 1
+
+
+def reject(error: TooManyRequests | ServiceUnavailable, retry_after: float) -> Response:
+    response: Response = error.to_response()
+    response.headers["Retry-After"] = str(ceil(retry_after))
+    return response
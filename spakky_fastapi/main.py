@@ -1,11 +1,27 @@
 from spakky.application.application import SpakkyApplication
 
+from spakky_fastapi.caching import ResponseCacheRegistry
+from spakky_fastapi.connections import WebSocketRegistry
+from spakky_fastapi.executors import ExecutorRegistry
+from spakky_fastapi.hub import WebSocketHub
+from spakky_fastapi.lag import EventLoopLagMonitor
+from spakky_fastapi.metrics import MetricsRegistry
 from spakky_fastapi.post_processors.add_builtin_middlewares import (
     AddBuiltInMiddlewaresPostProcessor,
 )
 from spakky_fastapi.post_processors.register_routes import RegisterRoutesPostProcessor
+from spakky_fastapi.stalls import StallDetector
+from spakky_fastapi.warmup import WarmUp
 
 
 def initialize(app: SpakkyApplication) -> None:
     app.add(AddBuiltInMiddlewaresPostProcessor)
     app.add(RegisterRoutesPostProcessor)
+    app.add(ResponseCacheRegistry)
+    app.add(MetricsRegistry)
+    app.add(WebSocketHub)
+    app.add(WebSocketRegistry)
+    app.add(EventLoopLagMonitor)
+    app.add(StallDetector)
+    app.add(ExecutorRegistry)
+    app.add(WarmUp)
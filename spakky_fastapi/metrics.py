@@ -0,0 +1,173 @@
+from bisect import bisect_left
+from typing import Protocol, Sequence
+
+from spakky.pod.annotations.pod import Pod
+from starlette.routing import BaseRoute
+
+DEFAULT_BUCKETS: tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.075,
+    0.1,
+    0.25,
+    0.5,
+    0.75,
+    1.0,
+    2.5,
+    5.0,
+    7.5,
+    10.0,
+)
+UNMATCHED: str = "<unmatched>"
+KNOWN_METHODS: frozenset[str] = frozenset(
+    {"GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"}
+)
+METRICS_MEDIA_TYPE: str = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class IMetricsCollector(Protocol):
+    def render(self) -> str: ...
+
+
+class RouteMetrics:
+    __slots__ = ("method", "path", "name", "statuses", "buckets", "total_seconds")
+
+    method: str
+    path: str
+    name: str
+    statuses: list[int]
+    buckets: list[int]
+    total_seconds: float
+
+    def __init__(self, method: str, path: str, name: str, buckets: int) -> None:
+        self.method = method
+        self.path = path
+        self.name = name
+        # Indexed by status class, so 2xx responses land in `statuses[2]`;
+        # codes outside 100-599 are counted in `statuses[0]`.
+        self.statuses = [0] * 6
+        # One slot per bucket bound plus +Inf, counted non-cumulatively.
+        self.buckets = [0] * (buckets + 1)
+        self.total_seconds = 0.0
+
+
+@Pod()
+class MetricsRegistry:
+    __bounds: tuple[float, ...]
+    __routes: dict[tuple[str, int], RouteMetrics]
+    __in_flight: int
+
+    def __init__(self) -> None:
+        self.__bounds = DEFAULT_BUCKETS
+        self.__routes = {}
+        self.__in_flight = 0
+
+    @property
+    def in_flight(self) -> int:
+        return self.__in_flight
+
+    def set_buckets(self, buckets: Sequence[float]) -> None:
+        self.__bounds = tuple(sorted(buckets))
+        self.__routes.clear()
+
+    def start(self) -> None:
+        self.__in_flight += 1
+
+    def observe(
+        self,
+        method: str,
+        route: BaseRoute | None,
+        status_code: int,
+        seconds: float,
+    ) -> None:
+        # Every request is recorded on the event loop without awaiting, so plain
+        # increments cannot interleave and no lock is needed.
+        self.__in_flight -= 1
+        # Routes compare by value and are unhashable, but they live as long as the
+        # application, so their identity is a stable key.
+        metrics: RouteMetrics | None = self.__routes.get((method, id(route)))
+        if metrics is None:
+            metrics = self.__get_or_create_metrics(method, route)
+        metrics.statuses[status_code // 100 if 100 <= status_code < 600 else 0] += 1
+        metrics.buckets[bisect_left(self.__bounds, seconds)] += 1
+        metrics.total_seconds += seconds
+
+    def render(self) -> str:
+        lines: list[str] = [
+            "# HELP spakky_http_requests_in_flight HTTP requests being served.",
+            "# TYPE spakky_http_requests_in_flight gauge",
+            f"spakky_http_requests_in_flight {self.__in_flight}",
+            "# HELP spakky_http_requests_total HTTP requests by status class.",
+            "# TYPE spakky_http_requests_total counter",
+        ]
+        routes: list[RouteMetrics] = sorted(
+            self.__routes.values(), key=lambda x: (x.path, x.method)
+        )
+        for metrics in routes:
+            labels: str = format_labels(metrics)
+            for status_class, count in enumerate(metrics.statuses):
+                if count:
+                    status_label: str = f"{status_class}xx" if status_class else "other"
+                    lines.append(
+                        f'spakky_http_requests_total{{{labels},status="{status_label}"}} {count}'
+                    )
+        lines.append(
+            "# HELP spakky_http_request_duration_seconds HTTP request latency."
+        )
+        lines.append("# TYPE spakky_http_request_duration_seconds histogram")
+        for metrics in routes:
+            labels = format_labels(metrics)
+            cumulative: int = 0
+            for bound, count in zip((*self.__bounds, "+Inf"), metrics.buckets):
+                cumulative += count
+                lines.append(
+                    f'spakky_http_request_duration_seconds_bucket{{{labels},le="{bound}"}} {cumulative}'
+                )
+            lines.append(
+                f"spakky_http_request_duration_seconds_sum{{{labels}}} {metrics.total_seconds}"
+            )
+            lines.append(
+                f"spakky_http_request_duration_seconds_count{{{labels}}} {cumulative}"
+            )
+        return "\n".join(lines) + "\n"
+
+    def clear(self) -> None:
+        self.__routes.clear()
+
+    def __get_or_create_metrics(
+        self,
+        method: str,
+        route: BaseRoute | None,
+    ) -> RouteMetrics:
+        # Label values come from a closed set so memory stays fixed no matter
+        # which paths or methods clients send.
+        if route is None or method not in KNOWN_METHODS:
+            method, route = UNMATCHED, None
+            metrics: RouteMetrics | None = self.__routes.get((method, id(route)))
+            if metrics is not None:
+                return metrics
+        metrics = RouteMetrics(
+            method=method,
+            path=getattr(route, "path_format", UNMATCHED),
+            name=getattr(route, "name", UNMATCHED),
+            buckets=len(self.__bounds),
+        )
+        self.__routes[(method, id(route))] = metrics
+        return metrics
+
+
+def format_labels(metrics: RouteMetrics) -> str:
+    return ",".join(
+        f'{key}="{escape_label(value)}"'
+        for key, value in (
+            ("method", metrics.method),
+            ("route", metrics.path),
+            ("name", metrics.name),
+        )
+    )
+
+
+def escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
@@ -0,0 +1,195 @@
+from asyncio import Semaphore, gather, get_running_loop
+from typing import Any
+from urllib.parse import urlsplit
+
+import orjson
+from fastapi import status
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
+from spakky.pod.interfaces.application_context import IApplicationContext
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from spakky_fastapi.error import BadRequest
+from spakky_fastapi.middlewares.error_handling import ErrorHandlingMiddleware
+from spakky_fastapi.middlewares.load_shedding import (
+    LOAD_SHEDDING_SCOPE_KEY,
+    LoadSheddingMiddleware,
+)
+from spakky_fastapi.middlewares.manage_context import ManageContextMiddleware
+
+# Describe the envelope or its transport and do not apply to sub-requests.
+ENVELOPE_HEADERS: frozenset[bytes] = frozenset(
+    {b"content-length", b"content-type", b"content-encoding", b"accept-encoding"}
+)
+
+
+class SubRequest(BaseModel):
+    method: str = "GET"
+    path: str
+    headers: dict[str, str] = Field(default_factory=dict)
+    body: Any = None
+
+
+class UnsupportedSubResponse(Exception):
+    pass
+
+
+class BatchMiddleware:
+    __app: ASGIApp
+    __dispatch: ASGIApp
+    __path: str
+    __max_requests: int
+    __max_concurrency: int
+    __adapter: TypeAdapter[list[SubRequest]]
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        path: str,
+        application_context: IApplicationContext,
+        debug: bool = False,
+        max_requests: int = 50,
+        max_concurrency: int = 10,
+    ) -> None:
+        self.__app = app
+        # Sub-requests only re-run what must be per request: a fresh context
+        # scope and error rendering. Everything outside already ran once for
+        # the envelope, and compressing each part of the body would be wrong.
+        self.__dispatch = ManageContextMiddleware(
+            ErrorHandlingMiddleware(app, debug=debug),
+            application_context=application_context,
+        )
+        self.__path = path
+        self.__max_requests = max_requests
+        self.__max_concurrency = max_concurrency
+        self.__adapter = TypeAdapter(list[SubRequest])
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or scope["path"] != self.__path
+            or scope["method"] != "POST"
+        ):
+            await self.__app(scope, receive, send)
+            return
+        body: bytearray = bytearray()
+        while True:
+            message: Message = await receive()
+            body += message.get("body", b"")
+            if not message.get("more_body", False):
+                break
+        try:
+            requests: list[SubRequest] = self.__adapter.validate_json(body)
+        except ValidationError as e:
+            await BadRequest("Invalid batch request", str(e)).to_response()(
+                scope, receive, send
+            )
+            return
+        if len(requests) > self.__max_requests:
+            await BadRequest(
+                f"Batch request exceeds {self.__max_requests} sub-requests"
+            ).to_response()(scope, receive, send)
+            return
+        semaphore = Semaphore(self.__max_concurrency)
+
+        async def run(request: SubRequest) -> dict[str, Any]:
+            async with semaphore:
+                try:
+                    return await self.__run(scope, request)
+                except Exception:  # pylint: disable=broad-exception-caught
+                    # One failing sub-request must not take down its siblings.
+                    return {
+                        "status": status.HTTP_500_INTERNAL_SERVER_ERROR,
+                        "headers": {},
+                        "body": None,
+                    }
+
+        results: list[dict[str, Any]] = await gather(*(run(x) for x in requests))
+        await ORJSONResponse(results)(scope, receive, send)
+
+    async def __run(self, envelope: Scope, request: SubRequest) -> dict[str, Any]:
+        url = urlsplit(request.path)
+        if url.path == self.__path:
+            return {"status": status.HTTP_400_BAD_REQUEST, "headers": {}, "body": None}
+        headers: list[tuple[bytes, bytes]] = [
+            (key, value)
+            for key, value in envelope["headers"]
+            if key not in ENVELOPE_HEADERS
+        ]
+        body: bytes = b""
+        if request.body is not None:
+            body = orjson.dumps(request.body)
+            headers.append((b"content-type", b"application/json"))
+        headers.append((b"content-length", str(len(body)).encode()))
+        overrides: set[bytes] = {key.lower().encode() for key in request.headers}
+        headers = [(k, v) for k, v in headers if k not in overrides] + [
+            (key.lower().encode(), value.encode())
+            for key, value in request.headers.items()
+        ]
+        scope: Scope = {
+            **envelope,
+            "method": request.method.upper(),
+            "path": url.path,
+            "raw_path": url.path.encode(),
+            "query_string": url.query.encode(),
+            "headers": headers,
+            "state": dict(envelope.get("state", {})),
+        }
+        received: bool = False
+
+        async def receive() -> Message:
+            nonlocal received
+            if not received:
+                received = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            # The sub-request only ends when its response does.
+            await get_running_loop().create_future()
+            return {"type": "http.disconnect"}  # pragma: no cover
+
+        result: dict[str, Any] = {}
+        response_headers: dict[str, str] = {}
+        chunks: bytearray = bytearray()
+
+        async def send(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                result["status"] = message["status"]
+                for key, value in message.get("headers", []):
+                    response_headers[key.decode("latin-1")] = value.decode("latin-1")
+                if response_headers.get("content-type", "").startswith(
+                    "text/event-stream"
+                ):
+                    # Event streams never end, so they cannot be part of a batch.
+                    raise UnsupportedSubResponse()
+            elif message["type"] == "http.response.body":
+                chunks.extend(message.get("body", b""))
+
+        # The envelope path matches no route, so load shedding let it through;
+        # each sub-request is admitted, and counted as in flight, on its own.
+        shedder: LoadSheddingMiddleware | None = envelope.get(LOAD_SHEDDING_SCOPE_KEY)
+        try:
+            if shedder is None:
+                await self.__dispatch(scope, receive, send)
+            else:
+                await shedder.admit(self.__dispatch, scope, receive, send)
+        except UnsupportedSubResponse:
+            return {
+                "status": status.HTTP_406_NOT_ACCEPTABLE,
+                "headers": {},
+                "body": None,
+            }
+        return {
+            "status": result.get("status", status.HTTP_500_INTERNAL_SERVER_ERROR),
+            "headers": response_headers,
+            "body": decode_body(response_headers.get("content-type"), bytes(chunks)),
+        }
+
+
+def decode_body(content_type: str | None, body: bytes) -> Any:
+    if not body:
+        return None
+    if content_type is not None and "json" in content_type:
+        try:
+            return orjson.loads(body)
+        except orjson.JSONDecodeError:
+            pass
+    return body.decode("utf-8", errors="replace")
@@ -0,0 +1,113 @@
+from typing import Mapping, Sequence
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from spakky_fastapi.compression import (
+    COMPRESSORS,
+    SKIP_COMPRESSION,
+    ICompressor,
+    select_encoding,
+)
+
+UNCOMPRESSIBLE_CONTENT_TYPES: tuple[str, ...] = ("text/event-stream",)
+
+
+class CompressionMiddleware:
+    __app: ASGIApp
+    __encodings: tuple[str, ...]
+    __minimum_size: int
+    __levels: Mapping[str, int]
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        encodings: Sequence[str] = ("zstd", "br", "gzip"),
+        minimum_size: int = 500,
+        levels: Mapping[str, int] | None = None,
+    ) -> None:
+        self.__app = app
+        self.__encodings = tuple(x for x in encodings if x in COMPRESSORS)
+        self.__minimum_size = minimum_size
+        self.__levels = levels or {}
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.__app(scope, receive, send)
+            return
+        encoding: str | None = select_encoding(
+            Headers(scope=scope).get("accept-encoding", ""), self.__encodings
+        )
+        if encoding is None:
+            await self.__app(scope, receive, send)
+            return
+
+        start: Message | None = None
+        compressor: ICompressor | None = None
+        passthrough: bool = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal start, compressor, passthrough
+            if passthrough:
+                await send(message)
+                return
+            if message["type"] == "http.response.start":
+                # Held back until the first body chunk tells whether it is worth it.
+                start = message
+                return
+            if start is None:
+                # Nothing to compress without a response start, such as an
+                # extension message sent first, so it is forwarded untouched.
+                await send(message)
+                return
+            if compressor is None:
+                headers = MutableHeaders(raw=start["headers"])
+                body: bytes = message.get("body", b"")
+                more_body: bool = message.get("more_body", False)
+                if (
+                    message["type"] != "http.response.body"
+                    or scope.get(SKIP_COMPRESSION, False)
+                    or "content-encoding" in headers
+                    or headers.get("content-type", "").startswith(
+                        UNCOMPRESSIBLE_CONTENT_TYPES
+                    )
+                    or (not more_body and len(body) < self.__minimum_size)
+                ):
+                    passthrough = True
+                    await send(start)
+                    await send(message)
+                    return
+                compressor = COMPRESSORS[encoding](self.__levels.get(encoding))
+                headers["content-encoding"] = encoding
+                headers.add_vary_header("Accept-Encoding")
+                etag: str | None = headers.get("etag")
+                if etag is not None and not etag.startswith("W/"):
+                    # The compressed bytes differ from the identity representation.
+                    headers["etag"] = f"W/{etag}"
+                if more_body:
+                    # Streamed responses are compressed chunk by chunk, so the
+                    # final length is unknown and the response goes out chunked.
+                    del headers["content-length"]
+                    await send(start)
+                else:
+                    compressed = compressor.compress(body) + compressor.finish()
+                    headers["content-length"] = str(len(compressed))
+                    await send(start)
+                    await send({"type": "http.response.body", "body": compressed})
+                    return
+            body = message.get("body", b"")
+            if message.get("more_body", False):
+                chunk: bytes = compressor.compress(body) + compressor.flush()
+                if chunk:
+                    await send(
+                        {"type": "http.response.body", "body": chunk, "more_body": True}
+                    )
+                return
+            await send(
+                {
+                    "type": "http.response.body",
+                    "body": compressor.compress(body) + compressor.finish(),
+                }
+            )
+
+        await self.__app(scope, receive, send_wrapper)
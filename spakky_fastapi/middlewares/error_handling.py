@@ -1,34 +1,42 @@
 from traceback import print_exc
-from typing import Awaitable, Callable, TypeAlias
 
-from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware, DispatchFunction
-from starlette.responses import Response
-from starlette.types import ASGIApp
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from spakky_fastapi.error import AbstractSpakkyFastAPIError, InternalServerError
 
-Next: TypeAlias = Callable[[Request], Awaitable[Response]]
 
-
-class ErrorHandlingMiddleware(BaseHTTPMiddleware):
+class ErrorHandlingMiddleware:
+    __app: ASGIApp
     __debug: bool
 
-    def __init__(
-        self,
-        app: ASGIApp,
-        dispatch: DispatchFunction | None = None,
-        debug: bool = False,
-    ) -> None:
-        super().__init__(app, dispatch)
+    def __init__(self, app: ASGIApp, debug: bool = False) -> None:
+        self.__app = app
         self.__debug = debug
 
-    async def dispatch(self, request: Request, call_next: Next) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.__app(scope, receive, send)
+            return
+
+        response_started: bool = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
         try:
-            return await call_next(request)
+            await self.__app(scope, receive, send_wrapper)
         except AbstractSpakkyFastAPIError as e:
-            return e.to_response()
+            if response_started:
+                # Headers are already on the wire, so the only honest option
+                # left is to let the server abort the connection.
+                raise
+            await e.to_response()(scope, receive, send)
         except Exception:
             if self.__debug:
                 print_exc()
-            return InternalServerError().to_response(self.__debug)
+            if response_started:
+                raise
+            await InternalServerError().to_response(self.__debug)(scope, receive, send)
@@ -0,0 +1,86 @@
+from fastapi import Response
+from starlette.routing import BaseRoute, Router
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from spakky_fastapi.error import ServiceUnavailable
+from spakky_fastapi.lag import EventLoopLagMonitor
+from spakky_fastapi.routes.route import Route
+from spakky_fastapi.routing import match_route
+
+# Lets middlewares that dispatch requests of their own, such as the batch
+# endpoint, admit each of them through the same load shedder.
+LOAD_SHEDDING_SCOPE_KEY: str = "spakky.load_shedding"
+
+
+class LoadSheddingMiddleware:
+    __app: ASGIApp
+    __router: Router
+    __monitor: EventLoopLagMonitor
+    __max_lag: float | None
+    __max_in_flight: int | None
+    __in_flight: int
+    __critical: dict[int, bool]
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        router: Router,
+        monitor: EventLoopLagMonitor,
+        max_lag: float | None = None,
+        max_in_flight: int | None = None,
+    ) -> None:
+        self.__app = app
+        self.__router = router
+        self.__monitor = monitor
+        self.__max_lag = max_lag
+        self.__max_in_flight = max_in_flight
+        self.__in_flight = 0
+        self.__critical = {}
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.__app(scope, receive, send)
+            return
+        scope[LOAD_SHEDDING_SCOPE_KEY] = self
+        await self.admit(self.__app, scope, receive, send)
+
+    async def admit(
+        self, app: ASGIApp, scope: Scope, receive: Receive, send: Send
+    ) -> None:
+        self.__monitor.ensure_started()
+        if self.__is_overloaded():
+            route: BaseRoute | None = match_route(self.__router, scope)
+            # Routing is repeated here only while overloaded; rejecting before the
+            # body is read is what keeps latency bounded for the rest. Unmatched
+            # requests end in a cheap 404, so they are let through.
+            if route is not None and not self.__is_critical(route):
+                response: Response = ServiceUnavailable().to_response()
+                response.headers["Retry-After"] = "1"
+                await response(scope, receive, send)
+                return
+        self.__in_flight += 1
+        try:
+            await app(scope, receive, send)
+        finally:
+            self.__in_flight -= 1
+
+    def __is_overloaded(self) -> bool:
+        if (
+            self.__max_in_flight is not None
+            and self.__in_flight >= self.__max_in_flight
+        ):
+            return True
+        return self.__max_lag is not None and self.__monitor.lag > self.__max_lag
+
+    def __is_critical(self, route: BaseRoute) -> bool:
+        endpoint: object | None = getattr(route, "endpoint", None)
+        if endpoint is None:
+            return False
+        critical: bool | None = self.__critical.get(id(route))
+        if critical is None:
+            # Endpoints are built with `functools.wraps`, which carries the
+            # controller method's annotations over to them.
+            annotation: Route | None = Route.get_or_none(endpoint)
+            critical = annotation is not None and annotation.critical
+            self.__critical[id(route)] = critical
+        return critical
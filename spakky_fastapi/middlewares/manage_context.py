@@ -1,26 +1,29 @@
-from typing import Awaitable, Callable, TypeAlias
-
-from fastapi import Request
 from spakky.pod.interfaces.application_context import IApplicationContext
-from starlette.middleware.base import BaseHTTPMiddleware, DispatchFunction
-from starlette.responses import Response
-from starlette.types import ASGIApp
-
-Next: TypeAlias = Callable[[Request], Awaitable[Response]]
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 
-class ManageContextMiddleware(BaseHTTPMiddleware):
+class ManageContextMiddleware:
+    __app: ASGIApp
     __application_context: IApplicationContext
 
     def __init__(
         self,
         app: ASGIApp,
         application_context: IApplicationContext,
-        dispatch: DispatchFunction | None = None,
     ) -> None:
-        super().__init__(app, dispatch)
+        self.__app = app
         self.__application_context = application_context
 
-    async def dispatch(self, request: Request, call_next: Next) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] not in ("http", "websocket"):
+            await self.__app(scope, receive, send)
+            return
+
+        # Context-scoped cache lives in a contextvar, so binding a fresh one here
+        # only affects the task serving this request. Pods are then built lazily
+        # on first access and released as soon as the response has been sent.
         self.__application_context.clear_context()
-        return await call_next(request)
+        try:
+            await self.__app(scope, receive, send)
+        finally:
+            self.__application_context.clear_context()
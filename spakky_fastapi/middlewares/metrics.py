@@ -0,0 +1,75 @@
+from time import perf_counter
+from typing import Sequence
+
+from fastapi import Response, status
+from starlette.routing import BaseRoute, Router
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from spakky_fastapi.metrics import (
+    METRICS_MEDIA_TYPE,
+    IMetricsCollector,
+    MetricsRegistry,
+)
+from spakky_fastapi.routing import match_route
+
+
+class MetricsMiddleware:
+    __app: ASGIApp
+    __registry: MetricsRegistry
+    __collectors: tuple[IMetricsCollector, ...]
+    __path: str
+    __router: Router | None
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        registry: MetricsRegistry,
+        path: str,
+        collectors: Sequence[IMetricsCollector] = (),
+        router: Router | None = None,
+    ) -> None:
+        self.__app = app
+        self.__registry = registry
+        self.__collectors = tuple(collectors)
+        self.__path = path
+        self.__router = router
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.__app(scope, receive, send)
+            return
+        if scope["path"] == self.__path and scope["method"] == "GET":
+            content: str = self.__registry.render() + "".join(
+                x.render() for x in self.__collectors
+            )
+            response = Response(content, media_type=METRICS_MEDIA_TYPE)
+            await response(scope, receive, send)
+            return
+
+        status_code: int = status.HTTP_500_INTERNAL_SERVER_ERROR
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        registry = self.__registry
+        registry.start()
+        started: float = perf_counter()
+        try:
+            await self.__app(scope, receive, send_wrapper)
+        finally:
+            # FastAPI leaves the matched route in the scope, which gives the path
+            # template and the name assigned when the route was registered.
+            route: BaseRoute | None = scope.get("route")
+            if route is None and self.__router is not None:
+                # Answered before routing, as shed requests are, so attribute it to
+                # the route it was meant for.
+                route = match_route(self.__router, scope)
+            registry.observe(
+                scope["method"],
+                route,
+                status_code,
+                perf_counter() - started,
+            )
@@ -0,0 +1,20 @@
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from spakky_fastapi.settings import WARM_UP_SCOPE_KEY
+from spakky_fastapi.stalls import StallDetector
+
+
+class StallDetectionMiddleware:
+    __app: ASGIApp
+    __detector: StallDetector
+
+    def __init__(self, app: ASGIApp, detector: StallDetector) -> None:
+        self.__app = app
+        self.__detector = detector
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        # The loop serving requests is only known once the first one arrives;
+        # warm-up requests run on another loop, so they must not bind it.
+        if WARM_UP_SCOPE_KEY not in scope:
+            self.__detector.ensure_started()
+        await self.__app(scope, receive, send)
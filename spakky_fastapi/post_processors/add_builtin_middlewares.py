@@ -7,8 +7,20 @@ from spakky.pod.interfaces.aware.application_context_aware import (
 )
 from spakky.pod.interfaces.post_processor import IPostProcessor
 
+from spakky_fastapi.connections import WebSocketRegistry
+from spakky_fastapi.executors import ExecutorRegistry
+from spakky_fastapi.lag import EventLoopLagMonitor
+from spakky_fastapi.metrics import MetricsRegistry
+from spakky_fastapi.middlewares.batch import BatchMiddleware
+from spakky_fastapi.middlewares.compression import CompressionMiddleware
 from spakky_fastapi.middlewares.error_handling import ErrorHandlingMiddleware
+from spakky_fastapi.middlewares.load_shedding import LoadSheddingMiddleware
 from spakky_fastapi.middlewares.manage_context import ManageContextMiddleware
+from spakky_fastapi.middlewares.metrics import MetricsMiddleware
+from spakky_fastapi.middlewares.stall_detection import StallDetectionMiddleware
+from spakky_fastapi.routes.route import ExecutionMode
+from spakky_fastapi.settings import SpakkyFastAPISettings
+from spakky_fastapi.stalls import StallDetector
 
 
 @Order(0)
@@ -23,12 +35,78 @@ class AddBuiltInMiddlewaresPostProcessor(IPostProcessor, IApplicationContextAwar
         if not isinstance(pod, FastAPI):
             return pod
 
+        settings = self.__get_settings()
+        executors = self.__application_context.get(ExecutorRegistry)
+        executors.configure(
+            ExecutionMode.THREAD,
+            settings.thread_pool_size,
+            settings.executor_max_pending,
+        )
+        executors.configure(
+            ExecutionMode.PROCESS,
+            settings.process_pool_size,
+            settings.executor_max_pending,
+        )
+        if settings.batch_path is not None:
+            # Innermost, so the envelope passes every middleware once and each
+            # sub-request only the ones it re-runs for itself.
+            pod.add_middleware(
+                BatchMiddleware,
+                path=settings.batch_path,
+                application_context=self.__application_context,
+                debug=pod.debug,
+                max_requests=settings.batch_max_requests,
+                max_concurrency=settings.batch_max_concurrency,
+            )
         pod.add_middleware(
             ErrorHandlingMiddleware,
             debug=pod.debug,
         )
+        if settings.compression_encodings is not None:
+            # Wraps the error handler so error responses are compressed as well.
+            pod.add_middleware(
+                CompressionMiddleware,
+                encodings=settings.compression_encodings,
+                minimum_size=settings.compression_minimum_size,
+                levels=settings.compression_levels,
+            )
         pod.add_middleware(
             ManageContextMiddleware,
             application_context=self.__application_context,
         )
+        if settings.stall_threshold is not None:
+            detector = self.__application_context.get(StallDetector)
+            detector.set_threshold(settings.stall_threshold)
+            pod.add_middleware(StallDetectionMiddleware, detector=detector)
+        if (
+            settings.load_shedding_max_lag is not None
+            or settings.load_shedding_max_in_flight is not None
+        ):
+            # Inside the metrics middleware so shed requests are still counted.
+            pod.add_middleware(
+                LoadSheddingMiddleware,
+                router=pod.router,
+                monitor=self.__application_context.get(EventLoopLagMonitor),
+                max_lag=settings.load_shedding_max_lag,
+                max_in_flight=settings.load_shedding_max_in_flight,
+            )
+        if settings.metrics_path is not None:
+            registry = self.__application_context.get(MetricsRegistry)
+            registry.set_buckets(settings.metrics_buckets)
+            # Added last so it is the outermost middleware and times everything.
+            pod.add_middleware(
+                MetricsMiddleware,
+                registry=registry,
+                path=settings.metrics_path,
+                collectors=[
+                    self.__application_context.get(WebSocketRegistry),
+                    self.__application_context.get(ExecutorRegistry),
+                ],
+                router=pod.router,
+            )
         return pod
+
+    def __get_settings(self) -> SpakkyFastAPISettings:
+        if self.__application_context.contains(SpakkyFastAPISettings):
+            return self.__application_context.get(SpakkyFastAPISettings)
+        return SpakkyFastAPISettings()
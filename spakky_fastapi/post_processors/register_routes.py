@@ -1,12 +1,26 @@
 from dataclasses import asdict
 from functools import wraps
-from inspect import getmembers, signature
+from inspect import (
+    Signature,
+    getmembers,
+    isasyncgenfunction,
+    isclass,
+    iscoroutinefunction,
+    signature,
+)
 from logging import Logger
-from typing import Any
+from pickle import PicklingError, dumps
+from typing import Any, AsyncGenerator, Awaitable, Callable, Literal
 
-from fastapi import APIRouter, FastAPI
+from fastapi import APIRouter, FastAPI, Response, params
+from fastapi.datastructures import Default, DefaultPlaceholder
 from fastapi.exceptions import FastAPIError
-from fastapi.utils import create_model_field  # type: ignore
+from fastapi.responses import JSONResponse, ORJSONResponse
+from fastapi.utils import (  # type: ignore
+    create_model_field,
+    get_value_or_default,
+    is_body_allowed_for_status_code,
+)
 from spakky.pod.annotations.order import Order
 from spakky.pod.annotations.pod import Pod
 from spakky.pod.interfaces.aware.container_aware import IContainerAware
@@ -14,9 +28,42 @@ from spakky.pod.interfaces.aware.logger_aware import ILoggerAware
 from spakky.pod.interfaces.container import IContainer
 from spakky.pod.interfaces.post_processor import IPostProcessor
 
-from spakky_fastapi.routes.route import Route
+from spakky_fastapi.batching import Batcher, get_batched_signature
+from spakky_fastapi.caching import ResponseCache, ResponseCacheRegistry
+from spakky_fastapi.coalescing import SingleFlight
+from spakky_fastapi.compression import skip_compression
+from spakky_fastapi.conditional import ConditionalGet
+from spakky_fastapi.connections import WebSocketRegistry, monitor
+from spakky_fastapi.deadlines import with_deadline
+from spakky_fastapi.executors import ExecutorPool, ExecutorRegistry, call_pickled
+from spakky_fastapi.framing import with_codec
+from spakky_fastapi.limiting import ConcurrencyLimiter, RateLimit, RateLimiter
+from spakky_fastapi.rendering import ResponseRenderer
+from spakky_fastapi.routes.batched import Batched
+from spakky_fastapi.routes.cached import Cached
+from spakky_fastapi.routes.route import ExecutionMode, Route
+from spakky_fastapi.routes.sse import ServerSentEventsRoute
 from spakky_fastapi.routes.websocket import WebSocketRoute
+from spakky_fastapi.routing import (
+    RouteHandlerWrapper,
+    create_route_class,
+    validate_raw_body,
+)
+from spakky_fastapi.settings import SpakkyFastAPISettings
+from spakky_fastapi.stalls import StallDetector
 from spakky_fastapi.stereotypes.api_controller import ApiController
+from spakky_fastapi.streaming import (
+    EventStreamRenderer,
+    EventStreamResponse,
+    StreamRenderer,
+)
+
+API_ROUTE_PARAMETERS: frozenset[str] = frozenset(
+    signature(APIRouter.add_api_route).parameters
+)
+API_WEBSOCKET_ROUTE_PARAMETERS: frozenset[str] = frozenset(
+    signature(APIRouter.add_api_websocket_route).parameters
+)
 
 
 @Order(0)
@@ -36,13 +83,20 @@ class RegisterRoutesPostProcessor(IPostProcessor, ILoggerAware, IContainerAware)
             return pod
 
         fast_api = self.__container.get(FastAPI)
+        settings = self.__get_settings()
         controller = ApiController.get(pod)
-        router: APIRouter = APIRouter(prefix=controller.prefix, tags=controller.tags)
+        router: APIRouter = APIRouter(
+            prefix=controller.prefix,
+            tags=controller.tags,
+            default_response_class=settings.default_response_class
+            or Default(JSONResponse),
+        )
         for name, method in getmembers(pod, callable):
             route: Route | None = Route.get_or_none(method)
             websocket_route: WebSocketRoute | None = WebSocketRoute.get_or_none(method)
             if route is None and websocket_route is None:
                 continue
+            self.__container.get(StallDetector).register(method)
 
             if route is not None:
                 # pylint: disable=line-too-long
@@ -53,8 +107,16 @@ class RegisterRoutesPostProcessor(IPostProcessor, ILoggerAware, IContainerAware)
                     route.name = " ".join([x.capitalize() for x in name.split("_")])
                 if route.description is None:
                     route.description = method.__doc__
+                batched: Batched | None = Batched.get_or_none(method)
+                endpoint_signature: Signature = (
+                    signature(method)
+                    if batched is None
+                    else get_batched_signature(method)
+                )
                 if route.response_model is None:
-                    return_annotation: type | None = signature(method).return_annotation
+                    return_annotation: type | None = (
+                        endpoint_signature.return_annotation
+                    )
                     if return_annotation is not None:
                         try:
                             create_model_field("", return_annotation)
@@ -62,19 +124,139 @@ class RegisterRoutesPostProcessor(IPostProcessor, ILoggerAware, IContainerAware)
                         except FastAPIError:
                             pass
 
-                @wraps(method)
-                async def endpoint(
-                    *args: Any,
-                    method_name: str = name,
-                    controller_type: type[object] = controller.type_,
-                    context: IContainer = self.__container,
-                    **kwargs: Any,
-                ) -> Any:
-                    controller_instance = context.get(controller_type)
-                    method_to_call = getattr(controller_instance, method_name)
-                    return await method_to_call(*args, **kwargs)
-
-                router.add_api_route(endpoint=endpoint, **asdict(route))
+                if route.execution == ExecutionMode.PROCESS:
+                    self.__ensure_picklable(method)
+
+                response_class = get_value_or_default(
+                    route.response_class,
+                    router.default_response_class,
+                    fast_api.router.default_response_class,
+                )
+                if isinstance(response_class, DefaultPlaceholder):
+                    response_class = response_class.value
+                trusted_return: bool = (
+                    controller.trusted_return
+                    if route.trusted_return is None
+                    else route.trusted_return
+                )
+                renderer: ResponseRenderer | None = None
+                if self.__can_render(route, method, response_class, trusted_return):
+                    renderer = ResponseRenderer(route, response_class, trusted_return)
+
+                route_options: dict[str, Any] = {
+                    key: value
+                    for key, value in asdict(route).items()
+                    if key in API_ROUTE_PARAMETERS
+                }
+                handler_wrappers: list[RouteHandlerWrapper] = []
+                # `None` inherits the controller's limit and `False` opts out of it.
+                rate_limit: RateLimit | Literal[False] | None = (
+                    controller.rate_limit
+                    if route.rate_limit is None
+                    else route.rate_limit
+                )
+                if isinstance(rate_limit, RateLimit):
+                    handler_wrappers.append(RateLimiter(rate_limit).wrap_handler)
+                if not route.compress:
+                    handler_wrappers.append(skip_compression)
+                if route.etag_version is not None and not iscoroutinefunction(
+                    getattr(controller.type_, route.etag_version, None)
+                ):
+                    raise FastAPIError(
+                        f"{controller.type_.__qualname__}.{route.etag_version} must "
+                        f"be an async method to version {method.__qualname__}"
+                    )
+                if route.etag or route.etag_version is not None:
+                    conditional = ConditionalGet(
+                        weak=route.weak_etag,
+                        version=self.__create_dispatch(controller, route.etag_version)
+                        if route.etag_version is not None
+                        else None,
+                    )
+                    handler_wrappers.append(conditional.wrap_handler)
+                cached: Cached | None = Cached.get_or_none(method)
+                if cached is not None:
+                    cache = ResponseCache(
+                        ttl=cached.ttl,
+                        max_entries=cached.max_entries,
+                        headers=cached.headers,
+                        key=cached.key,
+                    )
+                    self.__container.get(ResponseCacheRegistry).register(
+                        cached.name or method.__qualname__, cache
+                    )
+                    handler_wrappers.append(cache.wrap_handler)
+                if route.coalesce:
+                    single_flight = SingleFlight(headers=route.coalesce_headers)
+                    handler_wrappers.append(single_flight.wrap_handler)
+                max_concurrency: int | Literal[False] | None = (
+                    controller.max_concurrency
+                    if route.max_concurrency is None
+                    else route.max_concurrency
+                )
+                if max_concurrency is not None and max_concurrency is not False:
+                    # Inside the cache and coalescing wrappers, so only requests
+                    # that actually reach the controller take a slot.
+                    limiter = ConcurrencyLimiter(max_concurrency)
+                    handler_wrappers.append(limiter.wrap_handler)
+                if route.validate_raw_body:
+                    handler_wrappers.append(validate_raw_body)
+                route_options["route_class_override"] = create_route_class(
+                    route.route_class_override, handler_wrappers
+                )
+
+                # `None` inherits the controller's deadline and `False` opts out.
+                route_timeout: float | Literal[False] | None = (
+                    controller.timeout if route.timeout is None else route.timeout
+                )
+                timeout: float | None = (
+                    None if route_timeout is False else route_timeout
+                )
+                if isinstance(route, ServerSentEventsRoute):
+                    if not isasyncgenfunction(method):
+                        raise FastAPIError(
+                            f"{method.__qualname__} must be an async generator "
+                            "to serve server-sent events"
+                        )
+                    endpoint = self.__create_stream_endpoint(
+                        controller,
+                        name,
+                        method,
+                        EventStreamRenderer(route.retry, route.heartbeat),
+                        route.execution,
+                    )
+                    route_options["response_class"] = EventStreamResponse
+                    route_options["response_model"] = None
+                elif isasyncgenfunction(method):
+                    stream_renderer = StreamRenderer(route, method)
+                    endpoint = self.__create_stream_endpoint(
+                        controller, name, method, stream_renderer, route.execution
+                    )
+                    # The endpoint returns the response itself, so these only
+                    # make the OpenAPI schema describe what is actually streamed.
+                    route_options["response_class"] = stream_renderer.response_class
+                    route_options["response_model"] = stream_renderer.response_model
+                elif batched is not None:
+                    endpoint = self.__create_batched_endpoint(
+                        controller,
+                        name,
+                        method,
+                        batched,
+                        endpoint_signature,
+                        renderer,
+                        timeout,
+                        route.execution,
+                    )
+                else:
+                    endpoint = self.__create_endpoint(
+                        controller,
+                        name,
+                        method,
+                        renderer,
+                        timeout,
+                        route.execution,
+                    )
+                router.add_api_route(endpoint=endpoint, **route_options)
             if websocket_route is not None:
                 # pylint: disable=line-too-long
                 self.__logger.debug(
@@ -85,20 +267,251 @@ class RegisterRoutesPostProcessor(IPostProcessor, ILoggerAware, IContainerAware)
                         [x.capitalize() for x in name.split("_")]
                     )
 
-                @wraps(method)
-                async def websocket_endpoint(
-                    *args: Any,
-                    method_name: str = name,
-                    controller_type: type[object] = controller.type_,
-                    context: IContainer = self.__container,
-                    **kwargs: Any,
-                ) -> Any:
-                    controller_instance = context.get(controller_type)
-                    method_to_call = getattr(controller_instance, method_name)
-                    return await method_to_call(*args, **kwargs)
-
+                websocket_endpoint = self.__create_endpoint(controller, name, method)
+                if websocket_route.codec is not None:
+                    websocket_endpoint = with_codec(
+                        websocket_endpoint,
+                        method,
+                        websocket_route.codec,
+                        websocket_route.batch_window,
+                    )
+                # Wraps the codec so liveness and accounting see raw frames.
+                websocket_endpoint = monitor(
+                    websocket_endpoint,
+                    method,
+                    self.__container.get(WebSocketRegistry).get(
+                        f"{controller.prefix}{websocket_route.path}"
+                    ),
+                    websocket_route.idle_timeout,
+                )
                 router.add_api_websocket_route(
-                    endpoint=websocket_endpoint, **asdict(websocket_route)
+                    endpoint=websocket_endpoint,
+                    **{
+                        key: value
+                        for key, value in asdict(websocket_route).items()
+                        if key in API_WEBSOCKET_ROUTE_PARAMETERS
+                    },
                 )
         fast_api.include_router(router)
         return pod
+
+    def __get_settings(self) -> SpakkyFastAPISettings:
+        if self.__container.contains(SpakkyFastAPISettings):
+            return self.__container.get(SpakkyFastAPISettings)
+        return SpakkyFastAPISettings()
+
+    def __ensure_picklable(self, method: Callable[..., Any]) -> None:
+        # Calls ship the bound method, and with it the controller and its
+        # injected pods, to a worker process, so find out now rather than on
+        # the first request.
+        try:
+            dumps(method)
+        except (PicklingError, TypeError, AttributeError) as e:
+            raise FastAPIError(
+                f"{method.__qualname__} runs in a process pool, so its "
+                "controller must be picklable"
+            ) from e
+
+    def __can_render(
+        self,
+        route: Route,
+        method: Callable[..., Any],
+        response_class: type[Response],
+        trusted_return: bool,
+    ) -> bool:
+        if route.response_model is None:
+            return False
+        if not issubclass(response_class, JSONResponse):
+            return False
+        if not issubclass(response_class, ORJSONResponse) and not trusted_return:
+            return False
+        if not is_body_allowed_for_status_code(route.status_code):
+            return False
+        if route.dependencies:
+            return False
+        # FastAPI only merges status code and headers set on an injected
+        # `Response` into responses it renders itself, so leave those routes alone.
+        for parameter in signature(method).parameters.values():
+            if isinstance(parameter.default, params.Depends):
+                return False
+            if isclass(parameter.annotation) and issubclass(
+                parameter.annotation, Response
+            ):
+                return False
+        return True
+
+    def __create_binding(
+        self, controller: ApiController, method_name: str
+    ) -> Callable[[], Callable[..., Any]]:
+        container: IContainer = self.__container
+        controller_type: type[object] = controller.type_
+        if controller.scope != Pod.Scope.SINGLETON:
+
+            def bind() -> Callable[..., Any]:
+                return getattr(container.get(controller_type), method_name)
+
+            return bind
+
+        method_to_call: Callable[..., Any] | None = None
+
+        def bind_singleton() -> Callable[..., Any]:
+            nonlocal method_to_call
+            if method_to_call is None:
+                method_to_call = getattr(container.get(controller_type), method_name)
+            return method_to_call
+
+        return bind_singleton
+
+    def __create_dispatch(
+        self,
+        controller: ApiController,
+        method_name: str,
+        execution: ExecutionMode | None = None,
+    ) -> Callable[..., Awaitable[Any]]:
+        container: IContainer = self.__container
+        controller_type: type[object] = controller.type_
+        bind = self.__create_binding(controller, method_name)
+        if isasyncgenfunction(getattr(controller_type, method_name)):
+            if execution not in (None, ExecutionMode.EVENT_LOOP):
+                raise FastAPIError(
+                    f"{controller_type.__qualname__}.{method_name} streams from "
+                    "the event loop and cannot run in a worker"
+                )
+
+            # The generator is only created here; the response consumes it.
+            async def stream_dispatch(*args: Any, **kwargs: Any) -> Any:
+                return bind()(*args, **kwargs)
+
+            return stream_dispatch
+
+        is_async: bool = iscoroutinefunction(getattr(controller_type, method_name))
+        if execution is None:
+            # Plain `def` methods follow FastAPI's convention and run on threads.
+            execution = ExecutionMode.EVENT_LOOP if is_async else ExecutionMode.THREAD
+
+        if execution != ExecutionMode.EVENT_LOOP:
+            pool: ExecutorPool = container.get(ExecutorRegistry).get(execution)
+            if (
+                execution == ExecutionMode.PROCESS
+                and controller.scope == Pod.Scope.SINGLETON
+            ):
+                # The controller never changes, so it is pickled on first call
+                # and each worker unpickles it once. Other scopes resolve a new
+                # controller per request and pay its full serialization.
+                payload: bytes | None = None
+
+                async def pickled_dispatch(*args: Any, **kwargs: Any) -> Any:
+                    nonlocal payload
+                    if payload is None:
+                        payload = dumps(bind())
+                    return await pool.run(call_pickled, payload, *args, **kwargs)
+
+                return pickled_dispatch
+
+            async def offloaded_dispatch(*args: Any, **kwargs: Any) -> Any:
+                return await pool.run(bind(), *args, **kwargs)
+
+            return offloaded_dispatch
+
+        if not is_async:
+
+            async def blocking_dispatch(*args: Any, **kwargs: Any) -> Any:
+                return bind()(*args, **kwargs)
+
+            return blocking_dispatch
+
+        if controller.scope != Pod.Scope.SINGLETON:
+            # Inlined rather than going through `bind`, as this runs per request.
+            async def dispatch(*args: Any, **kwargs: Any) -> Any:
+                controller_instance = container.get(controller_type)
+                return await getattr(controller_instance, method_name)(*args, **kwargs)
+
+            return dispatch
+
+        # Singleton controllers never change once created, so the bound method is
+        # resolved on first call and every later request is a single await.
+        method_to_call: Callable[..., Awaitable[Any]] | None = None
+
+        async def singleton_dispatch(*args: Any, **kwargs: Any) -> Any:
+            nonlocal method_to_call
+            if method_to_call is None:
+                method_to_call = getattr(container.get(controller_type), method_name)
+            return await method_to_call(*args, **kwargs)
+
+        return singleton_dispatch
+
+    def __create_endpoint(
+        self,
+        controller: ApiController,
+        method_name: str,
+        method: Callable[..., Awaitable[Any]],
+        renderer: ResponseRenderer | None = None,
+        timeout: float | None = None,
+        execution: ExecutionMode | None = None,
+    ) -> Callable[..., Awaitable[Any]]:
+        dispatch = self.__create_dispatch(controller, method_name, execution)
+        if timeout is not None:
+            dispatch = with_deadline(dispatch, timeout)
+        if renderer is None:
+            return wraps(method)(dispatch)
+
+        @wraps(method)
+        async def endpoint(*args: Any, **kwargs: Any) -> Any:
+            return renderer.render(await dispatch(*args, **kwargs))
+
+        return endpoint
+
+    def __create_batched_endpoint(
+        self,
+        controller: ApiController,
+        method_name: str,
+        method: Callable[..., Awaitable[Any]],
+        batched: Batched,
+        endpoint_signature: Signature,
+        renderer: ResponseRenderer | None = None,
+        timeout: float | None = None,
+        execution: ExecutionMode | None = None,
+    ) -> Callable[..., Awaitable[Any]]:
+        if controller.scope != Pod.Scope.SINGLETON:
+            raise FastAPIError(
+                f"{method.__qualname__} batches calls across requests, so its "
+                "controller must be a singleton"
+            )
+        load_batch: Callable[..., Awaitable[Any]] = self.__create_dispatch(
+            controller, method_name, execution
+        )
+        if timeout is not None:
+            load_batch = with_deadline(load_batch, timeout)
+        batcher = Batcher(
+            load_batch,
+            max_size=batched.max_size,
+            max_wait=batched.max_wait_ms / 1000,
+        )
+        load: Callable[..., Awaitable[Any]] = batcher.load
+        if timeout is not None:
+            load = with_deadline(load, timeout)
+        key_name: str = next(iter(endpoint_signature.parameters))
+
+        @wraps(method)
+        async def endpoint(**kwargs: Any) -> Any:
+            value: Any = await load(kwargs[key_name])
+            return value if renderer is None else renderer.render(value)
+
+        setattr(endpoint, "__signature__", endpoint_signature)
+        return endpoint
+
+    def __create_stream_endpoint(
+        self,
+        controller: ApiController,
+        method_name: str,
+        method: Callable[..., AsyncGenerator[Any, None]],
+        renderer: StreamRenderer | EventStreamRenderer,
+        execution: ExecutionMode | None = None,
+    ) -> Callable[..., Awaitable[Any]]:
+        dispatch = self.__create_dispatch(controller, method_name, execution)
+
+        @wraps(method)
+        async def endpoint(*args: Any, **kwargs: Any) -> Any:
+            return renderer.render(await dispatch(*args, **kwargs))
+
+        return endpoint
@@ -0,0 +1,106 @@
+from inspect import isclass
+from typing import Any, get_args, get_origin
+
+from fastapi import Response
+from fastapi.exceptions import ResponseValidationError
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+from spakky_fastapi.routes.route import Route
+
+
+def is_model(type_: Any) -> bool:
+    return isclass(type_) and issubclass(type_, BaseModel)
+
+
+class ResponseRenderer:
+    __adapter: TypeAdapter[Any]
+    __trusted_type: type | None
+    __trusted_element_type: type[BaseModel] | None
+    __media_type: str | None
+    __status_code: int
+    __include: Any
+    __exclude: Any
+    __by_alias: bool
+    __exclude_unset: bool
+    __exclude_defaults: bool
+    __exclude_none: bool
+
+    def __init__(
+        self,
+        route: Route,
+        response_class: type[Response],
+        trusted: bool = False,
+    ) -> None:
+        self.__adapter = TypeAdapter(route.response_model)
+        self.__trusted_type = None
+        self.__trusted_element_type = None
+        if trusted:
+            self.__set_trusted_type(route.response_model)
+        self.__media_type = response_class.media_type
+        self.__status_code = route.status_code or 200
+        self.__include = route.response_model_include
+        self.__exclude = route.response_model_exclude
+        self.__by_alias = route.response_model_by_alias
+        self.__exclude_unset = route.response_model_exclude_unset
+        self.__exclude_defaults = route.response_model_exclude_defaults
+        self.__exclude_none = route.response_model_exclude_none
+
+    def render(self, content: Any) -> Response:
+        if isinstance(content, Response):
+            return content
+        if self.__is_trusted(content):
+            value = content
+        else:
+            value = self.__validate(content)
+        return Response(
+            content=self.__adapter.dump_json(
+                value,
+                include=self.__include,
+                exclude=self.__exclude,
+                by_alias=self.__by_alias,
+                exclude_unset=self.__exclude_unset,
+                exclude_defaults=self.__exclude_defaults,
+                exclude_none=self.__exclude_none,
+            ),
+            status_code=self.__status_code,
+            media_type=self.__media_type,
+        )
+
+    def __set_trusted_type(self, response_model: Any) -> None:
+        origin = get_origin(response_model)
+        if origin is None:
+            if is_model(response_model):
+                self.__trusted_type = response_model
+            return
+        # Containers are only trusted when every element is an instance of the
+        # declared model; anything else would be serialized unvalidated.
+        arguments = get_args(response_model)
+        if origin is list and len(arguments) == 1:
+            element_type = arguments[0]
+        elif origin is tuple and len(arguments) == 2 and arguments[1] is Ellipsis:
+            element_type = arguments[0]
+        else:
+            return
+        if is_model(element_type):
+            self.__trusted_type = origin
+            self.__trusted_element_type = element_type
+
+    def __is_trusted(self, content: Any) -> bool:
+        if self.__trusted_type is None or not isinstance(content, self.__trusted_type):
+            return False
+        element_type = self.__trusted_element_type
+        if element_type is None:
+            return True
+        return all(isinstance(element, element_type) for element in content)
+
+    def __validate(self, content: Any) -> Any:
+        try:
+            return self.__adapter.validate_python(content, from_attributes=True)
+        except ValidationError as e:
+            raise ResponseValidationError(
+                errors=[
+                    {**error, "loc": ("response", *error["loc"])}
+                    for error in e.errors(include_url=False)
+                ],
+                body=content,
+            ) from e
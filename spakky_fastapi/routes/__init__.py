@@ -1,3 +1,5 @@
+from .batched import batched
+from .cached import cached
 from .delete import delete
 from .get import get
 from .head import head
@@ -6,9 +8,12 @@ from .patch import patch
 from .post import post
 from .put import put
 from .route import route
+from .sse import sse
 from .websocket import websocket
 
 __all__ = [
+    "batched",
+    "cached",
     "delete",
     "get",
     "head",
@@ -17,5 +22,6 @@ __all__ = [
     "post",
     "put",
     "route",
+    "sse",
     "websocket",
 ]
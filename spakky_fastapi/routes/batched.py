@@ -0,0 +1,21 @@
+from dataclasses import dataclass
+from typing import Callable
+
+from spakky.core.annotation import FunctionAnnotation
+from spakky.core.types import FuncT
+
+
+@dataclass
+class Batched(FunctionAnnotation):
+    max_size: int = 100
+    max_wait_ms: float = 5.0
+
+
+def batched(
+    max_size: int = 100,
+    max_wait_ms: float = 5.0,
+) -> Callable[[FuncT], FuncT]:
+    return Batched(
+        max_size=max_size,
+        max_wait_ms=max_wait_ms,
+    )
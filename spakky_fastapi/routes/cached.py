@@ -0,0 +1,31 @@
+from dataclasses import dataclass
+from typing import Callable, Hashable, Sequence
+
+from fastapi import Request
+from spakky.core.annotation import FunctionAnnotation
+from spakky.core.types import FuncT
+
+
+@dataclass
+class Cached(FunctionAnnotation):
+    ttl: float
+    max_entries: int = 1024
+    headers: Sequence[str] = ()
+    key: Callable[[Request], Hashable] | None = None
+    name: str | None = None
+
+
+def cached(
+    ttl: float,
+    max_entries: int = 1024,
+    headers: Sequence[str] = (),
+    key: Callable[[Request], Hashable] | None = None,
+    name: str | None = None,
+) -> Callable[[FuncT], FuncT]:
+    return Cached(
+        ttl=ttl,
+        max_entries=max_entries,
+        headers=headers,
+        key=key,
+        name=name,
+    )
@@ -1,12 +1,21 @@
-from typing import Any, Callable, Sequence
+from typing import Any, Callable, Literal, Sequence
 
 from fastapi import Response, params
+from fastapi.datastructures import Default
 from fastapi.responses import JSONResponse
 from fastapi.routing import APIRoute
 from spakky.core.types import FuncT
 from starlette.routing import Route as StarletteRoute
 
-from spakky_fastapi.routes.route import DictIntStrAny, HTTPMethod, SetIntStr, route
+from spakky_fastapi.limiting import RateLimit
+from spakky_fastapi.routes.route import (
+    DictIntStrAny,
+    ExecutionMode,
+    HTTPMethod,
+    SetIntStr,
+    StreamFormat,
+    route,
+)
 
 
 def patch(
@@ -28,11 +37,20 @@ def patch(
     response_model_exclude_defaults: bool = False,
     response_model_exclude_none: bool = False,
     include_in_schema: bool = True,
-    response_class: type[Response] = JSONResponse,
+    response_class: type[Response] = Default(JSONResponse),
     name: str | None = None,
     route_class_override: type[APIRoute] | None = None,
     callbacks: list[StarletteRoute] | None = None,
     openapi_extra: dict[str, Any] | None = None,
+    validate_raw_body: bool = False,
+    trusted_return: bool | None = None,
+    compress: bool = True,
+    stream_format: StreamFormat = StreamFormat.NDJSON,
+    rate_limit: RateLimit | Literal[False] | None = None,
+    max_concurrency: int | Literal[False] | None = None,
+    critical: bool = False,
+    timeout: float | Literal[False] | None = None,
+    execution: ExecutionMode | None = None,
 ) -> Callable[[FuncT], FuncT]:
     return route(
         path=path,
@@ -59,4 +77,13 @@ def patch(
         route_class_override=route_class_override,
         callbacks=callbacks,
         openapi_extra=openapi_extra,
+        validate_raw_body=validate_raw_body,
+        trusted_return=trusted_return,
+        compress=compress,
+        stream_format=stream_format,
+        rate_limit=rate_limit,
+        max_concurrency=max_concurrency,
+        critical=critical,
+        timeout=timeout,
+        execution=execution,
     )
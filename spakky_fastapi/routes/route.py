@@ -1,14 +1,17 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Callable, Sequence, TypeAlias
+from typing import Any, Callable, Literal, Sequence, TypeAlias
 
 from fastapi import Response, params
+from fastapi.datastructures import Default
 from fastapi.responses import JSONResponse
 from fastapi.routing import APIRoute
 from spakky.core.annotation import FunctionAnnotation
 from spakky.core.types import FuncT
 from starlette.routing import Route as StarletteRoute
 
+from spakky_fastapi.limiting import RateLimit
+
 SetIntStr: TypeAlias = set[int | str]
 DictIntStrAny: TypeAlias = dict[int | str, Any]
 
@@ -27,6 +30,23 @@ class HTTPMethod(str, Enum):
         return self.value
 
 
+class StreamFormat(str, Enum):
+    NDJSON = "ndjson"
+    JSON_ARRAY = "json"
+
+    def __repr__(self) -> str:
+        return self.value
+
+
+class ExecutionMode(str, Enum):
+    EVENT_LOOP = "event_loop"
+    THREAD = "thread"
+    PROCESS = "process"
+
+    def __repr__(self) -> str:
+        return self.value
+
+
 @dataclass
 class Route(FunctionAnnotation):
     path: str
@@ -48,11 +68,27 @@ class Route(FunctionAnnotation):
     response_model_exclude_defaults: bool = False
     response_model_exclude_none: bool = False
     include_in_schema: bool = True
-    response_class: type[Response] = JSONResponse
+    response_class: type[Response] = field(
+        default_factory=lambda: Default(JSONResponse)
+    )
     name: str | None = None
     route_class_override: type[APIRoute] | None = None
     callbacks: list[StarletteRoute] | None = None
     openapi_extra: dict[str, Any] | None = None
+    validate_raw_body: bool = False
+    trusted_return: bool | None = None
+    etag: bool = False
+    weak_etag: bool = False
+    etag_version: str | None = None
+    coalesce: bool = False
+    coalesce_headers: Sequence[str] = ()
+    compress: bool = True
+    stream_format: StreamFormat = StreamFormat.NDJSON
+    rate_limit: RateLimit | Literal[False] | None = None
+    max_concurrency: int | Literal[False] | None = None
+    critical: bool = False
+    timeout: float | Literal[False] | None = None
+    execution: ExecutionMode | None = None
 
 
 def route(
@@ -75,11 +111,25 @@ def route(
     response_model_exclude_defaults: bool = False,
     response_model_exclude_none: bool = False,
     include_in_schema: bool = True,
-    response_class: type[Response] = JSONResponse,
+    response_class: type[Response] = Default(JSONResponse),
     name: str | None = None,
     route_class_override: type[APIRoute] | None = None,
     callbacks: list[StarletteRoute] | None = None,
     openapi_extra: dict[str, Any] | None = None,
+    validate_raw_body: bool = False,
+    trusted_return: bool | None = None,
+    etag: bool = False,
+    weak_etag: bool = False,
+    etag_version: str | None = None,
+    coalesce: bool = False,
+    coalesce_headers: Sequence[str] = (),
+    compress: bool = True,
+    stream_format: StreamFormat = StreamFormat.NDJSON,
+    rate_limit: RateLimit | Literal[False] | None = None,
+    max_concurrency: int | Literal[False] | None = None,
+    critical: bool = False,
+    timeout: float | Literal[False] | None = None,
+    execution: ExecutionMode | None = None,
 ) -> Callable[[FuncT], FuncT]:
     def wrapper(method: FuncT) -> FuncT:
         return Route(
@@ -107,6 +157,20 @@ def route(
             route_class_override=route_class_override,
             callbacks=callbacks,
             openapi_extra=openapi_extra,
+            validate_raw_body=validate_raw_body,
+            trusted_return=trusted_return,
+            etag=etag,
+            weak_etag=weak_etag,
+            etag_version=etag_version,
+            coalesce=coalesce,
+            coalesce_headers=coalesce_headers,
+            compress=compress,
+            stream_format=stream_format,
+            rate_limit=rate_limit,
+            max_concurrency=max_concurrency,
+            critical=critical,
+            timeout=timeout,
+            execution=execution,
         )(method)
 
     return wrapper
@@ -0,0 +1,51 @@
+from dataclasses import dataclass
+from typing import Any, Callable, Sequence
+
+from fastapi import params
+from spakky.core.types import FuncT
+
+from spakky_fastapi.routes.route import HTTPMethod, Route
+from spakky_fastapi.streaming import EventStreamResponse
+
+
+# Reconnecting clients send the last id they saw in the `Last-Event-ID` header,
+# which a route reads by declaring `last_event_id: str | None = Header(None)`.
+@dataclass
+class ServerSentEventsRoute(Route):
+    retry: int | None = None
+    heartbeat: float | None = 15.0
+
+
+def sse(
+    path: str,
+    retry: int | None = None,
+    heartbeat: float | None = 15.0,
+    tags: list[str] | None = None,
+    dependencies: Sequence[params.Depends] | None = None,
+    summary: str | None = None,
+    description: str | None = None,
+    deprecated: bool | None = None,
+    operation_id: str | None = None,
+    include_in_schema: bool = True,
+    name: str | None = None,
+    openapi_extra: dict[str, Any] | None = None,
+) -> Callable[[FuncT], FuncT]:
+    def wrapper(method: FuncT) -> FuncT:
+        return ServerSentEventsRoute(
+            path=path,
+            retry=retry,
+            heartbeat=heartbeat,
+            tags=tags,
+            dependencies=dependencies,
+            summary=summary,
+            description=description,
+            deprecated=deprecated,
+            methods=[HTTPMethod.GET],
+            operation_id=operation_id,
+            include_in_schema=include_in_schema,
+            response_class=EventStreamResponse,
+            name=name,
+            openapi_extra=openapi_extra,
+        )(method)
+
+    return wrapper
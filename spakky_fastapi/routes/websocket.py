@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from enum import Enum
 from typing import Any, Callable, Sequence, TypeAlias
 
 from fastapi import params
@@ -9,20 +10,37 @@ SetIntStr: TypeAlias = set[int | str]
 DictIntStrAny: TypeAlias = dict[int | str, Any]
 
 
+class WebSocketCodec(str, Enum):
+    JSON = "json"
+    MSGPACK = "msgpack"
+
+    def __repr__(self) -> str:
+        return self.value
+
+
 @dataclass
 class WebSocketRoute(FunctionAnnotation):
     path: str
     name: str | None = None
     dependencies: Sequence[params.Depends] | None = None
+    codec: WebSocketCodec | None = None
+    batch_window: float | None = None
+    idle_timeout: float | None = None
 
 
 def websocket(
     path: str,
     name: str | None = None,
     dependencies: Sequence[params.Depends] | None = None,
+    codec: WebSocketCodec | None = None,
+    batch_window: float | None = None,
+    idle_timeout: float | None = None,
 ) -> Callable[[FuncT], FuncT]:
     return WebSocketRoute(
         path=path,
         name=name,
         dependencies=dependencies,
+        codec=codec,
+        batch_window=batch_window,
+        idle_timeout=idle_timeout,
     )
@@ -0,0 +1,109 @@
+from email.message import Message
+from typing import Any, Callable, ClassVar, Coroutine, Hashable, Sequence, TypeAlias
+
+from fastapi import Request, Response, params
+from fastapi.dependencies.utils import get_flat_dependant
+from fastapi.exceptions import RequestValidationError
+from fastapi.routing import APIRoute
+from pydantic import TypeAdapter, ValidationError
+from starlette.routing import BaseRoute, Match, Router
+from starlette.types import Scope
+
+RouteHandler: TypeAlias = Callable[[Request], Coroutine[Any, Any, Response]]
+RouteHandlerWrapper: TypeAlias = Callable[[APIRoute, RouteHandler], RouteHandler]
+
+
+class SpakkyAPIRoute(APIRoute):
+    handler_wrappers: ClassVar[tuple[RouteHandlerWrapper, ...]] = ()
+
+    def get_route_handler(self) -> RouteHandler:
+        handler = super().get_route_handler()
+        # The first wrapper is the outermost one, so it sees the request first.
+        for wrapper in reversed(self.handler_wrappers):
+            handler = wrapper(self, handler)
+        return handler
+
+
+def create_route_class(
+    route_class: type[APIRoute] | None,
+    handler_wrappers: Sequence[RouteHandlerWrapper],
+) -> type[APIRoute] | None:
+    if not handler_wrappers:
+        return route_class
+    base: type[APIRoute] = route_class or APIRoute
+    if issubclass(base, SpakkyAPIRoute):
+        return type(
+            base.__name__,
+            (base,),
+            {"handler_wrappers": (*base.handler_wrappers, *handler_wrappers)},
+        )
+    return type(
+        f"Spakky{base.__name__}",
+        (SpakkyAPIRoute, base),
+        {"handler_wrappers": tuple(handler_wrappers)},
+    )
+
+
+def match_route(router: Router, scope: Scope) -> BaseRoute | None:
+    for route in router.routes:
+        match, _ = route.matches(scope)
+        if match is Match.FULL:
+            return route
+    return None
+
+
+def has_body(response: Response) -> bool:
+    # Streaming and file responses render their body lazily while being sent.
+    return isinstance(getattr(response, "body", None), (bytes, memoryview))
+
+
+def get_request_key(request: Request, headers: Sequence[str] = ()) -> Hashable:
+    return (
+        request.method,
+        request.url.path,
+        tuple(sorted(request.query_params.multi_items())),
+        tuple(request.headers.get(header) for header in headers),
+    )
+
+
+def is_json_content_type(content_type: str | None) -> bool:
+    if content_type is None:
+        return True
+    message = Message()
+    message["content-type"] = content_type
+    if message.get_content_maintype() != "application":
+        return False
+    subtype: str = message.get_content_subtype()
+    return subtype == "json" or subtype.endswith("+json")
+
+
+def validate_raw_body(route: APIRoute, handler: RouteHandler) -> RouteHandler:
+    body_params = get_flat_dependant(route.dependant).body_params
+    if len(body_params) != 1:
+        return handler
+    field_info = body_params[0].field_info
+    if isinstance(field_info, params.Form) or getattr(field_info, "embed", False):
+        return handler
+
+    adapter: TypeAdapter[Any] = TypeAdapter(field_info.annotation)
+
+    async def app(request: Request) -> Response:
+        if is_json_content_type(request.headers.get("content-type")):
+            body: bytes = await request.body()
+            if body:
+                try:
+                    value = adapter.validate_json(body)
+                except ValidationError as e:
+                    raise RequestValidationError(
+                        [
+                            {**error, "loc": ("body", *error["loc"])}
+                            for error in e.errors(include_url=False)
+                        ],
+                        body=body,
+                    ) from e
+                # Starlette caches the decoded body on the request, so FastAPI
+                # picks up the validated model instead of parsing the bytes again.
+                request._json = value
+        return await handler(request)
+
+    return app
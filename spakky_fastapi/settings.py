@@ -0,0 +1,51 @@
+from dataclasses import dataclass, field
+from typing import Any
+
+from fastapi import Response
+
+from spakky_fastapi.metrics import DEFAULT_BUCKETS
+
+# Set on the scope of synthetic warm-up requests, so per-client state such as
+# rate-limit buckets and stall reports is not charged for them.
+WARM_UP_SCOPE_KEY: str = "spakky.warm_up"
+
+
+@dataclass(frozen=True)
+class WarmUpRequest:
+    path: str
+    method: str = "GET"
+    body: bytes = b""
+    headers: dict[str, str] = field(default_factory=dict)
+
+
+@dataclass
+class SpakkyFastAPISettings:
+    default_response_class: type[Response] | None = None
+    metrics_path: str | None = None
+    metrics_buckets: tuple[float, ...] = DEFAULT_BUCKETS
+    compression_encodings: tuple[str, ...] | None = None
+    compression_minimum_size: int = 500
+    compression_levels: dict[str, int] = field(default_factory=dict)
+    load_shedding_max_lag: float | None = None
+    load_shedding_max_in_flight: int | None = None
+    stall_threshold: float | None = None
+    thread_pool_size: int | None = None
+    process_pool_size: int | None = None
+    executor_max_pending: int | None = None
+    batch_path: str | None = None
+    batch_max_requests: int = 50
+    batch_max_concurrency: int = 10
+    warm_up: bool = False
+    warm_up_requests: tuple[WarmUpRequest, ...] = ()
+    websocket_ping_interval: float | None = 20.0
+    websocket_ping_timeout: float | None = 20.0
+
+    @property
+    def server_options(self) -> dict[str, Any]:
+        # WebSocket pings are control frames only the server can send, so the
+        # heartbeat is configured here and passed on, e.g. `uvicorn.run(app,
+        # **settings.server_options)`.
+        return {
+            "ws_ping_interval": self.websocket_ping_interval,
+            "ws_ping_timeout": self.websocket_ping_timeout,
+        }
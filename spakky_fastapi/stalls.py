@@ -0,0 +1,132 @@
+import sys
+from asyncio import AbstractEventLoop, get_running_loop
+from collections import deque
+from dataclasses import dataclass
+from inspect import unwrap
+from logging import Logger, getLogger
+from threading import Event, Thread, get_ident
+from time import monotonic
+from traceback import format_stack
+from types import CodeType, FrameType
+from typing import Any, Callable
+
+from spakky.pod.annotations.pod import Pod
+from spakky.pod.interfaces.aware.logger_aware import ILoggerAware
+
+DEFAULT_THRESHOLD: float = 0.1
+MAX_REPORTS: int = 100
+
+
+@dataclass(frozen=True)
+class StallReport:
+    handler: str | None
+    duration: float
+    stack: list[str]
+
+
+@Pod()
+class StallDetector(ILoggerAware):
+    __logger: Logger
+    __threshold: float
+    __handlers: dict[CodeType, str]
+    __reports: deque[StallReport]
+    __loop: AbstractEventLoop | None
+    __loop_thread: int | None
+    __last_tick: float
+    __stopped: Event
+
+    def __init__(self) -> None:
+        self.__logger = getLogger(__name__)
+        self.__threshold = DEFAULT_THRESHOLD
+        self.__handlers = {}
+        self.__reports = deque(maxlen=MAX_REPORTS)
+        self.__loop = None
+        self.__loop_thread = None
+        self.__last_tick = monotonic()
+        self.__stopped = Event()
+
+    @property
+    def reports(self) -> list[StallReport]:
+        return list(self.__reports)
+
+    def set_logger(self, logger: Logger) -> None:
+        self.__logger = logger
+
+    def set_threshold(self, threshold: float) -> None:
+        self.__threshold = threshold
+
+    def register(self, method: Callable[..., Any]) -> None:
+        function: Any = unwrap(getattr(method, "__func__", method))
+        code: CodeType | None = getattr(function, "__code__", None)
+        if code is not None:
+            self.__handlers[code] = method.__qualname__
+
+    def ensure_started(self) -> None:
+        loop: AbstractEventLoop = get_running_loop()
+        if loop is self.__loop:
+            return
+        self.stop()
+        self.__loop = loop
+        self.__loop_thread = get_ident()
+        self.__last_tick = monotonic()
+        self.__stopped = Event()
+        loop.call_soon(self.__tick, loop)
+        Thread(
+            target=self.__watch,
+            args=(loop, self.__stopped),
+            name="spakky-stall-detector",
+            daemon=True,
+        ).start()
+
+    def stop(self) -> None:
+        self.__stopped.set()
+        self.__loop = None
+
+    def __tick(self, loop: AbstractEventLoop) -> None:
+        if loop is not self.__loop:
+            return
+        self.__last_tick = monotonic()
+        loop.call_later(self.__threshold / 4, self.__tick, loop)
+
+    def __watch(self, loop: AbstractEventLoop, stopped: Event) -> None:
+        # Runs on its own thread, because a blocked loop cannot notice that it
+        # is blocked until whatever is blocking it has already returned.
+        stalled_since: float | None = None
+        handler: str | None = None
+        stack: list[str] = []
+        while not stopped.wait(self.__threshold / 4):
+            if loop.is_closed():
+                return
+            last_tick: float = self.__last_tick
+            if stalled_since is None:
+                if monotonic() - last_tick < self.__threshold:
+                    continue
+                # The stack has to be taken while the loop is still stuck in it.
+                stalled_since = last_tick
+                frame: FrameType | None = sys._current_frames().get(
+                    self.__loop_thread or 0
+                )
+                handler = self.__find_handler(frame)
+                stack = format_stack(frame) if frame is not None else []
+                del frame
+                self.__logger.warning(
+                    f"[{type(self).__name__}] Event loop blocked for more than "
+                    f"{self.__threshold:.3f}s in {handler or 'unknown handler'}\n"
+                    + "".join(stack)
+                )
+            elif last_tick != stalled_since:
+                report = StallReport(handler, last_tick - stalled_since, stack)
+                self.__reports.append(report)
+                self.__logger.warning(
+                    f"[{type(self).__name__}] Event loop was blocked for "
+                    f"{report.duration:.3f}s in {handler or 'unknown handler'}"
+                )
+                stalled_since, handler, stack = None, None, []
+
+    def __find_handler(self, frame: FrameType | None) -> str | None:
+        while frame is not None:
+            handler: str | None = self.__handlers.get(frame.f_code)
+            if handler is not None:
+                return handler
+            frame = frame.f_back
+        return None
@@ -3,8 +3,14 @@ from enum import Enum
 
 from spakky.stereotype.controller import Controller
 
+from spakky_fastapi.limiting import RateLimit
+
 
 @dataclass(eq=False)
 class ApiController(Controller):
     prefix: str
     tags: list[str | Enum] | None = None
+    trusted_return: bool = False
+    rate_limit: RateLimit | None = None
+    max_concurrency: int | None = None
+    timeout: float | None = None
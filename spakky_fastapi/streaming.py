@@ -0,0 +1,254 @@
+from asyncio import Future, Queue, Task, ensure_future, wait
+from dataclasses import dataclass
+from inspect import signature
+from typing import Any, AsyncGenerator, Callable, Mapping, get_args
+
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import TypeAdapter
+from starlette.background import BackgroundTask
+from starlette.types import Receive, Scope, Send
+
+from spakky_fastapi.routes.route import Route, StreamFormat
+
+EVENT_STREAM_HEADERS: dict[str, str] = {
+    "cache-control": "no-cache",
+    # Keeps reverse proxies such as nginx from buffering the stream.
+    "x-accel-buffering": "no",
+}
+HEARTBEAT: bytes = b": heartbeat\n\n"
+ANY_ADAPTER: TypeAdapter[Any] = TypeAdapter(Any)
+STREAM_END: object = object()
+
+
+@dataclass(frozen=True)
+class ServerSentEvent:
+    data: Any
+    event: str | None = None
+    id: str | None = None
+    retry: int | None = None
+
+
+class ClosingStreamingResponse(StreamingResponse):
+    body_iterator: AsyncGenerator[bytes, None]
+    __close_callbacks: list[Callable[[], None]]
+
+    def __init__(
+        self,
+        content: AsyncGenerator[bytes, None],
+        status_code: int = 200,
+        headers: Mapping[str, str] | None = None,
+        media_type: str | None = None,
+        background: BackgroundTask | None = None,
+    ) -> None:
+        super().__init__(content, status_code, headers, media_type, background)
+        self.__close_callbacks = []
+
+    def call_on_close(self, callback: Callable[[], None]) -> None:
+        self.__close_callbacks.append(callback)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            try:
+                # Starlette stops iterating when the client disconnects but leaves
+                # the generator suspended until it is garbage collected, so close
+                # it here to release the controller's resources right away.
+                await self.body_iterator.aclose()
+            finally:
+                for callback in self.__close_callbacks:
+                    callback()
+
+
+# JSONResponse is only a base so FastAPI documents the response model for these
+# media types; StreamingResponse comes first in the MRO and does all the work.
+class NDJSONStreamingResponse(ClosingStreamingResponse, JSONResponse):
+    media_type = "application/x-ndjson"
+
+
+class JSONArrayStreamingResponse(ClosingStreamingResponse, JSONResponse):
+    media_type = "application/json"
+
+
+class EventStreamResponse(ClosingStreamingResponse):
+    media_type = "text/event-stream"
+
+
+STREAM_RESPONSE_CLASSES: dict[StreamFormat, type[ClosingStreamingResponse]] = {
+    StreamFormat.NDJSON: NDJSONStreamingResponse,
+    StreamFormat.JSON_ARRAY: JSONArrayStreamingResponse,
+}
+
+
+class StreamRenderer:
+    __item_type: Any
+    __adapter: TypeAdapter[Any]
+    __format: StreamFormat
+    __status_code: int
+    __include: Any
+    __exclude: Any
+    __by_alias: bool
+    __exclude_unset: bool
+    __exclude_defaults: bool
+    __exclude_none: bool
+
+    def __init__(self, route: Route, method: Callable[..., Any]) -> None:
+        item_types: tuple[Any, ...] = get_args(signature(method).return_annotation)
+        self.__item_type = item_types[0] if item_types else Any
+        self.__adapter = TypeAdapter(self.__item_type)
+        self.__format = route.stream_format
+        self.__status_code = route.status_code or 200
+        # Response model options apply to each item, as the stream has no
+        # enclosing model.
+        self.__include = route.response_model_include
+        self.__exclude = route.response_model_exclude
+        self.__by_alias = route.response_model_by_alias
+        self.__exclude_unset = route.response_model_exclude_unset
+        self.__exclude_defaults = route.response_model_exclude_defaults
+        self.__exclude_none = route.response_model_exclude_none
+
+    @property
+    def response_class(self) -> type[ClosingStreamingResponse]:
+        return STREAM_RESPONSE_CLASSES[self.__format]
+
+    @property
+    def response_model(self) -> Any:
+        # Documents what the client receives: one item per line, or one array.
+        if self.__item_type is Any:
+            return None
+        if self.__format == StreamFormat.JSON_ARRAY:
+            return list[self.__item_type]  # type: ignore
+        return self.__item_type
+
+    def render(self, items: AsyncGenerator[Any, None]) -> StreamingResponse:
+        return self.response_class(
+            self.__encode(items),
+            status_code=self.__status_code,
+        )
+
+    async def __encode(
+        self, items: AsyncGenerator[Any, None]
+    ) -> AsyncGenerator[bytes, None]:
+        # One chunk per item keeps memory flat, and awaiting each send lets the
+        # server hold the generator back while the client is slow to read.
+        try:
+            if self.__format == StreamFormat.NDJSON:
+                async for item in items:
+                    yield self.__dump(item) + b"\n"
+                return
+            separator: bytes = b"["
+            async for item in items:
+                yield separator + self.__dump(item)
+                separator = b","
+            yield b"[]" if separator == b"[" else b"]"
+        finally:
+            await items.aclose()
+
+    def __dump(self, item: Any) -> bytes:
+        return self.__adapter.dump_json(
+            item,
+            include=self.__include,
+            exclude=self.__exclude,
+            by_alias=self.__by_alias,
+            exclude_unset=self.__exclude_unset,
+            exclude_defaults=self.__exclude_defaults,
+            exclude_none=self.__exclude_none,
+        )
+
+
+class EventStreamRenderer:
+    __retry: int | None
+    __heartbeat: float | None
+
+    def __init__(
+        self, retry: int | None = None, heartbeat: float | None = None
+    ) -> None:
+        self.__retry = retry
+        self.__heartbeat = heartbeat
+
+    def render(self, items: AsyncGenerator[Any, None]) -> StreamingResponse:
+        return EventStreamResponse(self.__encode(items), headers=EVENT_STREAM_HEADERS)
+
+    async def __encode(
+        self, items: AsyncGenerator[Any, None]
+    ) -> AsyncGenerator[bytes, None]:
+        producer: Task[None] | None = None
+        getter: Future[tuple[Any, Exception | None]] | None = None
+        try:
+            if self.__retry is not None:
+                yield f"retry: {self.__retry}\n\n".encode()
+            if self.__heartbeat is None:
+                async for item in items:
+                    yield encode_event(item)
+                return
+            # A single task drives the generator, so locks, cancel scopes and
+            # context variables it holds across a `yield` stay in one task while
+            # heartbeats are sent in between.
+            queue: Queue[tuple[Any, Exception | None]] = Queue(maxsize=1)
+            producer = ensure_future(produce(items, queue))
+            while True:
+                if getter is None:
+                    getter = ensure_future(queue.get())
+                if not (await wait({getter}, timeout=self.__heartbeat))[0]:
+                    yield HEARTBEAT
+                    continue
+                item, error = getter.result()
+                getter = None
+                if error is not None:
+                    raise error
+                if item is STREAM_END:
+                    return
+                yield encode_event(item)
+        finally:
+            pending: set[Future[Any]] = {
+                task
+                for task in (getter, producer)
+                if task is not None and not task.done()
+            }
+            for task in pending:
+                task.cancel()
+            # The generator can only be closed once the producer has left it.
+            # `wait` never raises the tasks' cancellation, so only our own
+            # cancellation can interrupt it, and the producer closes it then.
+            if pending:
+                await wait(pending)
+            await items.aclose()
+
+
+async def produce(
+    items: AsyncGenerator[Any, None], queue: Queue[tuple[Any, Exception | None]]
+) -> None:
+    try:
+        async for item in items:
+            await queue.put((item, None))
+    except Exception as e:  # pylint: disable=broad-exception-caught
+        await queue.put((STREAM_END, e))
+        return
+    finally:
+        await items.aclose()
+    await queue.put((STREAM_END, None))
+
+
+def encode_event(item: Any) -> bytes:
+    event: ServerSentEvent = (
+        item if isinstance(item, ServerSentEvent) else ServerSentEvent(data=item)
+    )
+    lines: list[str] = []
+    if event.id is not None:
+        lines.append(f"id: {strip_line_breaks(event.id)}")
+    if event.event is not None:
+        lines.append(f"event: {strip_line_breaks(event.event)}")
+    if event.retry is not None:
+        lines.append(f"retry: {event.retry}")
+    data: str = (
+        event.data
+        if isinstance(event.data, str)
+        else ANY_ADAPTER.dump_json(event.data).decode()
+    )
+    lines.extend(f"data: {line}" for line in data.splitlines() or [""])
+    return ("\n".join(lines) + "\n\n").encode()
+
+
+def strip_line_breaks(value: str) -> str:
+    # A line break would end the field early and let the value forge new fields.
+    return value.replace("\r", "").replace("\n", "")
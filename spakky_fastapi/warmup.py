@@ -0,0 +1,127 @@
+from asyncio import get_running_loop, locks
+from logging import Logger, getLogger
+from time import perf_counter
+from typing import Any
+
+from fastapi import FastAPI
+from spakky.pod.annotations.pod import Pod
+from spakky.pod.interfaces.application_context import IApplicationContext
+from spakky.pod.interfaces.aware.application_context_aware import (
+    IApplicationContextAware,
+)
+from spakky.pod.interfaces.aware.logger_aware import ILoggerAware
+from spakky.service.interfaces.service import IAsyncService
+from starlette.types import Message
+
+from spakky_fastapi.caching import ResponseCacheRegistry
+from spakky_fastapi.metrics import MetricsRegistry
+from spakky_fastapi.settings import (
+    WARM_UP_SCOPE_KEY,
+    SpakkyFastAPISettings,
+    WarmUpRequest,
+)
+from spakky_fastapi.stereotypes.api_controller import ApiController
+
+
+@Pod()
+class WarmUp(IAsyncService, IApplicationContextAware, ILoggerAware):
+    __application_context: IApplicationContext
+    __logger: Logger
+    __stop_event: locks.Event | None
+
+    def __init__(self) -> None:
+        self.__logger = getLogger(__name__)
+        self.__stop_event = None
+
+    def set_application_context(self, application_context: IApplicationContext) -> None:
+        self.__application_context = application_context
+
+    def set_logger(self, logger: Logger) -> None:
+        self.__logger = logger
+
+    def set_stop_event(self, stop_event: locks.Event) -> None:
+        self.__stop_event = stop_event
+
+    async def start_async(self) -> None:
+        if not self.__application_context.contains(SpakkyFastAPISettings):
+            return
+        settings = self.__application_context.get(SpakkyFastAPISettings)
+        if not settings.warm_up:
+            return
+        started: float = perf_counter()
+        controllers: set[object] = self.__application_context.find(
+            lambda x: isinstance(x, ApiController)
+        )
+        # Context-scoped controllers were only built to run their constructors
+        # once; the instances themselves belong to no request.
+        self.__application_context.clear_context()
+        api: FastAPI = self.__application_context.get(FastAPI)
+        if api.middleware_stack is None:
+            api.middleware_stack = api.build_middleware_stack()
+        api.openapi()
+        # Services start on spakky's own loop, not the one the server will run,
+        # so the requests below must not leave anything bound to this loop.
+        # Loop-bound helpers such as the lag monitor rebind on the first real
+        # request.
+        for request in settings.warm_up_requests:
+            status_code: int = await self.__request(api, request)
+            if status_code >= 500:
+                self.__logger.warning(
+                    f"[{type(self).__name__}] {request.method} {request.path} "
+                    f"answered {status_code} during warm-up"
+                )
+        if settings.warm_up_requests:
+            # Synthetic traffic would otherwise show up on every dashboard, and
+            # its responses would be served from cache to real clients.
+            if self.__application_context.contains(MetricsRegistry):
+                self.__application_context.get(MetricsRegistry).clear()
+            if self.__application_context.contains(ResponseCacheRegistry):
+                self.__application_context.get(ResponseCacheRegistry).clear()
+        self.__logger.info(
+            f"[{type(self).__name__}] Warmed up {len(controllers)} controllers and "
+            f"{len(settings.warm_up_requests)} requests in "
+            f"{perf_counter() - started:.3f}s"
+        )
+
+    async def stop_async(self) -> None:
+        pass
+
+    async def __request(self, api: FastAPI, request: WarmUpRequest) -> int:
+        path, _, query = request.path.partition("?")
+        scope: dict[str, Any] = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": request.method,
+            "scheme": "http",
+            "path": path,
+            "raw_path": path.encode(),
+            "root_path": "",
+            "query_string": query.encode(),
+            "headers": [
+                (b"host", b"localhost"),
+                (b"content-length", str(len(request.body)).encode()),
+                *((k.lower().encode(), v.encode()) for k, v in request.headers.items()),
+            ],
+            "client": None,
+            "server": ("localhost", 80),
+            WARM_UP_SCOPE_KEY: True,
+        }
+        received: bool = False
+        status_code: int = 500
+
+        async def receive() -> Message:
+            nonlocal received
+            if not received:
+                received = True
+                return {"type": "http.request", "body": request.body}
+            await get_running_loop().create_future()
+            return {"type": "http.disconnect"}  # pragma: no cover
+
+        async def send(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+
+        await api(scope, receive, send)
+        return status_code
@@ -0,0 +1,52 @@
+import asyncio
+from typing import Sequence
+
+from pydantic import BaseModel
+
+from spakky_fastapi.routes import batched, get
+from spakky_fastapi.stereotypes.api_controller import ApiController
+
+
+class Product(BaseModel):
+    id: int
+    name: str
+
+
+@ApiController("/batching")
+class BatchingController:
+    __batches: list[list[int]]
+    __cancelled: list[list[int]]
+
+    def __init__(self) -> None:
+        self.__batches = []
+        self.__cancelled = []
+
+    @batched(max_size=4, max_wait_ms=20)
+    @get("/items/{id}")
+    async def get_items(self, id: Sequence[int]) -> dict[int, Product]:
+        self.__batches.append(sorted(id))
+        return {x: Product(id=x, name=f"item-{x}") for x in id if x > 0}
+
+    @batched(max_wait_ms=20)
+    @get("/names")
+    async def get_names(self, id: list[int]) -> list[str]:
+        self.__batches.append(sorted(id))
+        return [f"name-{x}" for x in id]
+
+    @get("/batches")
+    async def get_batches(self) -> list[list[int]]:
+        return self.__batches
+
+    @batched(max_wait_ms=5)
+    @get("/slow/{id}", timeout=0.05)
+    async def get_slow(self, id: list[int]) -> list[int]:
+        try:
+            await asyncio.sleep(1)
+        except asyncio.CancelledError:
+            self.__cancelled.append(sorted(id))
+            raise
+        return id
+
+    @get("/cancelled")
+    async def get_cancelled(self) -> list[list[int]]:
+        return self.__cancelled
@@ -0,0 +1,50 @@
+from fastapi import Request
+from fastapi.responses import PlainTextResponse
+
+from spakky_fastapi.caching import ResponseCacheRegistry
+from spakky_fastapi.routes import cached, delete, get, post
+from spakky_fastapi.stereotypes.api_controller import ApiController
+
+
+@ApiController("/caching")
+class CachingController:
+    __caches: ResponseCacheRegistry
+    __count: int
+
+    def __init__(self, caches: ResponseCacheRegistry) -> None:
+        self.__caches = caches
+        self.__count = 0
+
+    @cached(ttl=60, name="counter")
+    @get("/counter", response_class=PlainTextResponse)
+    async def get_counter(self, offset: int = 0) -> str:
+        self.__count += 1
+        return str(self.__count + offset)
+
+    @cached(ttl=60, headers=["Accept-Language"], name="counter")
+    @get("/greeting")
+    async def get_greeting(self, request: Request) -> dict[str, str | int]:
+        self.__count += 1
+        return {
+            "language": request.headers.get("accept-language", "en"),
+            "count": self.__count,
+        }
+
+    @cached(ttl=0.05)
+    @get("/expiring", response_class=PlainTextResponse)
+    async def get_expiring(self) -> str:
+        self.__count += 1
+        return str(self.__count)
+
+    @cached(ttl=60, key=lambda request: "constant")
+    @get("/custom-key/{id}", response_class=PlainTextResponse)
+    async def get_with_custom_key(self, id: int) -> str:
+        return str(id)
+
+    @post("/counter")
+    async def invalidate_counter(self) -> None:
+        self.__caches.invalidate("counter")
+
+    @delete("/counter")
+    async def invalidate_counter_path(self) -> None:
+        self.__caches.invalidate("counter", path="/caching/counter")
@@ -0,0 +1,39 @@
+import asyncio
+from typing import AsyncGenerator
+
+from fastapi import Request
+from fastapi.responses import StreamingResponse
+
+from spakky_fastapi.routes import get
+from spakky_fastapi.stereotypes.api_controller import ApiController
+
+
+@ApiController("/coalescing")
+class CoalescingController:
+    __calls: int
+
+    def __init__(self) -> None:
+        self.__calls = 0
+
+    @get("/calls")
+    async def get_calls(self) -> int:
+        return self.__calls
+
+    @get("/slow", coalesce=True, coalesce_headers=["Accept-Language"])
+    async def get_slow(self, request: Request) -> dict[str, str | int]:
+        self.__calls += 1
+        await asyncio.sleep(0.1)
+        return {
+            "language": request.headers.get("accept-language", "en"),
+            "calls": self.__calls,
+        }
+
+    @get("/streaming", coalesce=True)
+    async def get_streaming(self) -> StreamingResponse:
+        self.__calls += 1
+        await asyncio.sleep(0.1)
+
+        async def generate() -> AsyncGenerator[bytes, None]:
+            yield b"streamed"
+
+        return StreamingResponse(generate())
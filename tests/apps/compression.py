@@ -0,0 +1,42 @@
+from typing import AsyncGenerator
+
+from fastapi.responses import PlainTextResponse, StreamingResponse
+
+from spakky_fastapi.routes import get
+from spakky_fastapi.stereotypes.api_controller import ApiController
+
+LARGE_TEXT: str = "Hello World! " * 100
+
+
+@ApiController("/compression")
+class CompressionController:
+    @get("/large")
+    async def get_large(self) -> dict[str, list[int]]:
+        return {"numbers": list(range(500))}
+
+    @get("/small", response_class=PlainTextResponse)
+    async def get_small(self) -> str:
+        return "Hello World!"
+
+    @get("/uncompressed", response_class=PlainTextResponse, compress=False)
+    async def get_uncompressed(self) -> str:
+        return LARGE_TEXT
+
+    @get("/tagged", response_class=PlainTextResponse, etag=True)
+    async def get_tagged(self) -> str:
+        return LARGE_TEXT
+
+    @get("/streaming")
+    async def get_streaming(self) -> StreamingResponse:
+        async def generate() -> AsyncGenerator[str, None]:
+            for _ in range(3):
+                yield LARGE_TEXT
+
+        return StreamingResponse(generate(), media_type="text/plain")
+
+    @get("/events")
+    async def get_events(self) -> StreamingResponse:
+        async def generate() -> AsyncGenerator[str, None]:
+            yield f"data: {LARGE_TEXT}\n\n"
+
+        return StreamingResponse(generate(), media_type="text/event-stream")
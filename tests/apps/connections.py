@@ -0,0 +1,37 @@
+import asyncio
+
+from fastapi import WebSocket, WebSocketDisconnect
+
+from spakky_fastapi.framing import CodecWebSocket
+from spakky_fastapi.routes import websocket
+from spakky_fastapi.routes.websocket import WebSocketCodec
+from spakky_fastapi.stereotypes.api_controller import ApiController
+
+
+@ApiController("/connections")
+class ConnectionsController:
+    @websocket("/echo")
+    async def echo(self, socket: WebSocket) -> None:
+        await socket.accept()
+        try:
+            async for message in socket.iter_text():
+                await socket.send_text(message)
+        except WebSocketDisconnect:
+            pass
+
+    @websocket("/idle", idle_timeout=0.1)
+    async def idle(self, socket: WebSocket) -> None:
+        await socket.accept()
+        try:
+            async for message in socket.iter_text():
+                await socket.send_text(message)
+        except WebSocketDisconnect:
+            pass
+
+    @websocket("/push", codec=WebSocketCodec.JSON)
+    async def push(self, socket: CodecWebSocket) -> None:
+        await socket.accept()
+        for i in range(12):
+            await socket.send_message(i)
+            await asyncio.sleep(0.05)
+        await socket.close()
@@ -0,0 +1,36 @@
+from asyncio import sleep
+from uuid import UUID, uuid4
+
+from spakky.pod.annotations.pod import Pod
+from spakky.pod.interfaces.aware.container_aware import IContainerAware
+from spakky.pod.interfaces.container import IContainer
+
+from spakky_fastapi.routes import get
+from spakky_fastapi.stereotypes.api_controller import ApiController
+
+
+@Pod(scope=Pod.Scope.CONTEXT)
+class RequestScope:
+    id: UUID
+
+    def __init__(self) -> None:
+        self.id = uuid4()
+
+
+@ApiController("/context", scope=Pod.Scope.CONTEXT)
+class ContextController(IContainerAware):
+    __container: IContainer
+    __request_scope: RequestScope
+
+    def __init__(self, request_scope: RequestScope) -> None:
+        self.__request_scope = request_scope
+
+    def set_container(self, container: IContainer) -> None:
+        self.__container = container
+
+    @get("/scope")
+    async def get_scope(self) -> list[UUID]:
+        before: UUID = self.__request_scope.id
+        await sleep(0.01)
+        after: UUID = self.__container.get(RequestScope).id
+        return [before, after]
@@ -0,0 +1,42 @@
+import asyncio
+
+from spakky_fastapi.deadlines import get_remaining_time
+from spakky_fastapi.routes import get
+from spakky_fastapi.stereotypes.api_controller import ApiController
+
+
+@ApiController("/deadlines", timeout=5.0)
+class DeadlinesController:
+    __cancelled: int
+
+    def __init__(self) -> None:
+        self.__cancelled = 0
+
+    @get("/remaining")
+    async def get_remaining(self) -> float | None:
+        return get_remaining_time()
+
+    @get("/unbounded", timeout=False)
+    async def get_unbounded(self) -> float | None:
+        return get_remaining_time()
+
+    @get("/short", timeout=0.5)
+    async def get_short(self) -> float | None:
+        return get_remaining_time()
+
+    @get("/slow", timeout=0.1)
+    async def get_slow(self) -> str:
+        try:
+            await asyncio.sleep(1)
+        except asyncio.CancelledError:
+            self.__cancelled += 1
+            raise
+        return "done"
+
+    @get("/cancelled")
+    async def get_cancelled(self) -> int:
+        return self.__cancelled
+
+    @get("/timeout-error", timeout=1.0)
+    async def get_timeout_error(self) -> str:
+        raise asyncio.TimeoutError()
@@ -1,8 +1,9 @@
 from datetime import timedelta
+from typing import AsyncIterator
 from uuid import UUID
 
 from fastapi import WebSocket
-from fastapi.responses import FileResponse, PlainTextResponse
+from fastapi.responses import FileResponse, PlainTextResponse, StreamingResponse
 from pydantic import BaseModel
 from spakky.aspects.logging import Logging
 from spakky.security.jwt import JWT
@@ -121,6 +122,15 @@ class DummyController:
     async def raise_error(self) -> None:
         raise ValueError("Error!")
 
+    @Logging()
+    @get("/error-while-streaming")
+    async def raise_error_while_streaming(self) -> StreamingResponse:
+        async def chunks() -> AsyncIterator[bytes]:
+            yield b"Hello "
+            raise ValueError("Error!")
+
+        return StreamingResponse(chunks(), media_type="text/plain")
+
 
 @UseCase()
 class DummyUseCase:
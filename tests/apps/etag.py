@@ -0,0 +1,50 @@
+from datetime import datetime, timezone
+
+from fastapi import Request
+from fastapi.responses import PlainTextResponse
+
+from spakky_fastapi.routes import get, post
+from spakky_fastapi.stereotypes.api_controller import ApiController
+
+
+@ApiController("/etag")
+class ETagController:
+    __version: int
+    __calls: int
+
+    def __init__(self) -> None:
+        self.__version = 1
+        self.__calls = 0
+
+    async def get_version(self, request: Request) -> str | None:
+        if request.query_params.get("unversioned"):
+            return None
+        return f"v{self.__version}"
+
+    async def get_modified_at(self, request: Request) -> datetime:
+        return datetime(2024, 1, 1, 12, 0, 0, 500, tzinfo=timezone.utc)
+
+    @get("/hashed", etag=True)
+    async def get_hashed(self) -> dict[str, str]:
+        return {"hello": "world"}
+
+    @get("/weak", etag=True, weak_etag=True, response_class=PlainTextResponse)
+    async def get_weak(self) -> str:
+        return "weak"
+
+    @get("/versioned", etag_version="get_version")
+    async def get_versioned(self) -> dict[str, int]:
+        self.__calls += 1
+        return {"version": self.__version, "calls": self.__calls}
+
+    @post("/versioned")
+    async def bump_version(self) -> None:
+        self.__version += 1
+
+    @get("/modified", etag_version="get_modified_at", response_class=PlainTextResponse)
+    async def get_modified(self) -> str:
+        return "modified"
+
+    @get("/missing", etag=True, status_code=201, response_class=PlainTextResponse)
+    async def get_missing(self) -> str:
+        return "created"
@@ -0,0 +1,39 @@
+import os
+import threading
+
+from spakky_fastapi.deadlines import get_remaining_time
+from spakky_fastapi.routes import get
+from spakky_fastapi.routes.route import ExecutionMode
+from spakky_fastapi.stereotypes.api_controller import ApiController
+
+
+@ApiController("/executors")
+class ExecutorsController:
+    __calls: int
+
+    def __init__(self) -> None:
+        self.__calls = 0
+
+    @get("/sync")
+    def get_sync(self) -> str:
+        return threading.current_thread().name
+
+    @get("/sync-on-loop", execution=ExecutionMode.EVENT_LOOP)
+    def get_sync_on_loop(self) -> str:
+        return threading.current_thread().name
+
+    @get("/async-on-thread", execution=ExecutionMode.THREAD, timeout=5.0)
+    async def get_async_on_thread(self) -> dict[str, str | float | None]:
+        return {
+            "thread": threading.current_thread().name,
+            "remaining": get_remaining_time(),
+        }
+
+    @get("/process", execution=ExecutionMode.PROCESS)
+    def get_process(self, n: int) -> dict[str, int]:
+        return {"pid": os.getpid(), "sum": sum(range(n))}
+
+    @get("/process-calls", execution=ExecutionMode.PROCESS)
+    def get_process_calls(self) -> int:
+        self.__calls += 1
+        return self.__calls
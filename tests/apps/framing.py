@@ -0,0 +1,68 @@
+from pydantic import BaseModel
+
+from spakky_fastapi.framing import CODECS, CodecWebSocket
+from spakky_fastapi.hub import WebSocketHub
+from spakky_fastapi.routes import post, websocket
+from spakky_fastapi.routes.websocket import WebSocketCodec
+from spakky_fastapi.stereotypes.api_controller import ApiController
+
+
+class Tick(BaseModel):
+    symbol: str
+    price: float
+
+
+@ApiController("/framing")
+class FramingController:
+    __hub: WebSocketHub
+
+    def __init__(self, hub: WebSocketHub) -> None:
+        self.__hub = hub
+
+    @websocket("/json", codec=WebSocketCodec.JSON)
+    async def echo_json(self, socket: CodecWebSocket) -> None:
+        await socket.accept()
+        tick: Tick = await socket.receive_message(Tick)
+        await socket.send_message(tick)
+        await socket.close()
+
+    @websocket("/batched", codec=WebSocketCodec.JSON, batch_window=60)
+    async def send_batched(self, socket: CodecWebSocket) -> None:
+        await socket.accept()
+        count: int = await socket.receive_message(int)
+        for i in range(count):
+            await socket.send_message({"sequence": i})
+        await socket.close()
+
+    @websocket("/unflushed", codec=WebSocketCodec.JSON, batch_window=60)
+    async def send_unflushed(self, socket: CodecWebSocket) -> None:
+        await socket.accept()
+        await socket.send_message("pending")
+
+    @post("/broadcast/{topic}")
+    async def broadcast(self, topic: str, tick: Tick) -> int:
+        return self.__hub.broadcast(topic, tick)
+
+
+if WebSocketCodec.MSGPACK in CODECS:
+
+    @ApiController("/framing")
+    class MsgPackFramingController:
+        __hub: WebSocketHub
+
+        def __init__(self, hub: WebSocketHub) -> None:
+            self.__hub = hub
+
+        @websocket("/msgpack", codec=WebSocketCodec.MSGPACK)
+        async def echo_msgpack(self, socket: CodecWebSocket) -> None:
+            await socket.accept()
+            async for tick in socket.iter_messages(Tick):
+                await socket.send_message(tick)
+
+        @websocket("/subscribe", codec=WebSocketCodec.MSGPACK)
+        async def subscribe(self, socket: CodecWebSocket) -> None:
+            await socket.accept()
+            async with self.__hub.connect(socket) as connection:
+                async for topic in socket.iter_messages(str):
+                    connection.subscribe(topic)
+                    connection.send({"subscribed": topic})
@@ -0,0 +1,30 @@
+from typing import Any
+
+from fastapi import WebSocket, WebSocketDisconnect
+
+from spakky_fastapi.hub import WebSocketHub
+from spakky_fastapi.routes import post, websocket
+from spakky_fastapi.stereotypes.api_controller import ApiController
+
+
+@ApiController("/hub")
+class HubController:
+    __hub: WebSocketHub
+
+    def __init__(self, hub: WebSocketHub) -> None:
+        self.__hub = hub
+
+    @websocket("/ws")
+    async def subscribe(self, socket: WebSocket) -> None:
+        await socket.accept()
+        async with self.__hub.connect(socket) as connection:
+            try:
+                async for topic in socket.iter_text():
+                    connection.subscribe(topic)
+                    connection.send({"subscribed": topic})
+            except WebSocketDisconnect:
+                pass
+
+    @post("/broadcast/{topic}")
+    async def broadcast(self, topic: str, data: dict[str, Any]) -> int:
+        return self.__hub.broadcast(topic, data)
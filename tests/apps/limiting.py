@@ -0,0 +1,40 @@
+import asyncio
+from typing import AsyncGenerator
+
+from spakky_fastapi.limiting import RateLimit
+from spakky_fastapi.routes import get
+from spakky_fastapi.stereotypes.api_controller import ApiController
+
+
+@ApiController("/limiting", rate_limit=RateLimit(rate=0.1, burst=2))
+class LimitingController:
+    @get("/default")
+    async def get_default(self) -> str:
+        return "ok"
+
+    @get("/per-key", rate_limit=RateLimit(rate=0.1, burst=1, header="X-Api-Key"))
+    async def get_per_key(self) -> str:
+        return "ok"
+
+    @get("/unlimited", rate_limit=False)
+    async def get_unlimited(self) -> str:
+        return "ok"
+
+    @get("/slow", rate_limit=RateLimit(rate=1000), max_concurrency=2)
+    async def get_slow(self) -> str:
+        await asyncio.sleep(0.1)
+        return "ok"
+
+
+@ApiController("/concurrency", max_concurrency=1)
+class ConcurrencyController:
+    @get("/unlimited", max_concurrency=False)
+    async def get_unlimited(self) -> str:
+        await asyncio.sleep(0.1)
+        return "ok"
+
+    @get("/stream")
+    async def get_stream(self) -> AsyncGenerator[int, None]:
+        yield 0
+        await asyncio.sleep(0.1)
+        yield 1
@@ -0,0 +1,16 @@
+import asyncio
+
+from spakky_fastapi.routes import get
+from spakky_fastapi.stereotypes.api_controller import ApiController
+
+
+@ApiController("/shedding")
+class LoadSheddingController:
+    @get("/slow")
+    async def get_slow(self) -> str:
+        await asyncio.sleep(0.2)
+        return "ok"
+
+    @get("/health", critical=True)
+    async def get_health(self) -> str:
+        return "ok"
@@ -0,0 +1,58 @@
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+from spakky_fastapi.routes import get
+from spakky_fastapi.stereotypes.api_controller import ApiController
+
+
+class Item(BaseModel):
+    id: int
+    name: str
+    tags: list[str]
+    description: str | None = None
+
+
+class Catalog(BaseModel):
+    title: str
+    items: list[Item]
+
+
+@ApiController("/rendering")
+class RenderingController:
+    @get("/catalog", response_model_exclude_none=True)
+    async def get_catalog(self) -> Catalog:
+        return Catalog(
+            title="Catalog",
+            items=[Item(id=i, name=f"Item {i}", tags=["a", "b"]) for i in range(3)],
+        )
+
+    @get("/catalog-as-dict")
+    async def get_catalog_as_dict(self) -> Catalog:
+        return {"title": "Catalog", "items": []}  # type: ignore
+
+    @get("/catalog-as-json-response", response_class=JSONResponse)
+    async def get_catalog_as_json_response(self) -> Catalog:
+        return Catalog(title="Catalog", items=[])
+
+    @get("/invalid-catalog")
+    async def get_invalid_catalog(self) -> Catalog:
+        return {"title": "Catalog"}  # type: ignore
+
+    @get("/items", trusted_return=True)
+    async def get_items(self) -> list[Item]:
+        return [Item(id=i, name=f"Item {i}", tags=[]) for i in range(3)]
+
+
+@ApiController("/trusted-rendering", trusted_return=True)
+class TrustedRenderingController:
+    @get("/catalog")
+    async def get_catalog(self) -> Catalog:
+        return Catalog(title="Catalog", items=[])
+
+    @get("/catalog-as-dict")
+    async def get_catalog_as_dict(self) -> Catalog:
+        return {"title": "Catalog", "items": []}  # type: ignore
+
+    @get("/untrusted-catalog", trusted_return=False)
+    async def get_untrusted_catalog(self) -> Catalog:
+        return Catalog(title="Catalog", items=[])
@@ -0,0 +1,26 @@
+import asyncio
+from typing import AsyncGenerator
+
+from fastapi import Header
+
+from spakky_fastapi.routes import sse
+from spakky_fastapi.stereotypes.api_controller import ApiController
+from spakky_fastapi.streaming import ServerSentEvent
+
+
+@ApiController("/sse")
+class ServerSentEventsController:
+    @sse("/events", retry=3000, heartbeat=None)
+    async def get_events(
+        self,
+        last_event_id: str | None = Header(default=None),
+    ) -> AsyncGenerator[ServerSentEvent | str, None]:
+        start: int = 0 if last_event_id is None else int(last_event_id) + 1
+        for i in range(start, 3):
+            yield ServerSentEvent(data={"n": i}, event="tick", id=str(i))
+        yield "multi\nline"
+
+    @sse("/quiet", heartbeat=0.05)
+    async def get_quiet(self) -> AsyncGenerator[str, None]:
+        await asyncio.sleep(0.12)
+        yield "done"
@@ -0,0 +1,34 @@
+import time
+
+from spakky_fastapi.routes import get
+from spakky_fastapi.stalls import StallDetector
+from spakky_fastapi.stereotypes.api_controller import ApiController
+
+
+def read_report() -> str:
+    # Stands in for a blocking library call made from a coroutine.
+    time.sleep(0.3)
+    return "done"
+
+
+@ApiController("/stalls")
+class StallsController:
+    __detector: StallDetector
+
+    def __init__(self, detector: StallDetector) -> None:
+        self.__detector = detector
+
+    @get("/blocking")
+    async def get_blocking(self) -> str:
+        return read_report()
+
+    @get("/reports")
+    async def get_reports(self) -> list[dict[str, str | float | None]]:
+        return [
+            {
+                "handler": report.handler,
+                "duration": report.duration,
+                "stack": "".join(report.stack),
+            }
+            for report in self.__detector.reports
+        ]
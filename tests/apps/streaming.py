@@ -0,0 +1,54 @@
+from typing import AsyncGenerator, AsyncIterator
+
+from pydantic import BaseModel, Field
+
+from spakky_fastapi.routes import get
+from spakky_fastapi.routes.route import StreamFormat
+from spakky_fastapi.stereotypes.api_controller import ApiController
+
+
+class Row(BaseModel):
+    id: int
+    label: str | None = Field(default=None, alias="name")
+
+
+@ApiController("/streaming")
+class StreamingController:
+    __closed: int
+
+    def __init__(self) -> None:
+        self.__closed = 0
+
+    @get("/closed")
+    async def get_closed(self) -> int:
+        return self.__closed
+
+    @get("/rows")
+    async def get_rows(self, count: int = 3) -> AsyncGenerator[Row, None]:
+        try:
+            for i in range(count):
+                yield Row(id=i, name=f"row-{i}")
+        finally:
+            self.__closed += 1
+
+    @get(
+        "/rows-as-array",
+        stream_format=StreamFormat.JSON_ARRAY,
+        response_model_exclude_none=True,
+    )
+    async def get_rows_as_array(self, count: int = 3) -> AsyncIterator[Row]:
+        for i in range(count):
+            yield Row(id=i, name=f"row-{i}" if i % 2 else None)
+
+    @get("/labels", response_model_exclude={"id"})
+    async def get_labels(self) -> AsyncGenerator[Row, None]:
+        yield Row(id=0, name="row-0")
+
+    @get("/ids", response_model_include={"id"}, response_model_exclude_unset=True)
+    async def get_ids(self) -> AsyncGenerator[Row, None]:
+        yield Row(id=0, name="row-0")
+
+    @get("/untyped", status_code=206)
+    async def get_untyped(self):  # type: ignore
+        yield {"hello": "world"}
+        yield [1, 2, 3]
@@ -0,0 +1,31 @@
+from typing import Annotated
+
+from fastapi import Body
+from fastapi.routing import APIRoute
+from pydantic import BaseModel
+
+from spakky_fastapi.routes import patch, post, put
+from spakky_fastapi.stereotypes.api_controller import ApiController
+
+
+class Member(BaseModel):
+    name: str
+    age: int
+
+
+class CustomRoute(APIRoute): ...
+
+
+@ApiController("/validation")
+class ValidationController:
+    @post("", validate_raw_body=True)
+    async def post_member(self, member: Member) -> Member:
+        return member
+
+    @put("", validate_raw_body=True, route_class_override=CustomRoute)
+    async def put_members(self, members: list[Member]) -> list[Member]:
+        return members
+
+    @patch("", validate_raw_body=True)
+    async def patch_member(self, member: Annotated[Member, Body(embed=True)]) -> Member:
+        return member
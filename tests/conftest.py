@@ -9,6 +9,7 @@ from spakky.application.application_context import ApplicationContext
 from spakky.pod.annotations.pod import Pod
 from spakky.security.key import Key
 
+from spakky_fastapi.settings import SpakkyFastAPISettings
 from tests import apps
 
 
@@ -18,9 +19,18 @@ def get_key_fixture() -> Generator[Key, Any, None]:
     yield key
 
 
+@pytest.fixture(name="settings", scope="function")
+def get_settings_fixture() -> Generator[SpakkyFastAPISettings, Any, None]:
+    settings: SpakkyFastAPISettings = SpakkyFastAPISettings()
+    yield settings
+
+
 @pytest.mark.asyncio
 @pytest.fixture(name="app", scope="function")
-async def get_app_fixture(key: Key) -> AsyncGenerator[FastAPI, Any]:
+async def get_app_fixture(
+    key: Key,
+    settings: SpakkyFastAPISettings,
+) -> AsyncGenerator[FastAPI, Any]:
     logger = getLogger("debug")
     logger.setLevel(logging.DEBUG)
     console = StreamHandler()
@@ -32,6 +42,10 @@ async def get_app_fixture(key: Key) -> AsyncGenerator[FastAPI, Any]:
     def get_key() -> Key:
         return key
 
+    @Pod(name="settings")
+    def get_settings() -> SpakkyFastAPISettings:
+        return settings
+
     @Pod(name="api")
     def get_api() -> FastAPI:
         return FastAPI(debug=True)
@@ -43,6 +57,7 @@ async def get_app_fixture(key: Key) -> AsyncGenerator[FastAPI, Any]:
         .enable_logging()
         .scan(apps)
         .add(get_key)
+        .add(get_settings)
         .add(get_api)
     )
     app.start()
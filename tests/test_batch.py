@@ -0,0 +1,143 @@
+from types import SimpleNamespace
+from typing import Any, Generator
+
+import orjson
+import pytest
+from fastapi import FastAPI, status
+from fastapi.testclient import TestClient
+from starlette.types import Message, Receive, Scope, Send
+
+from spakky_fastapi.middlewares.batch import BatchMiddleware, decode_body
+from spakky_fastapi.settings import SpakkyFastAPISettings
+
+
+@pytest.fixture(name="settings", scope="function")
+def get_settings_fixture() -> Generator[SpakkyFastAPISettings, Any, None]:
+    settings: SpakkyFastAPISettings = SpakkyFastAPISettings(
+        batch_path="/batch",
+        batch_max_requests=5,
+        batch_max_concurrency=2,
+        compression_encodings=("gzip",),
+        compression_minimum_size=1,
+    )
+    yield settings
+
+
+def test_sub_requests_answered_in_order(app: FastAPI) -> None:
+    with TestClient(app) as client:
+        response = client.post(
+            "/batch",
+            json=[
+                {"path": "/dummy"},
+                {
+                    "method": "POST",
+                    "path": "/dummy",
+                    "body": {"name": "John", "age": 30},
+                },
+                {"path": "/dummy/login?username=john"},
+                {"path": "/dummy/verify-email?email=invalid"},
+                {"path": "/dummy/error"},
+            ],
+            headers={"Accept-Encoding": "gzip"},
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-encoding"] == "gzip"
+        results = response.json()
+        assert [x["status"] for x in results] == [200, 200, 200, 400, 500]
+        assert results[0]["body"] == "Hello World!"
+        assert results[1]["body"] == {"name": "John", "age": 30}
+        assert results[1]["headers"]["content-type"] == "application/json"
+        # Sub-responses are never compressed individually.
+        assert "content-encoding" not in results[1]["headers"]
+        assert results[3]["body"]["message"] == "Invalid email"
+
+
+def test_sub_requests_get_their_own_context(app: FastAPI) -> None:
+    with TestClient(app) as client:
+        results = client.post(
+            "/batch", json=[{"path": "/context/scope"}, {"path": "/context/scope"}]
+        ).json()
+        first, second = results[0]["body"], results[1]["body"]
+        assert first[0] == first[1]
+        assert second[0] == second[1]
+        assert first[0] != second[0]
+
+
+def test_sub_request_headers_override_envelope(app: FastAPI) -> None:
+    with TestClient(app) as client:
+        results = client.post(
+            "/batch",
+            json=[
+                {"path": "/coalescing/slow"},
+                {"path": "/coalescing/slow", "headers": {"Accept-Language": "ko"}},
+            ],
+            headers={"Accept-Language": "en"},
+        ).json()
+        assert results[0]["body"]["language"] == "en"
+        assert results[1]["body"]["language"] == "ko"
+
+
+def test_unsupported_sub_requests(app: FastAPI) -> None:
+    with TestClient(app) as client:
+        results = client.post(
+            "/batch", json=[{"path": "/batch"}, {"path": "/sse/quiet"}]
+        ).json()
+        assert [x["status"] for x in results] == [400, 406]
+
+
+def test_invalid_batches_rejected(app: FastAPI) -> None:
+    with TestClient(app) as client:
+        assert client.post("/batch", json={"path": "/"}).status_code == 400
+        assert client.post("/batch", json=[{"path": "/"}] * 6).status_code == 400
+        assert client.get("/batch").status_code == status.HTTP_404_NOT_FOUND
+
+
+async def test_sub_requests_isolated_from_each_other() -> None:
+    states: list[dict[str, Any]] = []
+
+    async def app(scope: Scope, receive: Receive, send: Send) -> None:
+        scope["state"]["path"] = scope["path"]
+        states.append(scope["state"])
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        if scope["path"] == "/broken":
+            # Past the response start, so error handling has to re-raise.
+            raise RuntimeError("Broken")
+        await send({"type": "http.response.body", "body": b"ok"})
+
+    middleware = BatchMiddleware(
+        app,
+        "/batch",
+        application_context=SimpleNamespace(clear_context=lambda: None),  # type: ignore
+    )
+    envelope: dict[str, Any] = {"shared": True}
+    body: bytes = orjson.dumps([{"path": "/first"}, {"path": "/broken"}])
+    sent: list[Message] = []
+
+    async def receive() -> Message:
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    async def send(message: Message) -> None:
+        sent.append(message)
+
+    scope: Scope = {
+        "type": "http",
+        "method": "POST",
+        "path": "/batch",
+        "headers": [],
+        "state": envelope,
+    }
+    await middleware(scope, receive, send)
+    results = orjson.loads(sent[-1]["body"])
+    assert [x["status"] for x in results] == [200, 500]
+    assert results[0]["body"] == "ok"
+    assert envelope == {"shared": True}
+    assert states == [
+        {"shared": True, "path": "/first"},
+        {"shared": True, "path": "/broken"},
+    ]
+
+
+def test_decode_body() -> None:
+    assert decode_body("application/json", b"") is None
+    assert decode_body("application/json", b"not json") == "not json"
+    assert decode_body("text/plain", b"text") == "text"
@@ -0,0 +1,155 @@
+import asyncio
+from contextvars import ContextVar
+from typing import Any, Sequence
+
+import pytest
+from fastapi import FastAPI, status
+from fastapi.exceptions import FastAPIError
+from httpx import ASGITransport, AsyncClient
+from spakky.application.application import SpakkyApplication
+from spakky.application.application_context import ApplicationContext
+from spakky.pod.annotations.pod import Pod
+
+from spakky_fastapi.batching import Batcher, get_batched_signature
+from spakky_fastapi.error import NotFound
+from spakky_fastapi.main import initialize
+from spakky_fastapi.routes import batched, get
+from spakky_fastapi.stereotypes.api_controller import ApiController
+
+
+async def test_concurrent_calls_batched(app: FastAPI) -> None:
+    async with AsyncClient(
+        transport=ASGITransport(app=app),
+        base_url="http://test",
+    ) as client:
+        responses = await asyncio.gather(
+            *(client.get(f"/batching/items/{x}") for x in (1, 2, 2, 3, 0))
+        )
+        assert [x.status_code for x in responses] == [200, 200, 200, 200, 404]
+        assert responses[2].json() == {"id": 2, "name": "item-2"}
+        # Four distinct keys fill the batch before the window closes.
+        assert (await client.get("/batching/batches")).json() == [[0, 1, 2, 3]]
+
+
+async def test_query_keys_batched_in_order(app: FastAPI) -> None:
+    async with AsyncClient(
+        transport=ASGITransport(app=app),
+        base_url="http://test",
+    ) as client:
+        responses = await asyncio.gather(
+            *(client.get("/batching/names", params={"id": x}) for x in (3, 1, 2))
+        )
+        assert [x.json() for x in responses] == ["name-3", "name-1", "name-2"]
+        assert (await client.get("/batching/batches")).json() == [[1, 2, 3]]
+        assert (await client.get("/batching/names")).status_code == (
+            status.HTTP_422_UNPROCESSABLE_ENTITY
+        )
+
+
+def test_openapi_shows_single_key(app: FastAPI) -> None:
+    operation: dict[str, Any] = app.openapi()["paths"]["/batching/items/{id}"]["get"]
+    assert operation["parameters"][0]["schema"] == {"type": "integer", "title": "Id"}
+    assert operation["responses"]["200"]["content"]["application/json"]["schema"] == {
+        "$ref": "#/components/schemas/Product"
+    }
+
+
+async def test_deadline_cancels_batch_call(app: FastAPI) -> None:
+    async with AsyncClient(
+        transport=ASGITransport(app=app),
+        base_url="http://test",
+    ) as client:
+        response = await client.get("/batching/slow/1")
+        assert response.status_code == status.HTTP_504_GATEWAY_TIMEOUT
+        for _ in range(50):
+            cancelled = (await client.get("/batching/cancelled")).json()
+            if cancelled:
+                break
+            await asyncio.sleep(0.01)
+        assert cancelled == [[1]]
+
+
+async def test_batch_runs_outside_caller_context() -> None:
+    variable: ContextVar[str] = ContextVar("variable", default="unset")
+    seen: list[str] = []
+
+    async def load(keys: list[int]) -> list[int]:
+        seen.append(variable.get())
+        return keys
+
+    batcher = Batcher(load, max_wait=0.01)
+    variable.set("caller")
+    assert await batcher.load(1) == 1
+    assert seen == ["unset"]
+
+
+def test_batched_route_requires_singleton_controller() -> None:
+    @ApiController("/context-batching", scope=Pod.Scope.CONTEXT)
+    class ContextBatchingController:
+        @batched()
+        @get("/items/{id}")
+        async def get_items(self, id: Sequence[int]) -> list[int]:
+            return list(id)
+
+    @Pod(name="api")
+    def get_api() -> FastAPI:
+        return FastAPI()
+
+    application = (
+        SpakkyApplication(ApplicationContext())
+        .add(ContextBatchingController)
+        .add(get_api)
+    )
+    initialize(application)
+    with pytest.raises(FastAPIError):
+        application.start()
+
+
+async def test_batch_failure_reaches_every_waiter() -> None:
+    async def load(keys: list[int]) -> list[int]:
+        raise ValueError("backend down")
+
+    batcher = Batcher(load, max_wait=0.01)
+    results = await asyncio.gather(
+        batcher.load(1), batcher.load(2), return_exceptions=True
+    )
+    assert all(isinstance(x, ValueError) for x in results)
+
+
+async def test_result_count_must_match_keys() -> None:
+    async def load(keys: list[int]) -> list[int]:
+        return [1]
+
+    batcher = Batcher(load, max_wait=0.01)
+    results = await asyncio.gather(
+        batcher.load(1), batcher.load(2), return_exceptions=True
+    )
+    assert all(isinstance(x, FastAPIError) for x in results)
+
+
+async def test_cancelled_waiter_leaves_batch_running() -> None:
+    loaded: list[list[int]] = []
+
+    async def load(keys: list[int]) -> dict[int, int]:
+        loaded.append(keys)
+        await asyncio.sleep(0.05)
+        return {1: 10}
+
+    batcher = Batcher(load, max_wait=0.01)
+    cancelled = asyncio.create_task(batcher.load(1))
+    waiting = asyncio.create_task(batcher.load(1))
+    await asyncio.sleep(0.02)
+    cancelled.cancel()
+    assert await waiting == 10
+    with pytest.raises(NotFound):
+        await batcher.load(2)
+    assert loaded == [[1], [2]]
+    batcher.dispatch()
+
+
+def test_batched_method_takes_one_parameter() -> None:
+    async def load(keys: list[int], extra: int) -> list[int]:
+        return keys
+
+    with pytest.raises(FastAPIError):
+        get_batched_signature(load)
@@ -0,0 +1,101 @@
+import asyncio
+from time import sleep
+
+from fastapi import FastAPI, Request, Response
+from fastapi.testclient import TestClient
+
+from spakky_fastapi.caching import ResponseCache
+
+
+def test_cached_response_reused(app: FastAPI) -> None:
+    with TestClient(app) as client:
+        first = client.get("/caching/counter")
+        second = client.get("/caching/counter")
+        assert first.text == second.text
+        assert second.headers["content-type"] == first.headers["content-type"]
+        assert client.get("/caching/counter", params={"offset": 10}).text != first.text
+
+
+def test_cached_response_keyed_by_headers(app: FastAPI) -> None:
+    with TestClient(app) as client:
+        english = client.get("/caching/greeting", headers={"Accept-Language": "en"})
+        korean = client.get("/caching/greeting", headers={"Accept-Language": "ko"})
+        assert english.json()["language"] == "en"
+        assert korean.json()["language"] == "ko"
+        assert (
+            client.get("/caching/greeting", headers={"Accept-Language": "ko"}).json()
+            == korean.json()
+        )
+
+
+def test_cached_response_expires(app: FastAPI) -> None:
+    with TestClient(app) as client:
+        first = client.get("/caching/expiring")
+        assert client.get("/caching/expiring").text == first.text
+        sleep(0.1)
+        assert client.get("/caching/expiring").text != first.text
+
+
+def test_cached_response_with_custom_key(app: FastAPI) -> None:
+    with TestClient(app) as client:
+        assert client.get("/caching/custom-key/1").text == "1"
+        assert client.get("/caching/custom-key/2").text == "1"
+
+
+def test_cached_response_invalidated(app: FastAPI) -> None:
+    with TestClient(app) as client:
+        counter = client.get("/caching/counter").text
+        greeting = client.get("/caching/greeting").json()
+        client.delete("/caching/counter")
+        assert client.get("/caching/counter").text != counter
+        assert client.get("/caching/greeting").json() == greeting
+        client.post("/caching/counter")
+        assert client.get("/caching/greeting").json() != greeting
+
+
+def test_response_cache_evicts_least_recently_used() -> None:
+    cache = ResponseCache(ttl=60, max_entries=2)
+    cache.set("a", "/a", Response(b"a"))
+    cache.set("b", "/b", Response(b"b"))
+    assert cache.get("a") is not None
+    cache.set("c", "/c", Response(b"c"))
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+
+
+def test_response_cache_skips_uncacheable_responses(app: FastAPI) -> None:
+    with TestClient(app) as client:
+        assert client.get("/caching/custom-key/abc").status_code == 422
+        assert client.get("/caching/custom-key/3").text == "3"
+
+
+async def test_write_started_before_invalidation_dropped() -> None:
+    cache = ResponseCache(ttl=60)
+    rendering = asyncio.Event()
+    invalidated = asyncio.Event()
+
+    async def handler(request: Request) -> Response:
+        rendering.set()
+        await invalidated.wait()
+        return Response(content=b"stale")
+
+    app = cache.wrap_handler(None, handler)  # type: ignore
+    request = Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "path": "/items",
+            "query_string": b"",
+            "headers": [],
+        }
+    )
+    pending = asyncio.create_task(app(request))
+    await rendering.wait()
+    cache.invalidate("/items")
+    invalidated.set()
+    assert (await pending).body == b"stale"
+    assert len(cache) == 0
+    await app(request)
+    assert len(cache) == 1
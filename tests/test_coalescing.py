@@ -0,0 +1,133 @@
+import asyncio
+
+import pytest
+from fastapi import FastAPI, Request, Response
+from fastapi.routing import APIRoute
+from httpx import ASGITransport, AsyncClient
+
+from spakky_fastapi.coalescing import SingleFlight
+
+CONCURRENCY: int = 50
+
+
+async def test_concurrent_requests_coalesced(app: FastAPI) -> None:
+    async with AsyncClient(
+        transport=ASGITransport(app=app),
+        base_url="http://test",
+    ) as client:
+        responses = await asyncio.gather(
+            *(client.get("/coalescing/slow") for _ in range(CONCURRENCY))
+        )
+        assert all(response.status_code == 200 for response in responses)
+        assert len({response.text for response in responses}) == 1
+        assert (await client.get("/coalescing/calls")).json() == 1
+
+
+async def test_coalesced_requests_keyed_by_query_and_headers(app: FastAPI) -> None:
+    async with AsyncClient(
+        transport=ASGITransport(app=app),
+        base_url="http://test",
+    ) as client:
+        english, korean, other = await asyncio.gather(
+            client.get("/coalescing/slow", headers={"Accept-Language": "en"}),
+            client.get("/coalescing/slow", headers={"Accept-Language": "ko"}),
+            client.get("/coalescing/slow", params={"page": 2}),
+        )
+        assert english.json()["language"] == "en"
+        assert korean.json()["language"] == "ko"
+        assert (await client.get("/coalescing/calls")).json() == 3
+
+
+async def test_streaming_responses_not_shared(app: FastAPI) -> None:
+    async with AsyncClient(
+        transport=ASGITransport(app=app),
+        base_url="http://test",
+    ) as client:
+        responses = await asyncio.gather(
+            *(client.get("/coalescing/streaming") for _ in range(3))
+        )
+        assert all(response.text == "streamed" for response in responses)
+        assert (await client.get("/coalescing/calls")).json() == 3
+
+
+def create_request() -> Request:
+    return Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "path": "/",
+            "query_string": b"",
+            "headers": [],
+        }
+    )
+
+
+async def test_leader_cancellation_does_not_affect_followers() -> None:
+    started = asyncio.Event()
+    release = asyncio.Event()
+
+    async def handler(request: Request) -> Response:
+        started.set()
+        await release.wait()
+        return Response(b"shared")
+
+    single_flight = SingleFlight()
+    app = single_flight.wrap_handler(APIRoute("/", handler), handler)
+    leader = asyncio.create_task(app(create_request()))
+    await started.wait()
+    follower = asyncio.create_task(app(create_request()))
+    await asyncio.sleep(0)
+
+    leader.cancel()
+    release.set()
+    assert (await follower).body == b"shared"
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+    assert len(single_flight) == 0
+
+
+async def test_abandoned_invocation_cancelled() -> None:
+    started = asyncio.Event()
+    cancelled = asyncio.Event()
+
+    async def handler(request: Request) -> Response:
+        started.set()
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+        return Response()  # pragma: no cover
+
+    single_flight = SingleFlight()
+    leader = asyncio.create_task(
+        single_flight.wrap_handler(APIRoute("/", handler), handler)(create_request())
+    )
+    await started.wait()
+    leader.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+    await asyncio.wait_for(cancelled.wait(), timeout=1)
+    assert len(single_flight) == 0
+
+
+async def test_each_waiter_gets_its_own_error() -> None:
+    started = asyncio.Event()
+    release = asyncio.Event()
+    error = ValueError("shared")
+
+    async def handler(request: Request) -> Response:
+        started.set()
+        await release.wait()
+        raise error
+
+    app = SingleFlight().wrap_handler(APIRoute("/", handler), handler)
+    leader = asyncio.create_task(app(create_request()))
+    await started.wait()
+    followers = [asyncio.create_task(app(create_request())) for _ in range(3)]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(leader, *followers, return_exceptions=True)
+    assert all(isinstance(x, ValueError) and x.args == ("shared",) for x in results)
+    assert len({id(x) for x in results}) == 4
+    assert all(x.__cause__ is error for x in results)
@@ -0,0 +1,164 @@
+import gzip
+from typing import Any, Generator
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from starlette.types import Message, Receive, Scope, Send
+
+from spakky_fastapi.compression import select_encoding
+from spakky_fastapi.middlewares.compression import CompressionMiddleware
+from spakky_fastapi.settings import SpakkyFastAPISettings
+from tests.apps.compression import LARGE_TEXT
+
+
+@pytest.fixture(name="settings", scope="function")
+def get_settings_fixture() -> Generator[SpakkyFastAPISettings, Any, None]:
+    settings: SpakkyFastAPISettings = SpakkyFastAPISettings(
+        compression_encodings=("zstd", "br", "gzip"),
+        compression_minimum_size=100,
+        compression_levels={"gzip": 9},
+    )
+    yield settings
+
+
+def test_gzip_negotiated(app: FastAPI) -> None:
+    with TestClient(app) as client:
+        response = client.get("/compression/large", headers={"Accept-Encoding": "gzip"})
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["vary"] == "Accept-Encoding"
+        assert response.json() == {"numbers": list(range(500))}
+        assert int(response.headers["content-length"]) < len(response.content)
+
+
+@pytest.mark.parametrize("encoding", ["br", "zstd"])
+def test_server_preference_applied(app: FastAPI, encoding: str) -> None:
+    pytest.importorskip({"br": "brotli", "zstd": "zstandard"}[encoding])
+    with TestClient(app) as client:
+        response = client.get(
+            "/compression/large",
+            headers={"Accept-Encoding": f"gzip;q=0.5, {encoding}, identity"},
+        )
+        assert response.headers["content-encoding"] == encoding
+
+
+def test_compression_skipped(app: FastAPI) -> None:
+    with TestClient(app) as client:
+        headers = {"Accept-Encoding": "gzip"}
+        for path in (
+            "/compression/small",
+            "/compression/uncompressed",
+            "/compression/events",
+        ):
+            response = client.get(path, headers=headers)
+            assert "content-encoding" not in response.headers
+        assert (
+            "content-encoding"
+            not in client.get(
+                "/compression/large", headers={"Accept-Encoding": "identity"}
+            ).headers
+        )
+
+
+def test_etag_weakened_when_compressed(app: FastAPI) -> None:
+    with TestClient(app) as client:
+        identity = client.get(
+            "/compression/tagged", headers={"Accept-Encoding": "identity"}
+        )
+        compressed = client.get(
+            "/compression/tagged", headers={"Accept-Encoding": "gzip"}
+        )
+        assert compressed.headers["etag"] == f"W/{identity.headers['etag']}"
+        assert (
+            client.get(
+                "/compression/tagged",
+                headers={
+                    "Accept-Encoding": "gzip",
+                    "If-None-Match": compressed.headers["etag"],
+                },
+            ).status_code
+            == 304
+        )
+
+
+def test_streaming_response_compressed(app: FastAPI) -> None:
+    with TestClient(app) as client:
+        response = client.get(
+            "/compression/streaming", headers={"Accept-Encoding": "gzip"}
+        )
+        assert response.headers["content-encoding"] == "gzip"
+        assert "content-length" not in response.headers
+        assert response.text == LARGE_TEXT * 3
+
+
+def decompress(encoding: str, data: bytes) -> bytes:
+    if encoding == "br":
+        return pytest.importorskip("brotli").decompress(data)
+    if encoding == "zstd":
+        zstandard = pytest.importorskip("zstandard")
+        return zstandard.ZstdDecompressor().decompressobj().decompress(data)
+    return gzip.decompress(data)
+
+
+@pytest.mark.parametrize("encoding", ["gzip", "br", "zstd"])
+async def test_streaming_response_not_buffered(encoding: str) -> None:
+    async def app(scope: Scope, receive: Receive, send: Send) -> None:
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        for _ in range(3):
+            await send(
+                {"type": "http.response.body", "body": b"chunk" * 10, "more_body": True}
+            )
+        await send({"type": "http.response.body", "body": b""})
+
+    messages: list[Message] = []
+
+    async def send(message: Message) -> None:
+        messages.append(message)
+
+    async def receive() -> Message:
+        return {"type": "http.request", "body": b""}  # pragma: no cover
+
+    await CompressionMiddleware(app, encodings=(encoding,))(
+        {"type": "http", "headers": [(b"accept-encoding", encoding.encode())]},
+        receive,
+        send,
+    )
+    bodies: list[bytes] = [message["body"] for message in messages if "body" in message]
+    assert len(bodies) == 4
+    assert all(bodies[:3])
+    assert decompress(encoding, b"".join(bodies)) == b"chunk" * 30
+
+
+async def test_message_before_start_forwarded() -> None:
+    early: Message = {"type": "http.response.debug", "info": {}}
+
+    async def app(scope: Scope, receive: Receive, send: Send) -> None:
+        await send(early)
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b"ok"})
+
+    messages: list[Message] = []
+
+    async def send(message: Message) -> None:
+        messages.append(message)
+
+    async def receive() -> Message:
+        return {"type": "http.request", "body": b""}  # pragma: no cover
+
+    await CompressionMiddleware(app, encodings=("gzip",))(
+        {"type": "http", "headers": [(b"accept-encoding", b"gzip")]},
+        receive,
+        send,
+    )
+    assert messages[0] is early
+    assert messages[-1]["body"] == b"ok"
+
+
+def test_select_encoding() -> None:
+    encodings = ("br", "gzip")
+    assert select_encoding("gzip, br", encodings) == "br"
+    assert select_encoding("br;q=0, gzip", encodings) == "gzip"
+    assert select_encoding("*", encodings) == "br"
+    assert select_encoding("*;q=0, gzip;q=0.1", encodings) == "gzip"
+    assert select_encoding("br;q=invalid", encodings) is None
+    assert select_encoding("", encodings) is None
@@ -0,0 +1,208 @@
+import time
+from asyncio import sleep as asyncio_sleep
+from typing import Any, Generator
+
+import pytest
+from fastapi import FastAPI, WebSocket, status
+from fastapi.testclient import TestClient
+from starlette.types import Message
+from starlette.websockets import WebSocketDisconnect
+
+from spakky_fastapi.connections import (
+    MonitoredWebSocket,
+    WebSocketRegistry,
+    WebSocketRouteStats,
+    get_payload_size,
+    monitor,
+)
+from spakky_fastapi.settings import SpakkyFastAPISettings
+
+
+@pytest.fixture(name="settings", scope="function")
+def get_settings_fixture() -> Generator[SpakkyFastAPISettings, Any, None]:
+    settings: SpakkyFastAPISettings = SpakkyFastAPISettings(metrics_path="/metrics")
+    yield settings
+
+
+def read_metrics(client: TestClient, route: str) -> dict[str, int]:
+    suffix: str = f'{{route="{route}"}}'
+    metrics: dict[str, int] = {}
+    for line in client.get("/metrics").text.splitlines():
+        name, _, value = line.partition(" ")
+        if name.startswith("spakky_websocket_connections_") and name.endswith(suffix):
+            metrics[name[len("spakky_websocket_connections_") : -len(suffix)]] = int(
+                value
+            )
+    return metrics
+
+
+def test_connections_counted_per_route(app: FastAPI) -> None:
+    with TestClient(app) as client:
+        assert read_metrics(client, "/connections/echo")["active"] == 0
+        with (
+            client.websocket_connect("/connections/echo") as first,
+            client.websocket_connect("/connections/echo") as second,
+        ):
+            first.send_text("hello")
+            assert first.receive_text() == "hello"
+            second.send_text("hi")
+            assert second.receive_text() == "hi"
+            metrics = read_metrics(client, "/connections/echo")
+            assert metrics["active"] == 2
+            assert metrics["accepted_total"] == 2
+            assert metrics["closed_total"] == 0
+            assert metrics["received_bytes_total"] == 7
+            assert metrics["sent_bytes_total"] == 7
+            assert metrics["memory_bytes"] > 0
+        # Closing is handled by the endpoint after the client has gone.
+        for _ in range(100):
+            metrics = read_metrics(client, "/connections/echo")
+            if metrics["closed_total"] == 2:
+                break
+            time.sleep(0.01)
+        assert metrics["active"] == 0
+        assert metrics["closed_total"] == 2
+        assert metrics["memory_bytes"] == 0
+
+
+def test_silent_push_only_connection_not_reaped(app: FastAPI) -> None:
+    with TestClient(app) as client:
+        with client.websocket_connect("/connections/push") as socket:
+            # The route has no idle timeout, as its client never sends; dead
+            # peers are left to the server's ping heartbeat.
+            received: list[bytes] = [socket.receive_bytes() for _ in range(12)]
+            assert received == [str(i).encode() for i in range(12)]
+            with pytest.raises(WebSocketDisconnect) as error:
+                socket.receive_bytes()
+            assert error.value.code == status.WS_1000_NORMAL_CLOSURE
+        metrics = read_metrics(client, "/connections/push")
+        assert metrics["reaped_total"] == 0
+        assert metrics["sent_bytes_total"] == 14
+
+
+def test_idle_connection_reaped(app: FastAPI) -> None:
+    with TestClient(app) as client:
+        with client.websocket_connect("/connections/idle") as socket:
+            socket.send_text("hello")
+            assert socket.receive_text() == "hello"
+            with pytest.raises(WebSocketDisconnect) as error:
+                socket.receive_text()
+            assert error.value.code == status.WS_1001_GOING_AWAY
+        metrics = read_metrics(client, "/connections/idle")
+        assert metrics["reaped_total"] == 1
+
+
+def test_active_connection_not_reaped(app: FastAPI) -> None:
+    with TestClient(app) as client:
+        with client.websocket_connect("/connections/idle") as socket:
+            for _ in range(5):
+                socket.send_text("hello")
+                assert socket.receive_text() == "hello"
+                time.sleep(0.05)
+        assert read_metrics(client, "/connections/idle")["reaped_total"] == 0
+
+
+async def test_frames_read_while_endpoint_does_not_receive() -> None:
+    received: list[Message] = [
+        {"type": "websocket.disconnect", "code": 1000},
+        {"type": "websocket.receive", "text": "hello"},
+        {"type": "websocket.connect"},
+    ]
+
+    async def receive() -> Message:
+        if received:
+            return received.pop()
+        await asyncio_sleep(1)
+        raise AssertionError("Read after disconnect")
+
+    async def send(message: Message) -> None:
+        pass
+
+    async def handler(socket: WebSocket) -> None:
+        await socket.accept()
+        await asyncio_sleep(0.05)
+        assert not received
+        assert await socket.receive_text() == "hello"
+
+    stats = WebSocketRouteStats("/reader")
+    endpoint = monitor(handler, handler, stats, idle_timeout=10)
+    await endpoint(socket=WebSocket({"type": "websocket"}, receive, send))
+    assert stats.received_bytes == 5
+    assert stats.accepted == 1
+    assert stats.closed == 1
+
+
+async def test_frames_read_on_demand_without_idle_timeout() -> None:
+    received: list[Message] = [
+        {"type": "websocket.receive", "text": "hello"},
+        {"type": "websocket.connect"},
+    ]
+
+    async def receive() -> Message:
+        return received.pop()
+
+    async def send(message: Message) -> None:
+        pass
+
+    async def handler(socket: WebSocket) -> None:
+        await socket.accept()
+        await asyncio_sleep(0.01)
+        assert len(received) == 1
+        assert await socket.receive_text() == "hello"
+
+    stats = WebSocketRouteStats("/direct")
+    endpoint = monitor(handler, handler, stats)
+    await endpoint(socket=WebSocket({"type": "websocket"}, receive, send))
+    assert stats.received_bytes == 5
+
+
+async def test_send_after_reap_raises_disconnect() -> None:
+    sent: list[Message] = []
+
+    async def receive() -> Message:
+        if not sent:
+            return {"type": "websocket.connect"}
+        await asyncio_sleep(1)
+        return {"type": "websocket.disconnect", "code": 1000}
+
+    async def send(message: Message) -> None:
+        sent.append(message)
+
+    async def handler(socket: WebSocket) -> None:
+        await socket.accept()
+        await asyncio_sleep(0.05)
+        assert isinstance(socket, MonitoredWebSocket) and socket.reaped
+        with pytest.raises(WebSocketDisconnect) as error:
+            await socket.send_text("late")
+        assert error.value.code == status.WS_1001_GOING_AWAY
+
+    stats = WebSocketRouteStats("/reaped")
+    endpoint = monitor(handler, handler, stats, idle_timeout=0.01)
+    await endpoint(socket=WebSocket({"type": "websocket"}, receive, send))
+    assert stats.reaped == 1
+    assert sent[-1] == {
+        "type": "websocket.close",
+        "code": status.WS_1001_GOING_AWAY,
+        "reason": "",
+    }
+
+
+def test_server_options_carry_heartbeat() -> None:
+    settings = SpakkyFastAPISettings(
+        websocket_ping_interval=5, websocket_ping_timeout=2
+    )
+    assert settings.server_options == {"ws_ping_interval": 5, "ws_ping_timeout": 2}
+
+
+def test_registry_reuses_route_stats() -> None:
+    registry = WebSocketRegistry()
+    assert registry.get("/b") is registry.get("/b")
+    registry.get("/a")
+    assert [x.path for x in registry.snapshot()] == ["/a", "/b"]
+    assert 'spakky_websocket_connections_active{route="/a"} 0' in registry.render()
+
+
+def test_payload_size() -> None:
+    assert get_payload_size({"type": "websocket.receive", "text": "abc"}) == 3
+    assert get_payload_size({"type": "websocket.receive", "bytes": b"ab"}) == 2
+    assert get_payload_size({"type": "websocket.connect"}) == 0
@@ -0,0 +1,20 @@
+import asyncio
+
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+CONCURRENCY: int = 2000
+
+
+async def test_context_scope_is_isolated_per_request(app: FastAPI) -> None:
+    async with AsyncClient(
+        transport=ASGITransport(app=app),
+        base_url="http://test",
+    ) as client:
+        responses = await asyncio.gather(
+            *(client.get("/context/scope") for _ in range(CONCURRENCY))
+        )
+
+    scopes: list[list[str]] = [response.json() for response in responses]
+    assert all(before == after for before, after in scopes)
+    assert len({before for before, _ in scopes}) == CONCURRENCY
@@ -0,0 +1,55 @@
+import asyncio
+
+import pytest
+from fastapi import FastAPI, status
+from fastapi.exceptions import FastAPIError
+from fastapi.testclient import TestClient
+
+from spakky_fastapi.deadlines import get_deadline, get_remaining_time, with_deadline
+from spakky_fastapi.error import GatewayTimeout
+
+
+def test_remaining_budget_exposed_to_handler(app: FastAPI) -> None:
+    with TestClient(app) as client:
+        controller_default = client.get("/deadlines/remaining").json()
+        assert 4.0 < controller_default <= 5.0
+        route_override = client.get("/deadlines/short").json()
+        assert 0.0 < route_override <= 0.5
+        assert client.get("/deadlines/unbounded").json() is None
+
+
+def test_handler_cancelled_after_deadline(app: FastAPI) -> None:
+    with TestClient(app) as client:
+        response = client.get("/deadlines/slow")
+        assert response.status_code == status.HTTP_504_GATEWAY_TIMEOUT
+        assert response.json()["message"] == "Gateway Timeout"
+        assert client.get("/deadlines/cancelled").json() == 1
+
+
+def test_timeout_raised_by_handler_is_not_a_deadline(app: FastAPI) -> None:
+    with TestClient(app) as client:
+        response = client.get("/deadlines/timeout-error")
+        assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
+
+
+async def test_nested_deadline_never_extends_outer_one() -> None:
+    async def inner() -> float | None:
+        return get_deadline()
+
+    async def outer() -> tuple[float | None, float | None]:
+        return get_deadline(), await with_deadline(inner, 10)()
+
+    outer_deadline, inner_deadline = await with_deadline(outer, 1)()
+    assert outer_deadline == inner_deadline
+    assert get_deadline() is None
+    assert get_remaining_time() is None
+
+
+async def test_deadline_raises_gateway_timeout() -> None:
+    with pytest.raises(GatewayTimeout):
+        await with_deadline(asyncio.sleep, 0.01)(1)
+
+
+def test_non_positive_timeout_rejected() -> None:
+    with pytest.raises(FastAPIError):
+        with_deadline(asyncio.sleep, 0)
@@ -0,0 +1,73 @@
+from typing import Any, Awaitable, Callable
+
+import pytest
+from fastapi import FastAPI
+from fastapi.routing import APIRoute
+from spakky.application.application import SpakkyApplication
+from spakky.application.application_context import ApplicationContext
+from spakky.pod.annotations.pod import Pod
+
+from spakky_fastapi.main import initialize
+from spakky_fastapi.routes import get
+from spakky_fastapi.stereotypes.api_controller import ApiController
+
+
+@ApiController("/singleton")
+class SingletonController:
+    @get("")
+    async def hello(self) -> str:
+        return "singleton"
+
+
+@ApiController("/context", scope=Pod.Scope.CONTEXT)
+class ContextController:
+    @get("")
+    async def hello(self) -> str:
+        return "context"
+
+
+@pytest.mark.parametrize(
+    ("path", "expected", "resolutions"),
+    [("/singleton", "singleton", 1), ("/context", "context", 3)],
+)
+async def test_controller_resolved_per_scope(
+    monkeypatch: pytest.MonkeyPatch,
+    path: str,
+    expected: str,
+    resolutions: int,
+) -> None:
+    @Pod(name="api")
+    def get_api() -> FastAPI:
+        return FastAPI()
+
+    application = (
+        SpakkyApplication(ApplicationContext())
+        .add(SingletonController)
+        .add(ContextController)
+        .add(get_api)
+    )
+    initialize(application)
+    application.start()
+    try:
+        api: FastAPI = application.container.get(FastAPI)
+        endpoint: Callable[..., Awaitable[Any]] = next(
+            route.endpoint
+            for route in api.routes
+            if isinstance(route, APIRoute) and route.path == path
+        )
+        container = application.container
+        resolved: list[type] = []
+        original = container.get
+
+        def counting_get(*args: Any, **kwargs: Any) -> Any:
+            instance = original(*args, **kwargs)
+            resolved.append(type(instance))
+            return instance
+
+        monkeypatch.setattr(container, "get", counting_get)
+        # Singleton bindings are resolved once and reused by every later call.
+        for _ in range(3):
+            assert await endpoint() == expected
+        assert len(resolved) == resolutions
+    finally:
+        application.stop()
@@ -0,0 +1,135 @@
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.exceptions import FastAPIError
+from fastapi.testclient import TestClient
+from spakky.application.application import SpakkyApplication
+from spakky.application.application_context import ApplicationContext
+from spakky.pod.annotations.pod import Pod
+
+from spakky_fastapi.main import initialize
+from spakky_fastapi.routes import get
+from spakky_fastapi.stereotypes.api_controller import ApiController
+
+
+def test_etag_from_body_hash(app: FastAPI) -> None:
+    with TestClient(app) as client:
+        response = client.get("/etag/hashed")
+        assert response.status_code == 200
+        etag = response.headers["etag"]
+        assert etag.startswith('"') and etag.endswith('"')
+        assert client.get("/etag/hashed").headers["etag"] == etag
+
+        not_modified = client.get("/etag/hashed", headers={"If-None-Match": etag})
+        assert not_modified.status_code == 304
+        assert not_modified.content == b""
+        assert not_modified.headers["etag"] == etag
+
+        assert (
+            client.get("/etag/hashed", headers={"If-None-Match": '"other"'}).status_code
+            == 200
+        )
+        assert (
+            client.get(
+                "/etag/hashed", headers={"If-None-Match": f'"other", W/{etag}'}
+            ).status_code
+            == 304
+        )
+        assert (
+            client.get("/etag/hashed", headers={"If-None-Match": "*"}).status_code
+            == 304
+        )
+
+
+def test_weak_etag(app: FastAPI) -> None:
+    with TestClient(app) as client:
+        etag = client.get("/etag/weak").headers["etag"]
+        assert etag.startswith('W/"')
+        assert (
+            client.get("/etag/weak", headers={"If-None-Match": etag}).status_code == 304
+        )
+        assert (
+            client.get(
+                "/etag/weak", headers={"If-None-Match": etag.removeprefix("W/")}
+            ).status_code
+            == 304
+        )
+
+
+def test_etag_from_version_skips_handler(app: FastAPI) -> None:
+    with TestClient(app) as client:
+        response = client.get("/etag/versioned")
+        assert response.headers["etag"] == '"v1"'
+        assert response.json() == {"version": 1, "calls": 1}
+
+        not_modified = client.get("/etag/versioned", headers={"If-None-Match": '"v1"'})
+        assert not_modified.status_code == 304
+        assert client.get("/etag/versioned").json()["calls"] == 2
+
+        client.post("/etag/versioned")
+        changed = client.get("/etag/versioned", headers={"If-None-Match": '"v1"'})
+        assert changed.status_code == 200
+        assert changed.headers["etag"] == '"v2"'
+        assert changed.json() == {"version": 2, "calls": 3}
+
+
+def test_etag_falls_back_to_hash_without_version(app: FastAPI) -> None:
+    with TestClient(app) as client:
+        response = client.get("/etag/versioned", params={"unversioned": "1"})
+        assert response.status_code == 200
+        assert response.headers["etag"] != '"v1"'
+
+
+def test_last_modified_from_version(app: FastAPI) -> None:
+    with TestClient(app) as client:
+        response = client.get("/etag/modified")
+        assert response.headers["last-modified"] == "Mon, 01 Jan 2024 12:00:00 GMT"
+        assert (
+            client.get(
+                "/etag/modified",
+                headers={"If-Modified-Since": "Mon, 01 Jan 2024 12:00:00 GMT"},
+            ).status_code
+            == 304
+        )
+        assert (
+            client.get(
+                "/etag/modified",
+                headers={"If-Modified-Since": "Sun, 31 Dec 2023 12:00:00 GMT"},
+            ).status_code
+            == 200
+        )
+        assert (
+            client.get(
+                "/etag/modified", headers={"If-Modified-Since": "not a date"}
+            ).status_code
+            == 200
+        )
+
+
+def test_etag_ignored_for_non_ok_response(app: FastAPI) -> None:
+    with TestClient(app) as client:
+        response = client.get("/etag/missing")
+        assert response.status_code == 201
+        assert "etag" not in response.headers
+
+
+@pytest.mark.parametrize("version_name", ["get_missing_version", "get_sync_version"])
+def test_invalid_etag_version_fails_at_startup(version_name: str) -> None:
+    @ApiController("/invalid-etag")
+    class InvalidETagController:
+        def get_sync_version(self, request: Request) -> str:
+            return "v1"
+
+        @get("/versioned", etag_version=version_name)
+        async def get_versioned(self) -> str:
+            return "versioned"
+
+    @Pod(name="api")
+    def get_api() -> FastAPI:
+        return FastAPI()
+
+    application = (
+        SpakkyApplication(ApplicationContext()).add(InvalidETagController).add(get_api)
+    )
+    initialize(application)
+    with pytest.raises(FastAPIError):
+        application.start()
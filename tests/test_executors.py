@@ -0,0 +1,151 @@
+import asyncio
+import os
+import pickle
+import threading
+import time
+from typing import Any, Generator
+
+import pytest
+from fastapi import FastAPI
+from fastapi.exceptions import FastAPIError
+from fastapi.testclient import TestClient
+from spakky.application.application import SpakkyApplication
+from spakky.application.application_context import ApplicationContext
+from spakky.pod.annotations.pod import Pod
+
+from spakky_fastapi.error import ServiceUnavailable
+from spakky_fastapi.executors import (
+    UNPICKLED_FUNCTIONS,
+    ExecutorPool,
+    ExecutorRegistry,
+    call_pickled,
+)
+from spakky_fastapi.main import initialize
+from spakky_fastapi.routes import get
+from spakky_fastapi.routes.route import ExecutionMode
+from spakky_fastapi.settings import SpakkyFastAPISettings
+from spakky_fastapi.stereotypes.api_controller import ApiController
+
+
+@pytest.fixture(name="settings", scope="function")
+def get_settings_fixture() -> Generator[SpakkyFastAPISettings, Any, None]:
+    settings: SpakkyFastAPISettings = SpakkyFastAPISettings(
+        metrics_path="/metrics",
+        thread_pool_size=2,
+        process_pool_size=1,
+    )
+    yield settings
+
+
+def test_sync_methods_run_on_threads(app: FastAPI) -> None:
+    with TestClient(app) as client:
+        assert client.get("/executors/sync").json().startswith("spakky-executor")
+        assert (
+            not client.get("/executors/sync-on-loop")
+            .json()
+            .startswith("spakky-executor")
+        )
+
+
+def test_async_method_offloaded_with_context(app: FastAPI) -> None:
+    with TestClient(app) as client:
+        response = client.get("/executors/async-on-thread").json()
+        assert response["thread"].startswith("spakky-executor")
+        assert 0 < response["remaining"] <= 5.0
+
+
+def test_process_pool(app: FastAPI) -> None:
+    with TestClient(app) as client:
+        response = client.get("/executors/process", params={"n": 10}).json()
+        assert response["sum"] == 45
+        assert response["pid"] != os.getpid()
+
+
+def test_singleton_controller_unpickled_once_per_worker(app: FastAPI) -> None:
+    with TestClient(app) as client:
+        # The test pool has a single worker, which keeps its copy.
+        assert client.get("/executors/process-calls").json() == 1
+        assert client.get("/executors/process-calls").json() == 2
+
+
+def test_call_pickled_reuses_function() -> None:
+    payload = pickle.dumps(sum)
+    assert call_pickled(payload, [1, 2]) == 3
+    assert UNPICKLED_FUNCTIONS[payload] is sum
+    UNPICKLED_FUNCTIONS.pop(payload)
+
+
+def test_pools_reported_as_metrics(app: FastAPI) -> None:
+    with TestClient(app) as client:
+        metrics = client.get("/metrics").text
+        assert 'spakky_executor_workers{pool="thread"} 2' in metrics
+        assert 'spakky_executor_workers{pool="process"} 1' in metrics
+        assert 'spakky_executor_queued{pool="thread"} 0' in metrics
+
+
+async def test_pending_calls_bounded() -> None:
+    pool = ExecutorPool(ExecutionMode.THREAD, max_workers=1, max_pending=1)
+    release = threading.Event()
+    running = asyncio.gather(
+        pool.run(release.wait), pool.run(time.sleep, 0), return_exceptions=True
+    )
+    await asyncio.sleep(0.05)
+    assert (pool.active, pool.queued) == (1, 1)
+    with pytest.raises(ServiceUnavailable):
+        await pool.run(time.sleep, 0)
+    release.set()
+    assert await running == [True, None]
+    assert (pool.active, pool.queued) == (0, 0)
+    pool.shutdown()
+
+
+async def test_cancelled_call_pending_until_worker_finishes() -> None:
+    pool = ExecutorPool(ExecutionMode.THREAD, max_workers=1)
+    release = threading.Event()
+    waiter = asyncio.ensure_future(pool.run(release.wait))
+    await asyncio.sleep(0.05)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    assert pool.active == 1
+    release.set()
+    for _ in range(100):
+        if pool.active == 0:
+            break
+        await asyncio.sleep(0.01)
+    assert (pool.active, pool.queued) == (0, 0)
+    pool.shutdown()
+
+
+def test_registry_reconfigures_pools() -> None:
+    registry = ExecutorRegistry()
+    default = registry.get(ExecutionMode.THREAD)
+    assert registry.get(ExecutionMode.THREAD) is default
+    registry.configure(ExecutionMode.THREAD, max_workers=3)
+    assert registry.get(ExecutionMode.THREAD).max_workers == 3
+    registry.start()
+    registry.stop()
+
+
+def test_unpicklable_process_route_fails_at_startup() -> None:
+    @ApiController("/unpicklable")
+    class UnpicklableController:
+        __lock: threading.Lock
+
+        def __init__(self) -> None:
+            self.__lock = threading.Lock()
+
+        @get("/process", execution=ExecutionMode.PROCESS)
+        def get_process(self) -> bool:
+            return self.__lock.locked()
+
+    @Pod(name="api")
+    def get_api() -> FastAPI:
+        return FastAPI()
+
+    application = (
+        SpakkyApplication(ApplicationContext()).add(UnpicklableController).add(get_api)
+    )
+    initialize(application)
+    with pytest.raises(FastAPIError):
+        application.start()
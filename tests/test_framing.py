@@ -0,0 +1,153 @@
+import asyncio
+
+import orjson
+import pytest
+from fastapi import FastAPI, WebSocket, WebSocketDisconnect
+from fastapi.exceptions import FastAPIError
+from fastapi.testclient import TestClient
+from starlette.types import Message
+
+from spakky_fastapi.framing import (
+    CODECS,
+    CodecWebSocket,
+    JSONCodec,
+    get_adapter,
+    with_codec,
+)
+from spakky_fastapi.routes.websocket import WebSocketCodec
+from tests.apps.framing import FramingController, Tick
+
+
+def test_json_codec_sends_binary_frames(app: FastAPI) -> None:
+    with TestClient(app) as client:
+        with client.websocket_connect("/framing/json") as socket:
+            socket.send_text('{"symbol": "ABC", "price": "1.5"}')
+            assert orjson.loads(socket.receive_bytes()) == {
+                "symbol": "ABC",
+                "price": 1.5,
+            }
+
+
+def test_msgpack_codec_round_trip(app: FastAPI) -> None:
+    msgpack = pytest.importorskip("msgpack")
+    with TestClient(app) as client:
+        with client.websocket_connect("/framing/msgpack") as socket:
+            for price in (1.0, 2.0):
+                socket.send_bytes(msgpack.packb({"symbol": "ABC", "price": price}))
+                assert msgpack.unpackb(socket.receive_bytes()) == {
+                    "symbol": "ABC",
+                    "price": price,
+                }
+
+
+def test_messages_batched_into_one_frame(app: FastAPI) -> None:
+    with TestClient(app) as client:
+        with client.websocket_connect("/framing/batched") as socket:
+            socket.send_bytes(b"3")
+            assert orjson.loads(socket.receive_bytes()) == [
+                {"sequence": 0},
+                {"sequence": 1},
+                {"sequence": 2},
+            ]
+        with client.websocket_connect("/framing/unflushed") as socket:
+            assert orjson.loads(socket.receive_bytes()) == ["pending"]
+
+
+def test_hub_broadcast_uses_codec(app: FastAPI) -> None:
+    msgpack = pytest.importorskip("msgpack")
+    with TestClient(app) as client:
+        with client.websocket_connect("/framing/subscribe") as socket:
+            socket.send_bytes(msgpack.packb("ticks"))
+            assert msgpack.unpackb(socket.receive_bytes()) == {"subscribed": "ticks"}
+            response = client.post(
+                "/framing/broadcast/ticks", json={"symbol": "ABC", "price": 1.5}
+            )
+            assert response.json() == 1
+            assert msgpack.unpackb(socket.receive_bytes()) == {
+                "symbol": "ABC",
+                "price": 1.5,
+            }
+
+
+def test_json_codec_rejects_unknown_types() -> None:
+    with pytest.raises(TypeError):
+        JSONCodec().encode(asyncio.Event())
+
+
+def test_adapter_built_once_per_type() -> None:
+    assert get_adapter(Tick) is get_adapter(Tick)
+    assert get_adapter(list[int]) is get_adapter(list[int])
+
+
+def test_missing_codec_fails_at_registration(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delitem(CODECS, WebSocketCodec.MSGPACK, raising=False)
+    method = FramingController.echo_json
+    with pytest.raises(FastAPIError):
+        with_codec(method, method, WebSocketCodec.MSGPACK)
+
+
+async def test_batch_flushed_after_window() -> None:
+    sent: list[Message] = []
+    incoming: list[Message] = [
+        {"type": "websocket.connect"},
+        {"type": "websocket.receive", "text": '{"hello": "world"}'},
+        {"type": "websocket.disconnect", "code": 1001},
+    ]
+
+    async def receive() -> Message:
+        return incoming.pop(0)
+
+    async def send(message: Message) -> None:
+        sent.append(message)
+
+    socket = CodecWebSocket(
+        WebSocket({"type": "websocket"}, receive, send),
+        JSONCodec(),
+        batch_window=0.01,
+    )
+    await socket.accept()
+    await socket.send_message(1)
+    await socket.send_message(2)
+    await asyncio.sleep(0.05)
+    assert sent[-1] == {"type": "websocket.send", "bytes": b"[1,2]"}
+
+    assert await socket.receive_message() == {"hello": "world"}
+    with pytest.raises(WebSocketDisconnect):
+        await socket.receive_message()
+
+
+def create_broken_socket(batch_window: float) -> CodecWebSocket:
+    async def receive() -> Message:
+        return {"type": "websocket.connect"}
+
+    async def send(message: Message) -> None:
+        if message["type"] == "websocket.send":
+            raise RuntimeError("Disconnected")
+
+    return CodecWebSocket(
+        WebSocket({"type": "websocket"}, receive, send),
+        JSONCodec(),
+        batch_window=batch_window,
+    )
+
+
+async def test_background_flush_error_raised_from_next_send() -> None:
+    socket = create_broken_socket(0.01)
+    await socket.accept()
+    await socket.send_message(1)
+    await asyncio.sleep(0.05)
+    with pytest.raises(RuntimeError, match="Disconnected"):
+        await socket.send_message(2)
+    await socket.send_message(3)
+
+
+async def test_final_flush_does_not_mask_endpoint_error() -> None:
+    async def endpoint(socket: CodecWebSocket) -> None:
+        await socket.accept()
+        await socket.send_message(1)
+        raise ValueError("endpoint failed")
+
+    codec_endpoint = with_codec(endpoint, endpoint, WebSocketCodec.JSON, 60)
+    socket = create_broken_socket(60)
+    with pytest.raises(ValueError, match="endpoint failed"):
+        await codec_endpoint(socket=socket)
@@ -0,0 +1,189 @@
+import asyncio
+from typing import Any
+
+from fastapi import FastAPI, status
+from fastapi.testclient import TestClient
+from starlette.types import Message
+
+from spakky_fastapi.framing import CodecWebSocket, ICodec, JSONCodec
+from spakky_fastapi.hub import SlowConsumerPolicy, WebSocketHub
+
+
+def test_broadcast_to_subscribers(app: FastAPI) -> None:
+    with TestClient(app) as client:
+        with (
+            client.websocket_connect("/hub/ws") as news,
+            client.websocket_connect("/hub/ws") as sports,
+        ):
+            news.send_text("news")
+            assert news.receive_json() == {"subscribed": "news"}
+            sports.send_text("sports")
+            assert sports.receive_json() == {"subscribed": "sports"}
+
+            assert (
+                client.post("/hub/broadcast/news", json={"title": "hello"}).json() == 1
+            )
+            assert news.receive_json() == {"title": "hello"}
+            sports.send_text("news")
+            assert sports.receive_json() == {"subscribed": "news"}
+            assert (
+                client.post("/hub/broadcast/news", json={"title": "again"}).json() == 2
+            )
+            assert news.receive_json() == {"title": "again"}
+            assert sports.receive_json() == {"title": "again"}
+        assert client.post("/hub/broadcast/news", json={}).json() == 0
+
+
+class StalledSocket:
+    sent: list[Message]
+    closed_with: int | None
+    release: asyncio.Event
+
+    def __init__(self) -> None:
+        self.sent = []
+        self.closed_with = None
+        self.release = asyncio.Event()
+
+    async def send(self, message: Message) -> None:
+        await self.release.wait()
+        self.sent.append(message)
+
+    async def close(self, code: int) -> None:
+        self.closed_with = code
+
+
+class BrokenSocket:
+    closed_with: int | None = None
+
+    async def send(self, message: Message) -> None:
+        raise RuntimeError("Disconnected")
+
+    async def close(self, code: int) -> None:
+        self.closed_with = code
+
+
+class CodecSocket(CodecWebSocket):
+    sent: list[Message]
+    __codec: ICodec
+
+    def __init__(self, codec: ICodec) -> None:  # pylint: disable=super-init-not-called
+        self.sent = []
+        self.__codec = codec
+
+    @property
+    def codec(self) -> ICodec:
+        return self.__codec
+
+    async def send(self, message: Message) -> None:
+        self.sent.append(message)
+
+    async def close(self, code: int = 1000, reason: str | None = None) -> None:
+        pass
+
+
+async def test_message_serialized_once_and_shared() -> None:
+    hub = WebSocketHub()
+    sockets: list[StalledSocket] = [StalledSocket() for _ in range(3)]
+    for socket in sockets:
+        socket.release.set()
+    connections = [hub.connect(socket) for socket in sockets]  # type: ignore
+    for connection in connections:
+        await connection.__aenter__()
+        connection.subscribe("topic")
+
+    assert hub.broadcast("topic", {"hello": "world"}) == 3
+    assert hub.broadcast("topic", b"binary") == 3
+    await asyncio.sleep(0.01)
+    first: list[Any] = [socket.sent[0] for socket in sockets]
+    assert first[0] == {"type": "websocket.send", "text": '{"hello":"world"}'}
+    assert all(message is first[0] for message in first)
+    assert sockets[0].sent[1] == {"type": "websocket.send", "bytes": b"binary"}
+    for connection in connections:
+        await connection.__aexit__(None, None, None)
+    assert hub.subscribers("topic") == 0
+
+
+async def test_message_serialized_once_per_codec_instance() -> None:
+    class PrefixCodec(JSONCodec):
+        prefix: str
+
+        def __init__(self, prefix: str) -> None:
+            self.prefix = prefix
+
+        def encode(self, obj: Any) -> Message:
+            return super().encode(f"{self.prefix}{obj}")
+
+    hub = WebSocketHub()
+    shared, other = PrefixCodec("a:"), PrefixCodec("b:")
+    sockets = [CodecSocket(shared), CodecSocket(other), CodecSocket(shared)]
+    connections = [hub.connect(socket) for socket in sockets]
+    for connection in connections:
+        await connection.__aenter__()
+        connection.subscribe("topic")
+    assert hub.broadcast("topic", "hello") == 3
+    await asyncio.sleep(0.01)
+    assert [socket.sent[0]["bytes"] for socket in sockets] == [
+        b'"a:hello"',
+        b'"b:hello"',
+        b'"a:hello"',
+    ]
+    assert sockets[0].sent[0] is sockets[2].sent[0]
+    for connection in connections:
+        await connection.__aexit__(None, None, None)
+
+
+async def test_slow_consumer_drops_oldest() -> None:
+    hub = WebSocketHub()
+    socket = StalledSocket()
+    async with hub.connect(socket, max_queue_size=2) as connection:  # type: ignore
+        connection.subscribe("topic")
+        for i in range(5):
+            assert hub.broadcast("topic", str(i)) == 1
+        await asyncio.sleep(0.01)
+        socket.release.set()
+        await asyncio.sleep(0.01)
+    assert [message["text"] for message in socket.sent] == ["3", "4"]
+
+
+async def test_slow_consumer_disconnected() -> None:
+    hub = WebSocketHub()
+    slow, fast = StalledSocket(), StalledSocket()
+    fast.release.set()
+    slow_connection = hub.connect(
+        slow,  # type: ignore
+        max_queue_size=1,
+        policy=SlowConsumerPolicy.DISCONNECT,
+    )
+    async with slow_connection, hub.connect(fast) as fast_connection:  # type: ignore
+        slow_connection.subscribe("topic")
+        fast_connection.subscribe("topic")
+        assert hub.broadcast("topic", "first") == 2
+        await asyncio.sleep(0.01)
+        assert hub.broadcast("topic", "second") == 2
+        assert hub.broadcast("topic", "third") == 1
+        assert slow_connection.closed
+        assert not slow_connection.send("ignored")
+        assert hub.subscribers("topic") == 1
+        slow.release.set()
+        await asyncio.sleep(0.01)
+        assert slow.closed_with == status.WS_1008_POLICY_VIOLATION
+        slow_connection.subscribe("topic")
+        assert hub.subscribers("topic") == 1
+        assert [message["text"] for message in fast.sent] == [
+            "first",
+            "second",
+            "third",
+        ]
+
+
+async def test_broken_connection_forgotten() -> None:
+    hub = WebSocketHub()
+    async with hub.connect(BrokenSocket()) as connection:  # type: ignore
+        connection.subscribe("topic")
+        connection.send("hello")
+        await asyncio.sleep(0.01)
+        assert connection.closed
+        assert connection.queued == 0
+        assert connection.socket.closed_with == status.WS_1011_INTERNAL_ERROR
+        assert hub.subscribers("topic") == 0
+        connection.unsubscribe("topic")
@@ -0,0 +1,121 @@
+import asyncio
+
+import pytest
+
+from fastapi import FastAPI, Request, status
+from fastapi.testclient import TestClient
+from httpx import ASGITransport, AsyncClient
+
+from spakky_fastapi.limiting import ConcurrencyLimiter, RateLimit, RateLimiter
+
+
+def test_controller_rate_limit_applies_to_routes(app: FastAPI) -> None:
+    with TestClient(app) as client:
+        assert client.get("/limiting/default").status_code == status.HTTP_200_OK
+        assert client.get("/limiting/default").status_code == status.HTTP_200_OK
+        response = client.get("/limiting/default")
+        assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+        assert response.headers["Retry-After"] == "10"
+        assert response.json()["message"] == "Too Many Requests"
+
+
+def test_route_opts_out_of_controller_rate_limit(app: FastAPI) -> None:
+    with TestClient(app) as client:
+        for _ in range(5):
+            assert client.get("/limiting/unlimited").status_code == 200
+
+
+def test_rate_limit_keyed_by_header(app: FastAPI) -> None:
+    with TestClient(app) as client:
+        first = {"X-Api-Key": "first"}
+        second = {"X-Api-Key": "second"}
+        assert client.get("/limiting/per-key", headers=first).status_code == 200
+        assert client.get("/limiting/per-key", headers=first).status_code == 429
+        assert client.get("/limiting/per-key", headers=second).status_code == 200
+
+
+async def test_concurrency_limit_rejects_excess_requests(app: FastAPI) -> None:
+    async with AsyncClient(
+        transport=ASGITransport(app=app),
+        base_url="http://test",
+    ) as client:
+        responses = await asyncio.gather(
+            *(client.get("/limiting/slow") for _ in range(5))
+        )
+        statuses = sorted(response.status_code for response in responses)
+        assert statuses == [200, 200, 503, 503, 503]
+        rejected = next(x for x in responses if x.status_code == 503)
+        assert rejected.headers["Retry-After"] == "1"
+        assert (await client.get("/limiting/slow")).status_code == 200
+
+
+async def test_route_opts_out_of_controller_concurrency_limit(app: FastAPI) -> None:
+    async with AsyncClient(
+        transport=ASGITransport(app=app),
+        base_url="http://test",
+    ) as client:
+        responses = await asyncio.gather(
+            *(client.get("/concurrency/unlimited") for _ in range(3))
+        )
+        assert [response.status_code for response in responses] == [200, 200, 200]
+
+
+async def test_concurrency_slot_held_until_stream_finishes(app: FastAPI) -> None:
+    async with AsyncClient(
+        transport=ASGITransport(app=app),
+        base_url="http://test",
+    ) as client:
+        responses = await asyncio.gather(
+            *(client.get("/concurrency/stream") for _ in range(2))
+        )
+        statuses = sorted(response.status_code for response in responses)
+        assert statuses == [200, 503]
+        assert (await client.get("/concurrency/stream")).text == "0\n1\n"
+
+
+def test_invalid_limits_rejected() -> None:
+    with pytest.raises(ValueError):
+        RateLimit(rate=0)
+    with pytest.raises(ValueError):
+        RateLimit(rate=1, burst=0)
+    with pytest.raises(ValueError):
+        ConcurrencyLimiter(0)
+
+
+def test_tokens_refill_over_time(monkeypatch: pytest.MonkeyPatch) -> None:
+    now: float = 100.0
+    monkeypatch.setattr("spakky_fastapi.limiting.monotonic", lambda: now)
+    limiter = RateLimiter(RateLimit(rate=2, burst=2))
+    assert limiter.acquire("client") == 0
+    assert limiter.acquire("client") == 0
+    assert limiter.acquire("client") == 0.5
+    now += 0.25
+    assert limiter.acquire("client") == 0.25
+    now += 0.25
+    assert limiter.acquire("client") == 0
+    now += 10
+    assert limiter.acquire("client") == 0
+    assert limiter.acquire("client") == 0
+    assert limiter.acquire("client") > 0
+
+
+def test_least_recent_keys_evicted() -> None:
+    limiter = RateLimiter(RateLimit(rate=1, max_keys=2))
+    for key in ("a", "b", "c"):
+        assert limiter.acquire(key) == 0
+    assert len(limiter) == 2
+    # "a" was evicted, so it starts again with a full bucket.
+    assert limiter.acquire("a") == 0
+    assert limiter.acquire("c") > 0
+
+
+def test_keys() -> None:
+    def request(headers: list[tuple[bytes, bytes]], client: object) -> Request:
+        return Request({"type": "http", "headers": headers, "client": client})
+
+    assert RateLimiter(RateLimit(rate=1)).get_key(request([], ("1.2.3.4", 1))) == (
+        "1.2.3.4"
+    )
+    assert RateLimiter(RateLimit(rate=1)).get_key(request([], None)) is None
+    limiter = RateLimiter(RateLimit(rate=1, key=lambda x: x.headers.get("user")))
+    assert limiter.get_key(request([(b"user", b"john")], None)) == "john"
@@ -0,0 +1,114 @@
+import asyncio
+import time
+from typing import Any, Generator
+
+import pytest
+from fastapi import FastAPI, status
+from httpx import ASGITransport, AsyncClient
+from starlette.routing import Route, Router
+from starlette.types import Message, Receive, Scope, Send
+
+from spakky_fastapi.lag import EventLoopLagMonitor
+from spakky_fastapi.middlewares.load_shedding import LoadSheddingMiddleware
+from spakky_fastapi.settings import SpakkyFastAPISettings
+
+
+@pytest.fixture(name="settings", scope="function")
+def get_settings_fixture() -> Generator[SpakkyFastAPISettings, Any, None]:
+    settings: SpakkyFastAPISettings = SpakkyFastAPISettings(
+        metrics_path="/metrics",
+        load_shedding_max_in_flight=2,
+        batch_path="/batch",
+    )
+    yield settings
+
+
+async def test_batch_sub_requests_admitted_one_by_one(app: FastAPI) -> None:
+    async with AsyncClient(
+        transport=ASGITransport(app=app),
+        base_url="http://test",
+    ) as client:
+        # The envelope takes one slot and the first sub-request the other.
+        response = await client.post(
+            "/batch",
+            json=[
+                {"path": "/shedding/slow"},
+                {"path": "/shedding/slow"},
+                {"path": "/shedding/health"},
+            ],
+        )
+        results = response.json()
+        assert [x["status"] for x in results] == [200, 503, 200]
+        assert results[1]["headers"]["retry-after"] == "1"
+
+
+async def test_non_critical_routes_shed_while_saturated(app: FastAPI) -> None:
+    async with AsyncClient(
+        transport=ASGITransport(app=app),
+        base_url="http://test",
+    ) as client:
+        slow = [asyncio.create_task(client.get("/shedding/slow")) for _ in range(2)]
+        await asyncio.sleep(0.05)
+        rejected = await client.get("/shedding/slow")
+        health = await client.get("/shedding/health")
+        unknown = await client.get("/shedding/missing")
+        assert [x.status_code for x in await asyncio.gather(*slow)] == [200, 200]
+        assert rejected.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+        assert rejected.headers["Retry-After"] == "1"
+        assert health.status_code == status.HTTP_200_OK
+        assert unknown.status_code == status.HTTP_404_NOT_FOUND
+        assert (await client.get("/shedding/slow")).status_code == 200
+        metrics = (await client.get("/metrics")).text
+        assert 'route="/shedding/slow",name="Get Slow",status="5xx"} 1' in metrics
+
+
+class LaggingMonitor(EventLoopLagMonitor):
+    @property
+    def lag(self) -> float:
+        return 1.0
+
+
+async def test_requests_shed_while_loop_lags() -> None:
+    called: list[str] = []
+
+    async def app(scope: Scope, receive: Receive, send: Send) -> None:
+        called.append(scope["path"])
+
+    sent: list[Message] = []
+
+    async def send(message: Message) -> None:
+        sent.append(message)
+
+    async def receive() -> Message:
+        return {"type": "http.request", "body": b""}
+
+    scope: dict[str, Any] = {
+        "type": "http",
+        "method": "GET",
+        "path": "/",
+        "headers": [],
+    }
+    router = Router([Route("/", app)])
+    await LoadSheddingMiddleware(app, router, LaggingMonitor(), max_lag=0.5)(
+        scope, receive, send
+    )
+    assert sent[0]["status"] == status.HTTP_503_SERVICE_UNAVAILABLE
+    await LoadSheddingMiddleware(app, router, LaggingMonitor(), max_lag=2.0)(
+        scope, receive, send
+    )
+    assert called == ["/"]
+
+
+async def test_monitor_measures_blocked_loop() -> None:
+    monitor = EventLoopLagMonitor()
+    monitor.set_interval(0.01)
+    monitor.ensure_started()
+    monitor.ensure_started()
+    time.sleep(0.2)
+    for _ in range(10):
+        await asyncio.sleep(0)
+        if monitor.lag:
+            break
+    assert monitor.lag >= 0.15
+    await asyncio.sleep(0.05)
+    assert monitor.lag < 0.15
@@ -0,0 +1,94 @@
+from typing import Any, Generator
+
+import pytest
+from fastapi import FastAPI
+from fastapi.routing import APIRoute
+from fastapi.testclient import TestClient
+
+from spakky_fastapi.metrics import METRICS_MEDIA_TYPE, MetricsRegistry
+from spakky_fastapi.settings import SpakkyFastAPISettings
+
+
+@pytest.fixture(name="settings", scope="function")
+def get_settings_fixture() -> Generator[SpakkyFastAPISettings, Any, None]:
+    settings: SpakkyFastAPISettings = SpakkyFastAPISettings(
+        metrics_path="/metrics",
+        metrics_buckets=(0.1, 1.0),
+    )
+    yield settings
+
+
+def test_metrics_recorded_per_route(app: FastAPI) -> None:
+    with TestClient(app) as client:
+        for _ in range(3):
+            client.get("/dummy")
+        client.get("/dummy/verify-email", params={"email": "invalid"})
+        client.get("/dummy/error")
+        client.get("/not-found")
+        client.request("BREW", "/not-found")
+
+        response = client.get("/metrics")
+        assert response.status_code == 200
+        assert response.headers["content-type"] == METRICS_MEDIA_TYPE
+        lines: list[str] = response.text.splitlines()
+
+    dummy = 'method="GET",route="/dummy",name="Get Dummy"'
+    assert "spakky_http_requests_in_flight 0" in lines
+    assert f'spakky_http_requests_total{{{dummy},status="2xx"}} 3' in lines
+    assert (
+        f'spakky_http_request_duration_seconds_bucket{{{dummy},le="+Inf"}} 3' in lines
+    )
+    assert f"spakky_http_request_duration_seconds_count{{{dummy}}} 3" in lines
+    assert (
+        'spakky_http_requests_total{method="GET",route="/dummy/verify-email",'
+        'name="Verify Email",status="4xx"} 1'
+    ) in lines
+    assert (
+        'spakky_http_requests_total{method="GET",route="/dummy/error",'
+        'name="Raise Error",status="5xx"} 1'
+    ) in lines
+    assert (
+        'spakky_http_requests_total{method="<unmatched>",route="<unmatched>",'
+        'name="<unmatched>",status="4xx"} 2'
+    ) in lines
+    assert not any('route="/metrics"' in line for line in lines)
+
+
+def test_websocket_not_recorded(app: FastAPI) -> None:
+    with TestClient(app) as client:
+        with client.websocket_connect("/dummy/ws") as socket:
+            socket.send_text("Hello World!")
+            assert socket.receive_text() == "Hello World!"
+        assert not any(
+            line.startswith("spakky_http_") and "/dummy/ws" in line
+            for line in client.get("/metrics").text.splitlines()
+        )
+
+
+def test_histogram_buckets_are_cumulative() -> None:
+    route = APIRoute('/say/"{name}"', lambda: None, name="say\nhello")
+    registry = MetricsRegistry()
+    registry.set_buckets((1.0, 0.1))
+    for seconds in (0.05, 0.5, 0.5, 5.0):
+        registry.start()
+        assert registry.in_flight == 1
+        registry.observe("GET", route, 200, seconds)
+    for status_code in (99, 999, 1000):
+        registry.start()
+        registry.observe("GET", route, status_code, 0.05)
+
+    labels = 'method="GET",route="/say/\\"{name}\\"",name="say\\nhello"'
+    lines: list[str] = registry.render().splitlines()
+    assert (
+        f'spakky_http_request_duration_seconds_bucket{{{labels},le="0.1"}} 4' in lines
+    )
+    assert (
+        f'spakky_http_request_duration_seconds_bucket{{{labels},le="1.0"}} 6' in lines
+    )
+    assert (
+        f'spakky_http_request_duration_seconds_bucket{{{labels},le="+Inf"}} 7' in lines
+    )
+    assert f'spakky_http_requests_total{{{labels},status="other"}} 3' in lines
+
+    registry.clear()
+    assert "spakky_http_request_duration_seconds_count" not in registry.render()
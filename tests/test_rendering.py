@@ -0,0 +1,82 @@
+from http import HTTPStatus
+from typing import Any, Generator
+
+import pytest
+from fastapi import FastAPI, Response
+from fastapi.responses import JSONResponse, ORJSONResponse
+from fastapi.routing import APIRoute
+from fastapi.testclient import TestClient
+
+from spakky_fastapi.error import InternalServerError
+from spakky_fastapi.settings import SpakkyFastAPISettings
+
+
+@pytest.fixture(name="settings", scope="function")
+def get_settings_fixture() -> Generator[SpakkyFastAPISettings, Any, None]:
+    settings: SpakkyFastAPISettings = SpakkyFastAPISettings(
+        default_response_class=ORJSONResponse
+    )
+    yield settings
+
+
+def get_route(app: FastAPI, path: str) -> APIRoute:
+    return next(
+        route
+        for route in app.routes
+        if isinstance(route, APIRoute) and route.path == path
+    )
+
+
+def test_default_response_class_applied(app: FastAPI) -> None:
+    assert get_route(app, "/rendering/catalog").response_class is ORJSONResponse
+    assert get_route(app, "/dummy/login").response_class is ORJSONResponse
+
+
+def test_explicit_response_class_opts_out(app: FastAPI) -> None:
+    route = get_route(app, "/rendering/catalog-as-json-response")
+    assert route.response_class is JSONResponse
+    with TestClient(app) as client:
+        response = client.get("/rendering/catalog-as-json-response")
+        assert response.status_code == HTTPStatus.OK
+        assert response.json() == {"title": "Catalog", "items": []}
+
+
+async def test_model_rendered_straight_to_bytes(app: FastAPI) -> None:
+    response = await get_route(app, "/rendering/catalog").endpoint()
+    assert isinstance(response, Response)
+    assert response.media_type == ORJSONResponse.media_type
+    assert response.body.startswith(b'{"title":"Catalog","items":[{"id":0,')
+
+
+def test_model_rendered_with_response_model_options(app: FastAPI) -> None:
+    with TestClient(app) as client:
+        response = client.get("/rendering/catalog")
+        assert response.status_code == HTTPStatus.OK
+        assert response.headers["content-type"] == "application/json"
+        assert response.json()["items"][0] == {
+            "id": 0,
+            "name": "Item 0",
+            "tags": ["a", "b"],
+        }
+
+
+def test_non_model_content_validated(app: FastAPI) -> None:
+    with TestClient(app) as client:
+        response = client.get("/rendering/catalog-as-dict")
+        assert response.status_code == HTTPStatus.OK
+        assert response.json() == {"title": "Catalog", "items": []}
+
+
+def test_invalid_content_rejected(app: FastAPI) -> None:
+    with TestClient(app) as client:
+        response = client.get("/rendering/invalid-catalog")
+        assert response.status_code == InternalServerError.status_code
+
+
+def test_routes_work_with_orjson(app: FastAPI) -> None:
+    with TestClient(app) as client:
+        response = client.post("/dummy", json={"name": "John", "age": 30})
+        assert response.status_code == HTTPStatus.OK
+        assert response.json() == {"name": "John", "age": 30}
+        response = client.get("/dummy")
+        assert response.text == "Hello World!"
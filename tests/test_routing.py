@@ -1,6 +1,7 @@
 from http import HTTPStatus
 from uuid import UUID, uuid4
 
+import pytest
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
@@ -93,3 +94,9 @@ def test_when_managed_error_occurred(app: FastAPI) -> None:
         )
         assert response.status_code == BadRequest.status_code
         assert response.json()["message"] == "Invalid email"
+
+
+def test_when_error_occurred_after_response_started(app: FastAPI) -> None:
+    with TestClient(app) as client:
+        with pytest.raises(ValueError):
+            client.get(url="/dummy/error-while-streaming")
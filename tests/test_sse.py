@@ -0,0 +1,146 @@
+import asyncio
+from contextvars import ContextVar
+from typing import AsyncGenerator
+
+import pytest
+from fastapi import FastAPI
+from fastapi.exceptions import FastAPIError
+from fastapi.testclient import TestClient
+from spakky.application.application import SpakkyApplication
+from spakky.application.application_context import ApplicationContext
+from spakky.pod.annotations.pod import Pod
+
+from spakky_fastapi.main import initialize
+from spakky_fastapi.routes import sse
+from spakky_fastapi.stereotypes.api_controller import ApiController
+from spakky_fastapi.streaming import EventStreamRenderer, ServerSentEvent, encode_event
+
+
+def test_events_streamed(app: FastAPI) -> None:
+    with TestClient(app) as client:
+        response = client.get("/sse/events")
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        assert response.headers["cache-control"] == "no-cache"
+        assert response.text == (
+            "retry: 3000\n\n"
+            'id: 0\nevent: tick\ndata: {"n":0}\n\n'
+            'id: 1\nevent: tick\ndata: {"n":1}\n\n'
+            'id: 2\nevent: tick\ndata: {"n":2}\n\n'
+            "data: multi\ndata: line\n\n"
+        )
+
+
+def test_events_resumed_from_last_event_id(app: FastAPI) -> None:
+    with TestClient(app) as client:
+        response = client.get("/sse/events", headers={"Last-Event-ID": "1"})
+        assert response.text == (
+            "retry: 3000\n\n"
+            'id: 2\nevent: tick\ndata: {"n":2}\n\n'
+            "data: multi\ndata: line\n\n"
+        )
+
+
+def test_heartbeat_sent_while_quiet(app: FastAPI) -> None:
+    with TestClient(app) as client:
+        response = client.get("/sse/quiet")
+        assert response.text.startswith(": heartbeat\n\n: heartbeat\n\n")
+        assert response.text.endswith("data: done\n\n")
+
+
+def test_encode_event() -> None:
+    assert encode_event(ServerSentEvent(data="", id="a\nb", retry=10)) == (
+        b"id: ab\nretry: 10\ndata: \n\n"
+    )
+    assert encode_event([1, 2]) == b"data: [1,2]\n\n"
+
+
+async def test_pending_item_cancelled_when_stream_closed() -> None:
+    closed = asyncio.Event()
+
+    async def items() -> AsyncGenerator[str, None]:
+        try:
+            await asyncio.Event().wait()
+            yield "never"
+        finally:
+            closed.set()
+
+    response = EventStreamRenderer(heartbeat=0.01).render(items())
+    body = response.body_iterator
+    assert await body.__anext__() == b": heartbeat\n\n"
+    await body.aclose()
+    assert closed.is_set()
+
+
+async def test_outer_cancellation_not_swallowed_while_closing() -> None:
+    closing = asyncio.Event()
+    closed = asyncio.Event()
+
+    async def items() -> AsyncGenerator[str, None]:
+        try:
+            await asyncio.Event().wait()
+            yield "never"
+        finally:
+            closing.set()
+            await asyncio.sleep(0.05)
+            closed.set()
+
+    response = EventStreamRenderer(heartbeat=10).render(items())
+    consumer = asyncio.ensure_future(response.body_iterator.__anext__())
+    await asyncio.sleep(0.01)
+    consumer.cancel()
+    await closing.wait()
+    consumer.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await consumer
+    await asyncio.wait_for(closed.wait(), 1)
+
+
+async def test_generator_driven_by_one_task() -> None:
+    variable: ContextVar[str] = ContextVar("variable", default="unset")
+
+    async def items() -> AsyncGenerator[str, None]:
+        task = asyncio.current_task()
+        variable.set("set")
+        async with asyncio.timeout(10):
+            yield "first"
+            await asyncio.sleep(0.05)
+            yield variable.get()
+        assert asyncio.current_task() is task
+
+    response = EventStreamRenderer(heartbeat=0.01).render(items())
+    chunks = [chunk async for chunk in response.body_iterator]
+    assert chunks[0] == b"data: first\n\n"
+    assert b": heartbeat\n\n" in chunks
+    assert chunks[-1] == b"data: set\n\n"
+
+
+async def test_generator_error_raised_from_stream() -> None:
+    async def items() -> AsyncGenerator[str, None]:
+        yield "first"
+        raise ValueError
+
+    response = EventStreamRenderer(heartbeat=0.01).render(items())
+    body = response.body_iterator
+    assert await body.__anext__() == b"data: first\n\n"
+    with pytest.raises(ValueError):
+        await body.__anext__()
+
+
+def test_sse_requires_async_generator() -> None:
+    @ApiController("/invalid")
+    class InvalidController:
+        @sse("/events")
+        async def get_events(self) -> str:
+            return "not a generator"
+
+    @Pod(name="api")
+    def get_api() -> FastAPI:
+        return FastAPI()
+
+    application = (
+        SpakkyApplication(ApplicationContext()).add(InvalidController).add(get_api)
+    )
+    initialize(application)
+    with pytest.raises(FastAPIError):
+        application.start()
@@ -0,0 +1,52 @@
+import asyncio
+import time
+from typing import Any, Generator
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from spakky_fastapi.settings import SpakkyFastAPISettings
+from spakky_fastapi.stalls import StallDetector
+
+
+@pytest.fixture(name="settings", scope="function")
+def get_settings_fixture() -> Generator[SpakkyFastAPISettings, Any, None]:
+    settings: SpakkyFastAPISettings = SpakkyFastAPISettings(stall_threshold=0.1)
+    yield settings
+
+
+def test_blocking_handler_reported(app: FastAPI) -> None:
+    with TestClient(app) as client:
+        assert client.get("/stalls/reports").json() == []
+        assert client.get("/stalls/blocking").json() == "done"
+        reports: list[dict[str, Any]] = []
+        for _ in range(100):
+            reports = client.get("/stalls/reports").json()
+            if reports:
+                break
+            time.sleep(0.02)
+        assert len(reports) == 1
+        assert reports[0]["handler"] == "StallsController.get_blocking"
+        assert reports[0]["duration"] >= 0.2
+        assert "in read_report" in reports[0]["stack"]
+        assert "time.sleep(0.3)" in reports[0]["stack"]
+
+
+async def test_stall_outside_handler_is_unattributed() -> None:
+    detector = StallDetector()
+    detector.set_threshold(0.05)
+    detector.ensure_started()
+    detector.ensure_started()
+    await asyncio.sleep(0.05)
+    time.sleep(0.2)
+    for _ in range(50):
+        await asyncio.sleep(0.01)
+        if detector.reports:
+            break
+    detector.stop()
+    assert len(detector.reports) == 1
+    assert detector.reports[0].handler is None
+    assert "test_stall_outside_handler_is_unattributed" in "".join(
+        detector.reports[0].stack
+    )
@@ -0,0 +1,133 @@
+import asyncio
+import json
+from typing import AsyncGenerator
+
+import pytest
+from fastapi import FastAPI
+from fastapi.exceptions import FastAPIError
+from fastapi.testclient import TestClient
+from spakky.application.application import SpakkyApplication
+from spakky.application.application_context import ApplicationContext
+from spakky.pod.annotations.pod import Pod
+from starlette.types import Message
+
+from spakky_fastapi.main import initialize
+from spakky_fastapi.routes import get
+from spakky_fastapi.routes.route import ExecutionMode
+from spakky_fastapi.stereotypes.api_controller import ApiController
+
+
+def test_async_generator_streamed_as_ndjson(app: FastAPI) -> None:
+    with TestClient(app) as client:
+        response = client.get("/streaming/rows")
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        assert [json.loads(line) for line in response.text.splitlines()] == [
+            {"id": 0, "name": "row-0"},
+            {"id": 1, "name": "row-1"},
+            {"id": 2, "name": "row-2"},
+        ]
+        assert client.get("/streaming/closed").json() == 1
+
+
+def test_async_generator_streamed_as_json_array(app: FastAPI) -> None:
+    with TestClient(app) as client:
+        response = client.get("/streaming/rows-as-array")
+        assert response.headers["content-type"] == "application/json"
+        assert response.json() == [
+            {"id": 0},
+            {"id": 1, "name": "row-1"},
+            {"id": 2},
+        ]
+        assert client.get("/streaming/rows-as-array?count=0").json() == []
+
+
+def test_stream_items_filtered_by_response_model_options(app: FastAPI) -> None:
+    with TestClient(app) as client:
+        assert client.get("/streaming/labels").json() == {"name": "row-0"}
+        assert client.get("/streaming/ids").json() == {"id": 0}
+
+
+def test_untyped_async_generator_streamed(app: FastAPI) -> None:
+    with TestClient(app) as client:
+        response = client.get("/streaming/untyped")
+        assert response.status_code == 206
+        assert response.text == '{"hello":"world"}\n[1,2,3]\n'
+
+
+def test_stream_documented_in_openapi(app: FastAPI) -> None:
+    paths = app.openapi()["paths"]
+    rows = paths["/streaming/rows"]["get"]["responses"]["200"]["content"]
+    assert rows == {
+        "application/x-ndjson": {"schema": {"$ref": "#/components/schemas/Row"}}
+    }
+    array = paths["/streaming/rows-as-array"]["get"]["responses"]["200"]["content"]
+    assert array["application/json"]["schema"]["type"] == "array"
+    assert array["application/json"]["schema"]["items"] == {
+        "$ref": "#/components/schemas/Row"
+    }
+    untyped = paths["/streaming/untyped"]["get"]["responses"]["206"]["content"]
+    assert list(untyped) == ["application/x-ndjson"]
+
+
+async def test_generator_closed_when_client_disconnects(app: FastAPI) -> None:
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/streaming/rows",
+        "raw_path": b"/streaming/rows",
+        "root_path": "",
+        "query_string": b"count=1000000",
+        "headers": [(b"host", b"localhost")],
+        "client": ("127.0.0.1", 12345),
+        "server": ("localhost", 80),
+    }
+    disconnected = asyncio.Event()
+    received: bool = False
+    chunks: int = 0
+
+    async def receive() -> Message:
+        nonlocal received
+        if not received:
+            received = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await disconnected.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message: Message) -> None:
+        nonlocal chunks
+        if message["type"] == "http.response.body":
+            chunks += 1
+            if chunks == 10:
+                disconnected.set()
+            await asyncio.sleep(0)
+
+    await asyncio.wait_for(app(scope, receive, send), timeout=10)
+    assert chunks < 1000000
+
+    with TestClient(app) as client:
+        assert client.get("/streaming/closed").json() == 1
+
+
+def test_stream_in_worker_fails_at_startup() -> None:
+    @ApiController("/invalid-streaming")
+    class InvalidStreamingController:
+        @get("/rows", execution=ExecutionMode.THREAD)
+        async def get_rows(self) -> AsyncGenerator[int, None]:
+            yield 1
+
+    @Pod(name="api")
+    def get_api() -> FastAPI:
+        return FastAPI()
+
+    application = (
+        SpakkyApplication(ApplicationContext())
+        .add(InvalidStreamingController)
+        .add(get_api)
+    )
+    initialize(application)
+    with pytest.raises(FastAPIError):
+        application.start()
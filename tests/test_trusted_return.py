@@ -0,0 +1,95 @@
+import warnings
+from http import HTTPStatus
+
+import pytest
+from fastapi import FastAPI, Response
+from fastapi.exceptions import ResponseValidationError
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute
+from fastapi.testclient import TestClient
+
+from spakky_fastapi.rendering import ResponseRenderer
+from spakky_fastapi.routes.route import Route
+from tests.apps.rendering import Item
+
+
+def get_route(app: FastAPI, path: str) -> APIRoute:
+    return next(
+        route
+        for route in app.routes
+        if isinstance(route, APIRoute) and route.path == path
+    )
+
+
+def test_trusted_renderer_skips_validation() -> None:
+    route = Route(path="", response_model=list[Item])
+    items = [Item(id=i, name="Item", tags=[]) for i in range(2)]
+    with pytest.raises(ResponseValidationError):
+        ResponseRenderer(route, JSONResponse).render([{"id": "invalid"}])
+    response = ResponseRenderer(route, JSONResponse, trusted=True).render(items)
+    assert response.body == ResponseRenderer(route, JSONResponse).render(items).body
+
+
+def test_trusted_renderer_validates_untrusted_elements() -> None:
+    route = Route(path="", response_model=list[Item])
+    items = [Item(id=1, name="Item", tags=[]), {"id": 2, "name": "Item", "tags": []}]
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        response = ResponseRenderer(route, JSONResponse, trusted=True).render(items)
+    assert response.body == (
+        b'[{"id":1,"name":"Item","tags":[],"description":null},'
+        b'{"id":2,"name":"Item","tags":[],"description":null}]'
+    )
+    with pytest.raises(ResponseValidationError):
+        ResponseRenderer(route, JSONResponse, trusted=True).render(
+            [*items, {"id": "invalid"}]
+        )
+
+
+def test_trusted_renderer_validates_other_generics() -> None:
+    route = Route(path="", response_model=dict[str, int])
+    with pytest.raises(ResponseValidationError):
+        ResponseRenderer(route, JSONResponse, trusted=True).render({"a": "invalid"})
+    route = Route(path="", response_model=tuple[Item, ...])
+    renderer = ResponseRenderer(route, JSONResponse, trusted=True)
+    assert renderer.render((Item(id=1, name="Item", tags=[]),)).status_code == 200
+    with pytest.raises(ResponseValidationError):
+        renderer.render(({"id": "invalid"},))
+
+
+def test_trusted_renderer_validates_other_types() -> None:
+    route = Route(path="", response_model=Item)
+    renderer = ResponseRenderer(route, JSONResponse, trusted=True)
+    with pytest.raises(ResponseValidationError):
+        renderer.render({"id": "invalid"})
+
+
+async def test_trusted_route_rendered_by_endpoint(app: FastAPI) -> None:
+    assert isinstance(await get_route(app, "/rendering/items").endpoint(), Response)
+    assert isinstance(
+        await get_route(app, "/trusted-rendering/catalog").endpoint(), Response
+    )
+    assert not isinstance(
+        await get_route(app, "/trusted-rendering/untrusted-catalog").endpoint(),
+        Response,
+    )
+
+
+def test_trusted_routes(app: FastAPI) -> None:
+    with TestClient(app) as client:
+        response = client.get("/rendering/items")
+        assert response.status_code == HTTPStatus.OK
+        assert response.headers["content-type"] == "application/json"
+        assert [item["id"] for item in response.json()] == [0, 1, 2]
+        response = client.get("/trusted-rendering/catalog-as-dict")
+        assert response.status_code == HTTPStatus.OK
+        assert response.json() == {"title": "Catalog", "items": []}
+
+
+def test_trusted_routes_keep_openapi_schema(app: FastAPI) -> None:
+    with TestClient(app) as client:
+        paths = client.get("/openapi.json").json()["paths"]
+        schema = paths["/rendering/items"]["get"]["responses"]["200"]["content"][
+            "application/json"
+        ]["schema"]
+        assert schema["items"] == {"$ref": "#/components/schemas/Item"}
@@ -0,0 +1,81 @@
+from http import HTTPStatus
+
+from fastapi import FastAPI
+from fastapi.routing import APIRoute
+from fastapi.testclient import TestClient
+
+from spakky_fastapi.routing import SpakkyAPIRoute
+from tests.apps.validation import CustomRoute
+
+
+def test_valid_body(app: FastAPI) -> None:
+    with TestClient(app) as client:
+        response = client.post("/validation", json={"name": "John", "age": 30})
+        assert response.status_code == HTTPStatus.OK
+        assert response.json() == {"name": "John", "age": 30}
+
+
+def test_invalid_body(app: FastAPI) -> None:
+    with TestClient(app) as client:
+        response = client.post("/validation", json={"name": "John", "age": "old"})
+        assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
+        (error,) = response.json()["detail"]
+        assert error["type"] == "int_parsing"
+        assert error["loc"] == ["body", "age"]
+
+
+def test_malformed_json_body(app: FastAPI) -> None:
+    with TestClient(app) as client:
+        response = client.post(
+            "/validation",
+            content=b'{"name": ',
+            headers={"content-type": "application/json"},
+        )
+        assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
+        (error,) = response.json()["detail"]
+        assert error["type"] == "json_invalid"
+        assert error["loc"][0] == "body"
+
+
+def test_empty_body(app: FastAPI) -> None:
+    with TestClient(app) as client:
+        response = client.post("/validation")
+        assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
+        (error,) = response.json()["detail"]
+        assert error["type"] == "missing"
+
+
+def test_non_json_body(app: FastAPI) -> None:
+    with TestClient(app) as client:
+        response = client.post(
+            "/validation",
+            content=b"name=John",
+            headers={"content-type": "text/plain"},
+        )
+        assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
+
+
+def test_composed_with_route_class_override(app: FastAPI) -> None:
+    route = next(
+        route
+        for route in app.routes
+        if isinstance(route, APIRoute)
+        and route.path == "/validation"
+        and "PUT" in route.methods
+    )
+    assert isinstance(route, SpakkyAPIRoute)
+    assert isinstance(route, CustomRoute)
+    with TestClient(app) as client:
+        response = client.put("/validation", json=[{"name": "John", "age": 30}])
+        assert response.status_code == HTTPStatus.OK
+        assert response.json() == [{"name": "John", "age": 30}]
+
+
+def test_embedded_body_falls_back(app: FastAPI) -> None:
+    with TestClient(app) as client:
+        response = client.patch(
+            "/validation",
+            json={"member": {"name": "John", "age": 30}},
+        )
+        assert response.status_code == HTTPStatus.OK
+        assert response.json() == {"name": "John", "age": 30}
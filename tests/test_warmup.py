@@ -0,0 +1,69 @@
+from typing import Any, Generator
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from spakky_fastapi.settings import SpakkyFastAPISettings, WarmUpRequest
+from spakky_fastapi.warmup import WarmUp
+
+
+@pytest.fixture(name="settings", scope="function")
+def get_settings_fixture() -> Generator[SpakkyFastAPISettings, Any, None]:
+    settings: SpakkyFastAPISettings = SpakkyFastAPISettings(
+        metrics_path="/metrics",
+        stall_threshold=0.1,
+        warm_up=True,
+        warm_up_requests=(
+            WarmUpRequest("/dummy"),
+            WarmUpRequest("/dummy/login?username=john"),
+            WarmUpRequest(
+                "/dummy",
+                method="POST",
+                body=b'{"name": "John", "age": 30}',
+                headers={"Content-Type": "application/json"},
+            ),
+            WarmUpRequest("/dummy/error"),
+            WarmUpRequest("/limiting/per-key", headers={"X-Api-Key": "warm"}),
+            WarmUpRequest("/caching/counter"),
+            WarmUpRequest("/stalls/blocking"),
+        ),
+    )
+    yield settings
+
+
+def test_application_warmed_up_on_start(
+    caplog: pytest.LogCaptureFixture,
+    app: FastAPI,
+) -> None:
+    # Built during start, so the first real request skips it.
+    assert app.middleware_stack is not None
+    assert app.openapi_schema is not None
+    messages: str = "\n".join(x.getMessage() for x in caplog.get_records("setup"))
+    assert "GET /dummy/error answered 500 during warm-up" in messages
+    assert "Warmed up" in messages
+    with TestClient(app) as client:
+        # Synthetic traffic is dropped from the metrics.
+        assert 'route="/dummy"' not in client.get("/metrics").text
+        assert client.get("/dummy").text == "Hello World!"
+
+
+def test_warm_up_leaves_no_client_state(app: FastAPI) -> None:
+    with TestClient(app) as client:
+        # Warm-up requests do not spend rate-limit tokens.
+        response = client.get("/limiting/per-key", headers={"X-Api-Key": "warm"})
+        assert response.status_code == 200
+        # The counter ran once during warm-up, but its response was not kept.
+        assert client.get("/caching/counter").text == "2"
+        assert client.get("/stalls/reports").json() == []
+
+
+async def test_warm_up_skipped_without_settings() -> None:
+    class EmptyContext:
+        def contains(self, type_: type) -> bool:
+            return False
+
+    warm_up = WarmUp()
+    warm_up.set_application_context(EmptyContext())  # type: ignore
+    await warm_up.start_async()
+    await warm_up.stop_async()